@@ -15,5 +15,19 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2023-present Jake Hattwell"
 __version__ = "0.2.0"
 
+from typing import TYPE_CHECKING, Any
 
-from antelopy.cache.abicache import AbiCache
+if TYPE_CHECKING:
+    from antelopy.cache.abicache import AbiCache
+
+__all__ = ["AbiCache"]
+
+
+def __getattr__(name: str) -> Any:
+    # AbiCache pulls in pydantic and the serializers, so it's only imported
+    # when first accessed
+    if name == "AbiCache":
+        from antelopy.cache.abicache import AbiCache
+
+        return AbiCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,18 +6,53 @@ import binascii
 import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Literal, Union
+import os
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Tuple,
+    Union,
+)
 
-from antelopy.cache.chain_interface import ChainInterface
+from antelopy.cache.disk import AbiDiskCache
+from antelopy.cache.lru import LRUCache
 from antelopy.exceptions.exceptions import (
     ABINotCachedError,
+    ABINotFoundError,
+    AccountNotFoundError,
     ActionNotFoundError,
+    ChainEndpointNotDefinedError,
     PackageNotDefinedError,
     UnsupportedPackageError,
 )
-from antelopy.types.abi import Abi
+from antelopy.types.abi import Abi, AbiAction
+from antelopy.types.abi_def import pack_abi, unpack_abi
+from antelopy.types.compact import CompactAbi, strip_ricardian
 from antelopy.types.serializables import TransactionSerializable
-from antelopy.types.transaction import PackedTransaction
+from antelopy.types.serializers import ActionSerializer, TransactionSerializer
+from antelopy.types.transaction import LazyActionData, PackedTransaction, Transaction
+from antelopy.utils.sizeof import deep_sizeof
+
+# signed in place of the context-free data hash when there is none
+_NO_CONTEXT_FREE_DATA = bytes(32)
+
+if TYPE_CHECKING:
+    # imported on first use, so requests, aiohttp, asyncio and the executors
+    # stay out of startup
+    import asyncio
+
+    from antelopy.cache.async_chain_interface import AsyncChainInterface
+    from antelopy.cache.chain_interface import ChainInterface
+    from antelopy.cache.signing import Signer, SigningStage
+    from antelopy.cache.tapos import TaposProvider
 
 
 class AbiCache:
@@ -40,18 +75,183 @@ class AbiCache:
 
     def __init__(
         self,
-        chain_endpoint: str,
+        chain_endpoint: Union[str, None] = None,
         chain_package: Union[Literal["aioeos", "eospy", "pyntelope"], None] = None,
+        chain_id: Union[str, bytes, None] = None,
+        cache_dir: Union[str, None] = None,
+        abi_ttl: Union[float, None] = None,
+        auto_load: bool = False,
+        negative_ttl: float = 60,
+        max_abis: Union[int, None] = None,
+        max_abi_bytes: Union[int, None] = None,
+        compact: bool = False,
+        signing_stage: Union["SigningStage", None] = None,
     ):
-        self.chain = ChainInterface(chain_endpoint)
+        self.chain_endpoint = chain_endpoint
+        self._chain: Union["ChainInterface", None] = None
+        self._async_chain: Union["AsyncChainInterface", None] = None
         logging.debug("[ANTELOPY] initialized with chain endpoint: %s", chain_endpoint)
-        self.chain_id = binascii.unhexlify(self.chain.get_chain_id())
-        logging.debug("[ANTELOPY] Chain ID: %s", {self.chain_id})
+        # read from chain on first use when not given
+        self._chain_id: Union[bytes, None] = None
+        # sha256 state after the chain id, cloned for every signing digest
+        self._digest_prefix: Union["hashlib._Hash", None] = None
+        if chain_id is not None:
+            self.chain_id = chain_id
         self.chain_package = chain_package
         if self.chain_package:
             logging.debug("[ANTELOPY] using chain package: %s", self.chain_package)
-        self._abi_cache: Dict[str, Abi] = {}
+        # least recently used ABIs are evicted beyond max_abis or max_abi_bytes
+        self._abi_cache = LRUCache(
+            max_entries=max_abis,
+            max_bytes=max_abi_bytes,
+            sizeof=lambda account, abi: deep_sizeof(abi, self._raw_abis.get(account)),
+            on_evict=self._forget_abi,
+        )
         self._raw_abis: Dict[str, dict] = {}
+        # keep CompactAbi objects only, without raw dicts or ricardian text
+        self.compact = compact
+        # ABI cache directory shared with other processes, if any
+        self.disk_cache = AbiDiskCache(cache_dir) if cache_dir else None
+        if self.disk_cache:
+            logging.debug("[ANTELOPY] using ABI cache directory: %s", cache_dir)
+        # seconds before a cached ABI is checked against chain on use, if any
+        self.abi_ttl = abi_ttl
+        self._abi_hashes: Dict[str, str] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._refresh_thread: Union[threading.Thread, None] = None
+        self._refresh_stop = threading.Event()
+        # read missing ABIs from chain on use, one fetch per account at a time
+        self.auto_load = auto_load
+        self.negative_ttl = negative_ttl
+        self._missing: Dict[str, float] = {}
+        # account name to its lock and the number of threads using it
+        self._load_locks: Dict[str, List[Any]] = {}
+        self._load_locks_guard = threading.Lock()
+        self._async_loads: Dict[str, "asyncio.Future"] = {}
+        # reference block shared by the transactions signed by this cache
+        self._tapos: Union["TaposProvider", None] = None
+        # pool for the signatures of multisig transactions, if any
+        self.signing_stage = signing_stage
+
+    @classmethod
+    async def create_async(
+        cls,
+        chain_endpoint: str,
+        chain_package: Union[Literal["aioeos", "eospy", "pyntelope"], None] = None,
+        **pool_options: Any,
+    ) -> "AbiCache":
+        """Creates an AbiCache without blocking the event loop, fetching the
+        chain id through an AsyncChainInterface that the cache then keeps for
+        `read_abi_async`. Requires aiohttp.
+
+        Args:
+            chain_endpoint (str): URL without trailing slash
+                e.g. `https://wax.greymass.com`
+            chain_package (str, optional): chain package used to sign and push
+            **pool_options: passed to AsyncChainInterface, e.g. `max_connections`
+
+        Returns:
+            AbiCache: the cache
+        """
+        from antelopy.cache.async_chain_interface import AsyncChainInterface
+
+        chain = AsyncChainInterface(chain_endpoint, **pool_options)
+        chain_id = await chain.get_chain_id()
+        cache = cls(chain_endpoint, chain_package, chain_id=chain_id)
+        cache._async_chain = chain
+        return cache
+
+    def _require_endpoint(self) -> str:
+        if not self.chain_endpoint:
+            raise ChainEndpointNotDefinedError(
+                "This AbiCache was created without a chain endpoint"
+            )
+        return self.chain_endpoint
+
+    @property
+    def chain(self) -> "ChainInterface":
+        """The chain interface, created on first use
+
+        Raises:
+            ChainEndpointNotDefinedError: Raised when the cache has no endpoint
+        """
+        if self._chain is None:
+            from antelopy.cache.chain_interface import ChainInterface
+
+            self._chain = ChainInterface(self._require_endpoint())
+        return self._chain
+
+    @property
+    def async_chain(self) -> "AsyncChainInterface":
+        """The async chain interface, created on first use. Requires aiohttp.
+
+        Raises:
+            ChainEndpointNotDefinedError: Raised when the cache has no endpoint
+        """
+        if self._async_chain is None:
+            from antelopy.cache.async_chain_interface import AsyncChainInterface
+
+            self._async_chain = AsyncChainInterface(self._require_endpoint())
+        return self._async_chain
+
+    @property
+    def tapos(self) -> "TaposProvider":
+        """The reference block provider used by `sign_and_push` and
+        `async_sign_and_push`. Those create it on first use from the RPC they
+        are given, otherwise it's created from the chain endpoint. It can be
+        replaced, e.g. to change its `max_age`, and refreshed in the
+        background with `abi_cache.tapos.start_background_refresh(interval)`.
+
+        Raises:
+            ChainEndpointNotDefinedError: Raised when the cache has no endpoint
+        """
+        if self._tapos is None:
+            from antelopy.cache.tapos import TaposProvider
+
+            self._require_endpoint()
+            self._tapos = TaposProvider(get_info=lambda: self.chain.get_info())
+        return self._tapos
+
+    @tapos.setter
+    def tapos(self, tapos: "TaposProvider") -> None:
+        self._tapos = tapos
+
+    def _tapos_for(self, rpc: Any, is_async: bool) -> "TaposProvider":
+        # asks the package's RPC, rather than opening connections of its own
+        if self._tapos is None:
+            from antelopy.cache.tapos import TaposProvider
+
+            if is_async:
+                self._tapos = TaposProvider(get_info_async=rpc.get_info)
+            else:
+                self._tapos = TaposProvider(get_info=rpc.get_info)
+        return self._tapos
+
+    @property
+    def chain_id(self) -> bytes:
+        """The chain id, read from the chain endpoint on first use if it wasn't
+        given to the cache
+
+        Raises:
+            ChainEndpointNotDefinedError: Raised when the chain id has to be read
+                but the cache has no endpoint
+        """
+        if self._chain_id is None:
+            self.chain_id = self.chain.get_chain_id()
+        return self._chain_id
+
+    @chain_id.setter
+    def chain_id(self, chain_id: Union[str, bytes]) -> None:
+        self._chain_id = (
+            binascii.unhexlify(chain_id) if isinstance(chain_id, str) else chain_id
+        )
+        self._digest_prefix = None
+        logging.debug("[ANTELOPY] Chain ID: %s", self._chain_id.hex())
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections of the async chain interface"""
+        if self._async_chain is not None:
+            await self._async_chain.close()
 
     def dump_abi(self, account_name: str, path: str) -> None:
         """Dumps a cached ABI of an account into path
@@ -72,43 +272,342 @@ class AbiCache:
         abi = self.get_cached_raw_abi(account_name)
         return json.dumps(abi)
 
-    def get_cached_abi(self, account_name: str) -> Abi:
+    def get_cached_abi(self, account_name: str) -> Union[Abi, CompactAbi]:
         """Retrieves an ABI from the cache
 
         Args:
             account_name (str): account name
         """
         abi = self._abi_cache.get(account_name)
+        if not abi and self._load_from_disk(account_name):
+            abi = self._abi_cache[account_name]
+        if not abi and self.auto_load:
+            abi = self._auto_load(account_name)
         if not abi:
             raise ABINotCachedError(
                 f"ABI {account_name} hasn't been cached yet. Use read_abi or read_abi_from_json"
             )
+        if self.abi_ttl is not None and self._is_stale(account_name):
+            self._revalidate(account_name)
+            abi = self._abi_cache[account_name]
         return abi
 
+    def _auto_load(self, account_name: str) -> Abi:
+        """Reads a missing ABI from chain. Threads missing on the same account
+        wait for a single fetch instead of each starting their own."""
+        self._check_missing(account_name)
+        with self._load_locks_guard:
+            entry = self._load_locks.setdefault(account_name, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                abi = self._abi_cache.get(account_name)
+                if abi:
+                    # loaded by the thread holding the lock before us
+                    return abi
+                self._check_missing(account_name)
+                try:
+                    self.read_abi(account_name)
+                except (ABINotFoundError, AccountNotFoundError):
+                    self._remember_missing(account_name)
+                    raise
+                return self._abi_cache[account_name]
+        finally:
+            # the lock is dropped once no thread is loading the account
+            with self._load_locks_guard:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._load_locks[account_name]
+
+    def _remember_missing(self, account_name: str) -> None:
+        now = time.monotonic()
+        # expired entries of accounts that weren't asked for again are dropped
+        for name in [n for n, expiry in self._missing.items() if expiry <= now]:
+            self._missing.pop(name, None)
+        self._missing[account_name] = now + self.negative_ttl
+
+    def _check_missing(self, account_name: str) -> None:
+        expiry = self._missing.get(account_name)
+        if expiry is None:
+            return
+        if time.monotonic() < expiry:
+            raise ABINotFoundError(
+                f"Account {account_name} had no ABI when last checked"
+            )
+        self._missing.pop(account_name, None)
+
+    async def ensure_abi_async(self, account_name: str) -> Abi:
+        """Gets an ABI from the cache, reading it from chain without blocking the
+        event loop if it's missing. Tasks missing on the same account wait for a
+        single fetch. Accounts without an ABI are remembered for `negative_ttl`
+        seconds. Requires aiohttp.
+
+        Args:
+            account_name (str): account name
+
+        Raises:
+            ABINotFoundError: the account has no ABI
+            AccountNotFoundError: the account doesn't exist
+
+        Returns:
+            Abi: the ABI
+        """
+        abi = self._abi_cache.get(account_name)
+        if abi:
+            return abi
+        import asyncio
+
+        self._check_missing(account_name)
+        load = self._async_loads.get(account_name)
+        if load is None:
+            load = asyncio.ensure_future(self._load_async(account_name))
+            self._async_loads[account_name] = load
+            load.add_done_callback(lambda _: self._async_loads.pop(account_name, None))
+        # a cancelled waiter doesn't cancel the fetch the others are waiting for
+        await asyncio.shield(load)
+        return self._abi_cache[account_name]
+
+    async def _load_async(self, account_name: str) -> None:
+        try:
+            await self.read_abi_async(account_name)
+        except (ABINotFoundError, AccountNotFoundError):
+            self._remember_missing(account_name)
+            raise
+
+    async def serialize_data_async(
+        self, contract_name: str, contract_action: str, data: Dict[str, Any]
+    ) -> bytes:
+        """Serializes action data, reading the contract's ABI from chain without
+        blocking the event loop if it isn't cached yet
+
+        Args:
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            data (Dict[str, Any]): action data
+
+        Returns:
+            bytes: the hex-encoded serialized action data
+        """
+        await self.ensure_abi_async(contract_name)
+        return self.serialize_data(contract_name, contract_action, data)
+
     def get_cached_raw_abi(self, account_name: str) -> Dict[str, Any]:
-        """Retrieves an ABI from the raw ABI cache
+        """Retrieves an ABI from the raw ABI cache. In compact mode the JSON is
+        regenerated from the cached binary form, without ricardian text.
 
         Args:
             account_name (str): account name
         """
+        if self.compact:
+            return self.get_cached_abi(account_name).to_json()
         abi = self._raw_abis.get(account_name)
+        if not abi and self._load_from_disk(account_name):
+            abi = self._raw_abis[account_name]
         if not abi:
             raise ABINotCachedError(
                 f"ABI {account_name} hasn't been cached yet. Use read_abi or read_abi_from_json"
             )
         return abi
 
-    def read_abi(self, account_name: str) -> None:
+    def read_abi(self, account_name: str, refresh: bool = False) -> None:
         """Loads an ABI of an account into memory
 
+        With a cache directory, the ABI is read from it when present. Otherwise a
+        single process fetches it from chain and stores it, while other processes
+        wait for the stored copy.
+
+        Args:
+            account_name (str): account name
+            refresh (bool, optional): fetch from chain even if the cache directory
+                has the ABI. Defaults to False.
+        """
+        if self.disk_cache is None:
+            self._store_packed(account_name, *self.chain.get_packed_abi(account_name))
+            return
+        with self.disk_cache.lock(account_name):
+            if refresh or not self._load_from_disk(account_name):
+                self._store_packed(
+                    account_name, *self.chain.get_packed_abi(account_name)
+                )
+
+    async def read_abi_async(self, account_name: str) -> None:
+        """Loads an ABI of an account into memory without blocking the event
+        loop. Many reads can run concurrently over the pooled connections of
+        `async_chain`. Requires aiohttp. With a cache directory, the ABI is read
+        from it when present.
+
         Args:
             account_name (str): account name
         """
-        raw_abi = self.chain.get_raw_abi(account_name)
-        self._raw_abis[account_name] = raw_abi
-        self._abi_cache[account_name] = Abi(name=account_name, **raw_abi)
+        if self._load_from_disk(account_name):
+            return
+        self._store_packed(
+            account_name, *await self.async_chain.get_packed_abi(account_name)
+        )
+
+    def _load_from_disk(self, account_name: str) -> bool:
+        if self.disk_cache is None:
+            return False
+        entry = self.disk_cache.load(account_name)
+        if entry is None:
+            return False
+        self._store_abi(account_name, entry[1], entry[0])
+        return True
+
+    def _store_packed(
+        self, account_name: str, hash_hex: str, packed: Union[bytes, None]
+    ) -> None:
+        # keeps the bytes and hash the chain has, as re-packing the ABI can
+        # give different bytes, e.g. with or without the binary extensions
+        if packed is None:
+            raise ABINotFoundError(f"Couldn't retrieve ABI for {account_name}")
+        if self.disk_cache:
+            self.disk_cache.store_packed(account_name, packed)
+        self._store_abi(account_name, unpack_abi(packed), hash_hex)
+
+    def _store_abi(
+        self,
+        account_name: str,
+        raw_abi: Dict[str, Any],
+        hash_hex: Union[str, None] = None,
+    ) -> None:
+        if self.compact:
+            self._abi_cache[account_name] = CompactAbi(account_name, raw_abi)
+        else:
+            self._raw_abis[account_name] = raw_abi
+            self._abi_cache[account_name] = Abi(name=account_name, **raw_abi)
+        self._missing.pop(account_name, None)
+        if hash_hex:
+            self._abi_hashes[account_name] = hash_hex
+        else:
+            self._abi_hashes.pop(account_name, None)
+        self._checked_at[account_name] = time.monotonic()
         logging.debug("[ANTELOPY] successfully imported ABI from: %s", account_name)
 
+    def _forget_abi(self, account_name: str, abi: Union[Abi, CompactAbi]) -> None:
+        self._raw_abis.pop(account_name, None)
+        self._abi_hashes.pop(account_name, None)
+        self._checked_at.pop(account_name, None)
+        logging.debug("[ANTELOPY] evicted ABI of %s from the cache", account_name)
+
+    def pin_abi(self, account_name: str) -> None:
+        """Keeps an account's ABI from being evicted when the cache is bounded.
+        Accounts can be pinned before their ABI is read.
+
+        Args:
+            account_name (str): account name
+        """
+        self._abi_cache.pin(account_name)
+
+    def unpin_abi(self, account_name: str) -> None:
+        """Allows a pinned ABI to be evicted again
+
+        Args:
+            account_name (str): account name
+        """
+        self._abi_cache.unpin(account_name)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Counters and memory estimates of the in-memory ABI cache
+
+        Returns:
+            Dict[str, Any]: `entries`, `bytes`, `max_entries`, `max_bytes`,
+                `hits`, `misses`, `evictions`, `pinned`, and `sizes`, the
+                estimated bytes used by each account's ABI
+        """
+        return self._abi_cache.stats()
+
+    def abi_hash(self, account_name: str) -> Union[str, None]:
+        """Gets the hash of an account's cached ABI, as reported by the chain
+
+        Args:
+            account_name (str): account name
+
+        Returns:
+            Union[str, None]: the hex-encoded hash, or None if the ABI isn't
+                cached or wasn't read from chain, e.g. with `read_abi_from_json`
+        """
+        return self._abi_hashes.get(account_name)
+
+    def _matches_cached(self, account_name: str, raw_abi: Dict[str, Any]) -> bool:
+        # compares content, as the JSON of an ABI doesn't give its chain hash
+        if self.compact:
+            cached = self._abi_cache.get(account_name)
+            return cached is not None and cached.packed == pack_abi(
+                strip_ricardian(raw_abi)
+            )
+        cached = self._raw_abis.get(account_name)
+        return cached is not None and pack_abi(cached) == pack_abi(raw_abi)
+
+    def refresh_if_changed(self, account_name: str) -> bool:
+        """Checks an account's ABI against chain, and only downloads and compiles
+        it again when its hash has changed, e.g. after a contract upgrade
+
+        Args:
+            account_name (str): account name
+
+        Raises:
+            AccountNotFoundError: Account not found on chain
+
+        Returns:
+            bool: whether a new ABI was loaded
+        """
+        known_hash = self.abi_hash(account_name)
+        hash_hex, packed = self.chain.get_packed_abi(account_name, known_hash)
+        self._checked_at[account_name] = time.monotonic()
+        if packed is None or hash_hex == known_hash:
+            return False
+        raw_abi = unpack_abi(packed)
+        if known_hash is None and self._matches_cached(account_name, raw_abi):
+            self._abi_hashes[account_name] = hash_hex
+            return False
+        if self.disk_cache:
+            self.disk_cache.store_packed(account_name, packed)
+        self._store_abi(account_name, raw_abi, hash_hex)
+        logging.info("[ANTELOPY] ABI of %s changed, reloaded it", account_name)
+        return True
+
+    def _is_stale(self, account_name: str) -> bool:
+        checked_at = self._checked_at.get(account_name, 0)
+        return time.monotonic() - checked_at >= self.abi_ttl
+
+    def _revalidate(self, account_name: str) -> None:
+        try:
+            self.refresh_if_changed(account_name)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # keep serving the cached ABI when the node can't be reached
+            self._checked_at[account_name] = time.monotonic()
+            logging.warning(
+                "[ANTELOPY] couldn't check ABI of %s for changes: %r", account_name, e
+            )
+
+    def start_background_refresh(self, interval: float) -> None:
+        """Starts a daemon thread that checks every cached ABI for changes
+
+        Args:
+            interval (float): seconds between checks
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_stop.clear()
+
+        def run() -> None:
+            while not self._refresh_stop.wait(interval):
+                for account_name in list(self._abi_cache):
+                    self._revalidate(account_name)
+
+        self._refresh_thread = threading.Thread(
+            target=run, name="antelopy-abi-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stops the thread started by `start_background_refresh`"""
+        self._refresh_stop.set()
+        if self._refresh_thread:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
     def read_abi_from_json(self, account_name: str, path: str) -> None:
         """Loads an ABI of an account into memory
 
@@ -117,25 +616,92 @@ class AbiCache:
         """
         with open(path, "r", encoding="utf-8") as jfp:
             abi = json.load(jfp)
-        self._raw_abis[account_name] = abi
-        self._abi_cache[account_name] = Abi(name=account_name, **abi)
-        logging.debug("[ANTELOPY] successfully imported ABI from: %s", account_name)
+        self._store_abi(account_name, abi)
 
-    def serialize_data(
-        self, contract_name: str, contract_action: str, data: Dict[str, Any]
-    ) -> bytes:
-        """Serializes an action into a hex-encoded bytestring
+    def read_abis(
+        self, accounts: Iterable[str], max_workers: int = 16
+    ) -> Dict[str, Exception]:
+        """Loads the ABIs of many accounts into memory concurrently. Fetching and
+        building each Abi happens on a thread pool sharing the chain interface's
+        pooled connections, so the batch takes about as long as the slowest
+        account instead of the sum of all of them.
+
+        Args:
+            accounts (Iterable[str]): account names
+            max_workers (int, optional): number of worker threads. Defaults to 16.
+
+        Returns:
+            Dict[str, Exception]: the error of each account that couldn't be
+                loaded. The other accounts are loaded regardless.
+        """
+        return self._load_many({account: None for account in accounts}, max_workers)
+
+    def read_abi_manifest(
+        self, path: str, max_workers: int = 16
+    ) -> Dict[str, Exception]:
+        """Loads the ABIs listed in a manifest file concurrently.
+
+        The manifest is a JSON list of account names, e.g. `["eosio.token", "atomicassets"]`,
+        or a JSON object mapping account names to ABI files, e.g.
+        `{"atomicassets": "abis/atomicassets.abi", "eosio.token": null}`. Accounts
+        mapped to null are read from chain, and relative paths are resolved from
+        the manifest's directory.
+
+        Args:
+            path (str): path of the manifest file
+            max_workers (int, optional): number of worker threads. Defaults to 16.
+
+        Returns:
+            Dict[str, Exception]: the error of each account that couldn't be
+                loaded. The other accounts are loaded regardless.
+        """
+        with open(path, "r", encoding="utf-8") as jfp:
+            manifest = json.load(jfp)
+        if isinstance(manifest, list):
+            manifest = {account: None for account in manifest}
+        base = os.path.dirname(os.path.abspath(path))
+        sources = {
+            account: os.path.join(base, abi_path) if abi_path else None
+            for account, abi_path in manifest.items()
+        }
+        return self._load_many(sources, max_workers)
+
+    def _load_many(
+        self, sources: Dict[str, Union[str, None]], max_workers: int
+    ) -> Dict[str, Exception]:
+        def load(account: str) -> None:
+            if sources[account]:
+                self.read_abi_from_json(account, sources[account])
+            else:
+                self.read_abi(account)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        failures: Dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {account: pool.submit(load, account) for account in sources}
+            for account, future in futures.items():
+                if error := future.exception():
+                    logging.warning(
+                        "[ANTELOPY] couldn't load ABI of %s: %r", account, error
+                    )
+                    failures[account] = error
+        return failures
+
+    def get_cached_action(
+        self, contract_name: str, contract_action: str
+    ) -> Tuple[Union[Abi, CompactAbi], AbiAction]:
+        """Retrieves an action and the ABI it belongs to from the cache
 
         Args:
             contract_name (str): smart contract name
             contract_action (str): smart contract action
-            data (Dict[str, Any]): action data
 
         Raises:
-            Exception: _description_
+            ActionNotFoundError: the action isn't part of the contract's ABI
 
         Returns:
-            bytes: _description_
+            Tuple[Abi, AbiAction]: the ABI and the action
         """
         abi = self.get_cached_abi(contract_name)
         action = abi.get_action(contract_action)
@@ -143,7 +709,256 @@ class AbiCache:
             raise ActionNotFoundError(
                 f"Action {contract_action} not found in ABI for {contract_name}"
             )
-        return binascii.hexlify(abi.serialize(action, data))
+        return abi, action
+
+    def serialize_action_bytes(
+        self, contract_name: str, contract_action: str, data: Dict[str, Any]
+    ) -> bytes:
+        """Serializes action data into raw bytes
+
+        Args:
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            data (Dict[str, Any]): action data
+
+        Raises:
+            ActionNotFoundError: the action isn't part of the contract's ABI
+
+        Returns:
+            bytes: the serialized action data
+        """
+        abi, action = self.get_cached_action(contract_name, contract_action)
+        return abi.serialize(action, data)
+
+    def serialize_data(
+        self, contract_name: str, contract_action: str, data: Dict[str, Any]
+    ) -> bytes:
+        """Serializes an action into a hex-encoded bytestring
+
+        Args:
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            data (Dict[str, Any]): action data
+
+        Raises:
+            ActionNotFoundError: the action isn't part of the contract's ABI
+
+        Returns:
+            bytes: the hex-encoded serialized action data
+        """
+        return binascii.hexlify(
+            self.serialize_action_bytes(contract_name, contract_action, data)
+        )
+
+    def serialize_many(
+        self,
+        contract_name: str,
+        contract_action: str,
+        data: Iterable[Dict[str, Any]],
+        raw: bool = False,
+        stream: bool = False,
+    ) -> Union[List[bytes], Iterator[bytes]]:
+        """Serializes many instances of the same action. The ABI and action are
+        only looked up once.
+
+        Args:
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            data (Iterable[Dict[str, Any]]): action data for each action
+            raw (bool, optional): return raw bytes instead of hex-encoded bytes.
+                Defaults to False.
+            stream (bool, optional): return an iterator that serializes lazily
+                instead of a list. Defaults to False.
+
+        Raises:
+            ActionNotFoundError: the action isn't part of the contract's ABI
+
+        Returns:
+            Union[List[bytes], Iterator[bytes]]: the serialized action data,
+                in the same order as `data`
+        """
+        abi, action = self.get_cached_action(contract_name, contract_action)
+        encode = abi.get_plan(action).encode
+        finish = bytes if raw else binascii.hexlify
+
+        def serialize_all() -> Iterator[bytes]:
+            for d in data:
+                buf = bytearray()
+                encode(buf, d)
+                yield finish(buf)
+
+        if stream:
+            return serialize_all()
+        return list(serialize_all())
+
+    def serialize_actions(
+        self, actions: Iterable[Dict[str, Any]], raw: bool = False
+    ) -> List[bytes]:
+        """Serializes the data of many actions, which may belong to different
+        contracts. Actions are grouped by (contract, action) so each plan is only
+        looked up once.
+
+        Args:
+            actions (Iterable[Dict[str, Any]]): actions with `account`, `name`
+                and `data` keys
+            raw (bool, optional): return raw bytes instead of hex-encoded bytes.
+                Defaults to False.
+
+        Raises:
+            ActionNotFoundError: an action isn't part of its contract's ABI
+
+        Returns:
+            List[bytes]: the serialized action data, in the same order as `actions`
+        """
+        actions = list(actions)
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for i, action in enumerate(actions):
+            groups.setdefault((action["account"], action["name"]), []).append(i)
+        serialized: List[bytes] = [b""] * len(actions)
+        for (contract_name, contract_action), indexes in groups.items():
+            group = self.serialize_many(
+                contract_name,
+                contract_action,
+                (actions[i]["data"] for i in indexes),
+                raw=raw,
+            )
+            for i, data in zip(indexes, group):
+                serialized[i] = data
+        return serialized
+
+    def serialize_columns(
+        self,
+        contract_name: str,
+        contract_action: str,
+        columns: Mapping[str, Any],
+        constants: Union[Mapping[str, Any], None] = None,
+        raw: bool = False,
+    ) -> List[bytes]:
+        """Serializes many instances of the same action from columns of field
+        values, e.g. `{"to": [...], "quantity": AssetColumn(amounts, "8,WAX")}`.
+        Fixed-width fields are packed with NumPy, so this requires NumPy.
+
+        Args:
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            columns (Mapping[str, Any]): field name to a NumPy array, sequence or
+                AssetColumn holding one value per action
+            constants (Mapping[str, Any], optional): field name to a value shared
+                by every action, e.g. a memo
+            raw (bool, optional): return raw bytes instead of hex-encoded bytes.
+                Defaults to False.
+
+        Raises:
+            ActionNotFoundError: the action isn't part of the contract's ABI
+
+        Returns:
+            List[bytes]: the serialized action data of each row
+        """
+        abi, action = self.get_cached_action(contract_name, contract_action)
+        serialized = abi.serialize_columns(action, columns, constants)
+        if raw:
+            return serialized
+        return [binascii.hexlify(s) for s in serialized]
+
+    def deserialize_data(
+        self,
+        contract_name: str,
+        contract_action: str,
+        data: Union[bytes, bytearray, memoryview, str],
+    ) -> Dict[str, Any]:
+        """Deserializes action data, such as the `hex_data` of an action trace
+
+        Args:
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            data (Union[bytes, bytearray, memoryview, str]): raw serialized
+                action data, or a hex-encoded str
+
+        Raises:
+            ActionNotFoundError: the action isn't part of the contract's ABI
+            DeserializationError: the data couldn't be deserialized
+
+        Returns:
+            Dict[str, Any]: the action data
+        """
+        if isinstance(data, str):
+            data = bytes.fromhex(data)
+        abi, action = self.get_cached_action(contract_name, contract_action)
+        return abi.deserialize(action, data)
+
+    def deserialize_columns(
+        self,
+        contract_name: str,
+        contract_action: str,
+        rows: Iterable[Union[bytes, str]],
+    ) -> Dict[str, Any]:
+        """Deserializes the data of many actions into columns of field values,
+        e.g. `{"from": [...], "asset_id": array([...], dtype=uint64)}`.
+        Requires NumPy.
+
+        Args:
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            rows (Iterable[Union[bytes, str]]): raw serialized action data, or
+                hex-encoded strs
+
+        Raises:
+            ActionNotFoundError: the action isn't part of the contract's ABI
+            DeserializationError: the data couldn't be deserialized
+
+        Returns:
+            Dict[str, Any]: field name to a NumPy array or list of values
+        """
+        rows = [bytes.fromhex(r) if isinstance(r, str) else bytes(r) for r in rows]
+        abi, action = self.get_cached_action(contract_name, contract_action)
+        return abi.deserialize_columns(action, rows)
+
+    def serialize_into(
+        self,
+        buffer: bytearray,
+        contract_name: str,
+        contract_action: str,
+        data: Dict[str, Any],
+        offset: Union[int, None] = None,
+    ) -> int:
+        """Serializes an action into a caller-provided buffer
+
+        Args:
+            buffer (bytearray): the buffer to write to
+            contract_name (str): smart contract name
+            contract_action (str): smart contract action
+            data (Dict[str, Any]): action data
+            offset (int | None): position to write at. Defaults to the end of the
+                buffer. Existing bytes from the offset onwards are overwritten.
+
+        Raises:
+            ActionNotFoundError: the action isn't part of the contract's ABI
+            ValueError: the offset is outside of the buffer
+
+        Returns:
+            int: the offset directly after the written data
+        """
+        abi, action = self.get_cached_action(contract_name, contract_action)
+        if offset is None or offset == len(buffer):
+            abi.serialize_into(buffer, action, data)
+            return len(buffer)
+        if not 0 <= offset < len(buffer):
+            raise ValueError(
+                f"Offset {offset} is outside of the buffer of {len(buffer)} bytes"
+            )
+        # encoders only append, so the bytes after the offset are set aside
+        # while the action is encoded in place, then the rest is put back
+        tail = buffer[offset:]
+        del buffer[offset:]
+        try:
+            abi.serialize_into(buffer, action, data)
+        except BaseException:
+            del buffer[offset:]
+            buffer += tail
+            raise
+        end = len(buffer)
+        buffer += tail[end - offset :]
+        return end
 
     def serialize(self, trx: Any):
         """Serializes a transaction for signing
@@ -151,40 +966,157 @@ class AbiCache:
         Args:
             trx (Transaction): The transaction to be signed. Supported packages:
                 aioeos: `EosTransaction`
+                antelopy: `Transaction`, e.g. from `deserialize_transaction`
 
         Returns:
             bytes: the serialized transaction
         """
-        if not self.chain_package:
+        if not self.chain_package and not isinstance(trx, Transaction):
             raise PackageNotDefinedError("""Antelope package hasn't been specified""")
         t = TransactionSerializable(self.chain_package, trx)
-        for action in t.transaction.actions:
-            if isinstance(action.data, dict):
-                # This {"binargs": serialized_data} structure emulates
-                # the response from the old `abi_json_to_bin` endpoint.
-                abi_bin = {
-                    "binargs": self.serialize_data(
-                        action.account, action.name, action.data
-                    )
-                }
-                action.data = self.unhexlify(abi_bin["binargs"])
-        for action in t.transaction.context_free_actions:
-            if isinstance(action.data, dict):
-                # This {"binargs": serialized_data} structure emulates
-                # the response from the old `abi_json_to_bin` endpoint.
-                abi_bin = {
-                    "binargs": self.serialize_data(
+        for actions in (t.transaction.actions, t.transaction.context_free_actions):
+            for action in actions:
+                if isinstance(action.data, dict):
+                    action.data = self.serialize_action_bytes(
                         action.account, action.name, action.data
                     )
-                }
-                action.data = self.unhexlify(abi_bin["binargs"])
         return t.serialize()
 
+    def deserialize_transaction(
+        self, packed_trx: Union[bytes, bytearray, memoryview, str]
+    ) -> Transaction:
+        """Deserializes a packed transaction, e.g. the `packed_trx` of a
+        transaction returned by a wallet or cosigner.
+
+        Action data is decoded with the cached ABIs the first time it's read.
+
+        Args:
+            packed_trx (Union[bytes, bytearray, memoryview, str]): the packed
+                transaction, as bytes or a hex-encoded str
+
+        Returns:
+            Transaction: the transaction. Each action's `data` is a LazyActionData.
+        """
+        if isinstance(packed_trx, str):
+            packed_trx = bytes.fromhex(packed_trx)
+
+        def load_data(account: str, name: str, data: memoryview) -> LazyActionData:
+            return LazyActionData(
+                data, lambda raw: self.deserialize_data(account, name, raw)
+            )
+
+        trx = TransactionSerializer(ActionSerializer(load_data))
+        return trx.deserialize(packed_trx)
+
+    def _signing_prefix(self) -> "hashlib._Hash":
+        if self._digest_prefix is None:
+            self._digest_prefix = hashlib.sha256(self.chain_id)
+        return self._digest_prefix
+
+    def signing_digest(
+        self,
+        serialized_transaction: Union[bytes, bytearray, memoryview],
+        context_free_data: Union[bytes, bytearray, memoryview] = b"",
+    ) -> bytes:
+        """Computes the digest signed for a transaction: the sha256 of the chain
+        id, the serialized transaction and the hash of its context-free data.
+        The chain id is only hashed once per cache.
+
+        Args:
+            serialized_transaction (Union[bytes, bytearray, memoryview]): the
+                serialized transaction, e.g. from `serialize`
+            context_free_data (Union[bytes, bytearray, memoryview], optional):
+                the packed context-free data, if any
+
+        Returns:
+            bytes: the digest
+        """
+        h = self._signing_prefix().copy()
+        h.update(memoryview(serialized_transaction))
+        if context_free_data:
+            h.update(hashlib.sha256(memoryview(context_free_data)).digest())
+        else:
+            h.update(_NO_CONTEXT_FREE_DATA)
+        return h.digest()
+
+    def signing_digests(
+        self, serialized_transactions: Iterable[Union[bytes, bytearray, memoryview]]
+    ) -> List[bytes]:
+        """Computes the signing digests of many transactions without
+        context-free data
+
+        Args:
+            serialized_transactions (Iterable[Union[bytes, bytearray, memoryview]]):
+                the serialized transactions
+
+        Returns:
+            List[bytes]: the digest of each transaction, in the same order
+        """
+        prefix = self._signing_prefix()
+        digests = []
+        for serialized_transaction in serialized_transactions:
+            h = prefix.copy()
+            h.update(memoryview(serialized_transaction))
+            h.update(_NO_CONTEXT_FREE_DATA)
+            digests.append(h.digest())
+        return digests
+
+    def sign_digest(self, signers: List["Signer"], digest: Any) -> List[Any]:
+        """Signs a digest with every signer, on the `signing_stage` if the cache
+        has one
+
+        Args:
+            signers (List[Signer]): objects with a `sign(digest)` method, such as
+                eospy.keys.EOSKey
+            digest (Any): the digest, in the form the signers expect
+
+        Returns:
+            List[Any]: the signature of each signer, in the order of `signers`
+        """
+        if self.signing_stage is None:
+            return [signer.sign(digest) for signer in signers]
+        return self.signing_stage.sign(signers, digest)
+
+    async def sign_digest_async(
+        self, signers: List["Signer"], digest: Any
+    ) -> List[Any]:
+        """Signs a digest with every signer, on the `signing_stage` if the cache
+        has one, without blocking the event loop while the stage signs
+
+        Args:
+            signers (List[Signer]): objects with a `sign(digest)` method, such as
+                the `key` of an aioeos.EosAccount
+            digest (Any): the digest, in the form the signers expect
+
+        Returns:
+            List[Any]: the signature of each signer, in the order of `signers`
+        """
+        if self.signing_stage is None:
+            return [signer.sign(digest) for signer in signers]
+        return await self.signing_stage.sign_async(signers, digest)
+
+    async def set_reference_async(self, rpc: Any, trx: Any) -> None:
+        """Sets the reference block of a transaction from `tapos` when the
+        transaction doesn't set one
+
+        Args:
+            rpc (Any): An RPC instance, such as aioeos.EosJsonRpc, used to read
+                the reference block unless `tapos` was set
+            trx (Any): the transaction, e.g. an aioeos.EosTransaction
+        """
+        if not (trx.ref_block_num or trx.ref_block_prefix):
+            ref = await self._tapos_for(rpc, is_async=True).reference_async()
+            trx.ref_block_num = ref.ref_block_num
+            trx.ref_block_prefix = ref.ref_block_prefix
+
     async def async_sign_and_push(
         self, rpc: Any, signing_accounts: List[Any], trx: Any
     ) -> Dict[str, Any]:
         """Asynchronously serializes, signs, and pushes a transaction to the chain endpoint.
 
+        The reference block is taken from `tapos` when the transaction doesn't
+        set one. Unless `tapos` was set, it's read through `rpc`.
+
         Args:
             rpc (Any): An RPC instance, such as aioeos.EosJsonRpc or eospy.cleos.Cleos
             signing_accounts (List[Any]): A list of signing accounts/keys,
@@ -197,17 +1129,16 @@ class AbiCache:
         Returns:
             Dict[str, Any]: A dictionary containing the json response from the chain endpoint
         """
-        serialized_transaction = self.serialize(trx)
         package_name = self.chain_package
         if package_name == "aioeos":
-            digest = hashlib.sha256(
-                b"".join((self.chain_id, serialized_transaction, bytes(32)))
-            ).digest()
+            await self.set_reference_async(rpc, trx)
+            serialized_transaction = self.serialize(trx)
+            digest = self.signing_digest(serialized_transaction)
             return await rpc.push_transaction(
-                signatures=[account.key.sign(digest) for account in signing_accounts],
-                serialized_transaction=(
-                    binascii.hexlify(serialized_transaction).decode()
+                signatures=await self.sign_digest_async(
+                    [account.key for account in signing_accounts], digest
                 ),
+                serialized_transaction=serialized_transaction.hex(),
             )
         raise UnsupportedPackageError("This package isn't supported by Antelopy yet")
 
@@ -216,6 +1147,10 @@ class AbiCache:
     ) -> Dict[str, Any]:
         """Serializes, signs, and pushes a transaction to the chain endpoint.
 
+        The reference block is taken from `tapos`, which is only fetched again
+        once it's older than its `max_age`. Unless `tapos` was set, it's read
+        through `rpc`.
+
         Args:
             rpc (Any): An RPC instance, such as aioeos.EosJsonRpc or eospy.cleos.Cleos
             signing_accounts (List[Any]): A list of signing accounts/keys,
@@ -230,19 +1165,15 @@ class AbiCache:
         """
         package_name = self.chain_package
         if package_name == "eospy":
-            _, lib_info = rpc.get_chain_lib_info(timeout=30)
-            trx["ref_block_num"] = lib_info["block_num"] & 65535
-            trx["ref_block_prefix"] = lib_info["ref_block_prefix"]
+            ref = self._tapos_for(rpc, is_async=False).reference()
+            trx["ref_block_num"] = ref.ref_block_num
+            trx["ref_block_prefix"] = ref.ref_block_prefix
             serialized_transaction = self.serialize(trx)
 
-            digest = binascii.hexlify(
-                hashlib.sha256(
-                    b"".join((self.chain_id, serialized_transaction, bytes(32)))
-                ).digest()
-            )
+            digest = binascii.hexlify(self.signing_digest(serialized_transaction))
             packed_transaction = PackedTransaction(
-                packed_trx=binascii.hexlify(serialized_transaction).decode(),
-                signatures=[key.sign(digest) for key in signing_accounts],
+                packed_trx=serialized_transaction.hex(),
+                signatures=self.sign_digest(signing_accounts, digest),
             )
             return rpc.post(
                 "chain.push_transaction",
@@ -0,0 +1,172 @@
+"""async_chain_interface.py
+
+Internal class to handle antelopy's interactions with chain endpoints from
+asyncio code, sharing one pooled keep-alive connector between requests.
+
+aiohttp is an optional dependency: `pip install antelopy[async]`"""
+
+import base64
+from typing import Any, Dict, Tuple, Union
+
+from antelopy.exceptions.exceptions import ABINotFoundError, AccountNotFoundError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncChainInterface:
+    """Internal class to handle antelopy's interactions with chain endpoints
+    without blocking the event loop"""
+
+    def __init__(
+        self,
+        chain_endpoint: str,
+        max_connections: int = 32,
+        keepalive_timeout: float = 30,
+        timeout: float = 30,
+    ):
+        """Internal class to handle antelopy's interactions with chain endpoints
+        without blocking the event loop
+
+        Args:
+            chain_endpoint (str): URL without trailing slash
+                e.g. `https://wax.greymass.com`
+            max_connections (int, optional): size of the connection pool. Requests
+                beyond it wait for a free connection. Defaults to 32.
+            keepalive_timeout (float, optional): seconds an idle connection is kept
+                open for reuse. Defaults to 30.
+            timeout (float, optional): total seconds allowed per request.
+                Defaults to 30.
+
+        Raises:
+            ImportError: Raised when aiohttp isn't installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncChainInterface requires aiohttp. "
+                "Install it with `pip install antelopy[async]`"
+            )
+        self.endpoint = chain_endpoint
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session: Union["aiohttp.ClientSession", None] = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """The pooled client session, created on first use inside the event loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the session and its pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncChainInterface":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def get_raw_abi(self, account_name: str) -> Dict[str, Any]:
+        """Reads a raw ABI file from chain
+
+        Args:
+            account_name (str): name of account with ABI
+
+        Raises:
+            AccountNotFoundError: Account not found on chain
+            aiohttp.ClientResponseError: The endpoint returned an error
+            ABINotFoundError: Account has no ABI
+
+        Returns:
+            Dict[str,Any]: the ABI
+        """
+        async with self.session.post(
+            f"{self.endpoint}/v1/chain/get_abi", json={"account_name": account_name}
+        ) as r:
+            if r.status != 200:
+                text = await r.text()
+                if "(unknown key (eosio::chain::name)" in text:
+                    raise AccountNotFoundError(
+                        f"Couldn't find account {account_name}. Error JSON\n{text}"
+                    )
+                r.raise_for_status()
+            result = await r.json()
+        if raw_abi := result.get("abi"):
+            return raw_abi
+        raise ABINotFoundError(f"Couldn't retrieve ABI for {account_name}")
+
+    async def get_packed_abi(
+        self, account_name: str, known_hash: Union[str, None] = None
+    ) -> Tuple[str, Union[bytes, None]]:
+        """Reads the hash and binary form of an account's ABI from chain, using
+        `/v1/chain/get_raw_abi`
+
+        Args:
+            account_name (str): name of account with ABI
+            known_hash (str, optional): hash of the ABI already held
+
+        Raises:
+            AccountNotFoundError: Account not found on chain
+            aiohttp.ClientResponseError: The endpoint returned an error
+
+        Returns:
+            Tuple[str, Union[bytes, None]]: the current ABI hash, and the binary
+                ABI or None if it matches the known hash or the account has none
+        """
+        body = {"account_name": account_name}
+        if known_hash:
+            body["abi_hash"] = known_hash
+        async with self.session.post(
+            f"{self.endpoint}/v1/chain/get_raw_abi", json=body
+        ) as r:
+            if r.status != 200:
+                text = await r.text()
+                if "(unknown key (eosio::chain::name)" in text:
+                    raise AccountNotFoundError(
+                        f"Couldn't find account {account_name}. Error JSON\n{text}"
+                    )
+                r.raise_for_status()
+            result = await r.json()
+        abi = result.get("abi")
+        if not abi:
+            return result.get("abi_hash", ""), None
+        # nodeos may leave out the base64 padding
+        return result["abi_hash"], base64.b64decode(abi + "=" * (-len(abi) % 4))
+
+    async def get_info(self) -> Dict[str, Any]:
+        """Gets the chain info of the connected endpoint, e.g. its chain id and
+        head and last irreversible blocks
+
+        Raises:
+            aiohttp.ClientResponseError: The endpoint returned an error
+
+        Returns:
+            Dict[str, Any]: the result of `/v1/chain/get_info`
+        """
+        async with self.session.post(f"{self.endpoint}/v1/chain/get_info") as r:
+            r.raise_for_status()
+            return await r.json()
+
+    async def get_chain_id(self) -> str:
+        """Gets the chain ID from the connected endpoint
+
+        Raises:
+            aiohttp.ClientResponseError: The endpoint returned an error
+
+        Returns:
+            str: the hex-encoded chain id
+        """
+        return (await self.get_info()).get("chain_id")
@@ -2,7 +2,8 @@
 
 Internal class to handle antelopy's interactions with chain endpoints"""
 
-from typing import Any, Dict
+import base64
+from typing import Any, Dict, Tuple, Union
 
 import requests
 
@@ -12,14 +13,22 @@ from antelopy.exceptions.exceptions import ABINotFoundError, AccountNotFoundErro
 class ChainInterface:
     """Internal class to handle antelopy's interactions with chain endpoints"""
 
-    def __init__(self, chain_endpoint: str):
+    def __init__(self, chain_endpoint: str, max_connections: int = 32):
         """Internal class to handle antelopy's interactions with chain endpoints
 
         Args:
             chain_endpoint (str): URL without trailing slash
                 e.g. `https://wax.greymass.com`
+            max_connections (int, optional): number of keep-alive connections
+                kept per host, for requests made from several threads.
+                Defaults to 32.
         """
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=max_connections
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.endpoint = chain_endpoint
 
     def get_raw_abi(self, account_name: str) -> Dict[str, Any]:
@@ -46,30 +55,68 @@ class ChainInterface:
         else:
             if "(unknown key (eosio::chain::name)" in r.text:
                 raise AccountNotFoundError(
-                    f"Couldn't find account {account_name}. Error JSON"
-                    + "\n"
-                    + r.json()
+                    f"Couldn't find account {account_name}. Error JSON\n{r.text}"
                 )
             raise requests.exceptions.HTTPError("Couldn't get data from chain")
         if raw_abi := r.json().get("abi"):
             return raw_abi
         raise ABINotFoundError(f"Couldn't retrieve ABI for {account_name}")
 
-    def get_chain_id(self) -> str:
-        """Gets the chain ID from the connected endpoint
+    def get_packed_abi(
+        self, account_name: str, known_hash: Union[str, None] = None
+    ) -> Tuple[str, Union[bytes, None]]:
+        """Reads the hash and binary form of an account's ABI from chain, using
+        `/v1/chain/get_raw_abi`. When the known hash is still current, the node
+        leaves out the ABI, so checking for changes is cheap.
 
         Args:
             account_name (str): name of account with ABI
+            known_hash (str, optional): hash of the ABI already held
 
+        Raises:
+            AccountNotFoundError: Account not found on chain
+            requests.exceptions.HTTPError: The endpoint returned an error
 
         Returns:
-            bytes: the chain id
+            Tuple[str, Union[bytes, None]]: the current ABI hash, and the binary
+                ABI or None if it matches the known hash or the account has none
         """
-        r = self.session.post(f"{self.endpoint}/v1/chain/get_info")
-        s = r.status_code
+        body = {"account_name": account_name}
+        if known_hash:
+            body["abi_hash"] = known_hash
+        r = self.session.post(f"{self.endpoint}/v1/chain/get_raw_abi", json=body)
+        if r.status_code != 200:
+            if "(unknown key (eosio::chain::name)" in r.text:
+                raise AccountNotFoundError(
+                    f"Couldn't find account {account_name}. Error JSON\n{r.text}"
+                )
+            raise requests.exceptions.HTTPError("Couldn't get data from chain")
+        result = r.json()
+        abi = result.get("abi")
+        if not abi:
+            return result.get("abi_hash", ""), None
+        # nodeos may leave out the base64 padding
+        return result["abi_hash"], base64.b64decode(abi + "=" * (-len(abi) % 4))
 
-        if s == 200:
-            pass
-        else:
+    def get_info(self) -> Dict[str, Any]:
+        """Gets the chain info of the connected endpoint, e.g. its chain id and
+        head and last irreversible blocks
+
+        Raises:
+            requests.exceptions.HTTPError: The endpoint returned an error
+
+        Returns:
+            Dict[str, Any]: the result of `/v1/chain/get_info`
+        """
+        r = self.session.post(f"{self.endpoint}/v1/chain/get_info")
+        if r.status_code != 200:
             raise requests.exceptions.HTTPError("Couldn't get data from chain")
-        return r.json().get("chain_id")
+        return r.json()
+
+    def get_chain_id(self) -> str:
+        """Gets the chain ID from the connected endpoint
+
+        Returns:
+            str: the hex-encoded chain id
+        """
+        return self.get_info().get("chain_id")
@@ -0,0 +1,138 @@
+"""disk.py
+
+Directory backend for AbiCache, so ABIs survive restarts and are shared
+between processes. Each ABI is stored in its binary `abi_def` form as
+`<account>@<abi hash>.abi`, written to a temporary file and moved into place
+so readers never see a partial file."""
+
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+from antelopy.types.abi_def import abi_hash, unpack_abi
+
+
+class AbiDiskCache:
+    """ABI cache directory shared between processes"""
+
+    def __init__(self, directory: str, lock_timeout: float = 30):
+        """ABI cache directory shared between processes
+
+        Args:
+            directory (str): the cache directory, created if it doesn't exist
+            lock_timeout (float, optional): seconds after which a fetch lock held
+                by another process is considered abandoned. Defaults to 30.
+        """
+        self.directory = directory
+        self.lock_timeout = lock_timeout
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, account_name: str, hash_hex: str) -> str:
+        """Path of the file holding an account's ABI with the given hash
+
+        Args:
+            account_name (str): account name
+            hash_hex (str): hex-encoded sha256 of the binary ABI
+
+        Returns:
+            str: the path
+        """
+        return os.path.join(self.directory, f"{account_name}@{hash_hex}.abi")
+
+    def _entries(self, account_name: str) -> List[Tuple[float, str]]:
+        prefix = f"{account_name}@"
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith(prefix) and file_name.endswith(".abi"):
+                path = os.path.join(self.directory, file_name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except FileNotFoundError:
+                    # replaced by another process in the meantime
+                    continue
+        return sorted(entries, reverse=True)
+
+    def load(self, account_name: str) -> Union[Tuple[str, Dict[str, Any]], None]:
+        """Loads the most recently stored ABI of an account
+
+        Args:
+            account_name (str): account name
+
+        Returns:
+            Union[Tuple[str, Dict[str, Any]], None]: the ABI hash and the ABI,
+                or None if the account has no valid ABI stored
+        """
+        for _, path in self._entries(account_name):
+            try:
+                with open(path, "rb") as fp:
+                    data = fp.read()
+            except FileNotFoundError:
+                continue
+            hash_hex = os.path.basename(path)[len(account_name) + 1 : -len(".abi")]
+            if abi_hash(data) != hash_hex:
+                logging.warning("[ANTELOPY] ignoring corrupt cached ABI: %s", path)
+                continue
+            return hash_hex, unpack_abi(data)
+        return None
+
+    def store_packed(self, account_name: str, data: bytes) -> str:
+        """Stores the binary form of an account's ABI, e.g. as read from
+        `/v1/chain/get_raw_abi`, removing older versions of it
+
+        Args:
+            account_name (str): account name
+            data (bytes): the binary ABI
+
+        Returns:
+            str: the ABI hash
+        """
+        hash_hex = abi_hash(data)
+        path = self.path(account_name, hash_hex)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        for _, old_path in self._entries(account_name):
+            if old_path != path:
+                try:
+                    os.unlink(old_path)
+                except FileNotFoundError:
+                    pass
+        return hash_hex
+
+    @contextmanager
+    def lock(self, account_name: str) -> Iterator[None]:
+        """Holds a per-account lock file, so only one process fetches an ABI
+        from chain while the others wait and then read the stored result
+
+        Args:
+            account_name (str): account name
+        """
+        path = os.path.join(self.directory, f"{account_name}.lock")
+        while True:
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(path) > self.lock_timeout:
+                        os.unlink(path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                time.sleep(0.05)
+        try:
+            os.close(fd)
+            yield
+        finally:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
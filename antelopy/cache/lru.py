@@ -0,0 +1,194 @@
+"""lru.py
+
+Bounded least-recently-used cache with pinning, memory accounting and
+counters, used by AbiCache to cap the number and memory of cached ABIs."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Set, Union
+
+
+class LRUCache:
+    """Mapping that evicts its least recently used entries once it holds more
+    than `max_entries` entries or more than `max_bytes` estimated bytes.
+    Pinned entries are never evicted."""
+
+    def __init__(
+        self,
+        max_entries: Union[int, None] = None,
+        max_bytes: Union[int, None] = None,
+        sizeof: Union[Callable[[str, Any], int], None] = None,
+        on_evict: Union[Callable[[str, Any], None], None] = None,
+    ):
+        """Mapping that evicts its least recently used entries
+
+        Args:
+            max_entries (int, optional): maximum number of entries
+            max_bytes (int, optional): maximum total estimated size of the entries
+            sizeof (Callable[[str, Any], int], optional): estimates the size of
+                an entry from its key and value. Required for `max_bytes`.
+            on_evict (Callable[[str, Any], None], optional): called with the key
+                and value of each evicted entry
+        """
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("max_bytes requires a sizeof function")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._pinned: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Gets an entry, marking it as the most recently used
+
+        Args:
+            key (str): the key
+            default (Any, optional): returned when the key isn't cached
+
+        Returns:
+            Any: the value, or default
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes.pop(key, None)
+            if self.max_bytes is not None:
+                self._sizes[key] = self.sizeof(key, value)
+            self._evict(keep=key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        # a snapshot, so entries can be added or evicted while iterating
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Removes an entry without counting it as an eviction
+
+        Args:
+            key (str): the key
+            default (Any, optional): returned when the key isn't cached
+
+        Returns:
+            Any: the value, or default
+        """
+        with self._lock:
+            self._sizes.pop(key, None)
+            return self._entries.pop(key, default)
+
+    def pin(self, key: str) -> None:
+        """Keeps an entry from being evicted. Keys can be pinned before they're
+        cached.
+
+        Args:
+            key (str): the key
+        """
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: str) -> None:
+        """Allows a pinned entry to be evicted again
+
+        Args:
+            key (str): the key
+        """
+        with self._lock:
+            self._pinned.discard(key)
+            self._evict()
+
+    def entry_size(self, key: str) -> int:
+        """Estimated size of an entry in bytes
+
+        Args:
+            key (str): the key
+
+        Raises:
+            KeyError: Raised when the key isn't cached
+
+        Returns:
+            int: the size, or 0 without a sizeof function
+        """
+        with self._lock:
+            size = self._sizes.get(key)
+            if size is None:
+                value = self._entries[key]
+                size = self.sizeof(key, value) if self.sizeof else 0
+                self._sizes[key] = size
+            return size
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of all entries in bytes"""
+        with self._lock:
+            return sum(self.entry_size(key) for key in list(self._entries))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and memory estimates of the cache
+
+        Returns:
+            Dict[str, Any]: `entries`, `bytes`, `max_entries`, `max_bytes`,
+                `hits`, `misses`, `evictions`, `pinned` and the estimated
+                `sizes` of each entry
+        """
+        with self._lock:
+            sizes = {key: self.entry_size(key) for key in list(self._entries)}
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(sizes.values()),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "pinned": sorted(self._pinned),
+                "sizes": sizes,
+            }
+
+    def _over_budget(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        if self.max_bytes is not None:
+            return sum(self._sizes.values()) > self.max_bytes
+        return False
+
+    def _evict(self, keep: Union[str, None] = None) -> None:
+        if not self._over_budget():
+            return
+        # least recently used first, never the entry just added
+        candidates: List[str] = [
+            k for k in self._entries if k not in self._pinned and k != keep
+        ]
+        for key in candidates:
+            if not self._over_budget():
+                break
+            value = self._entries.pop(key)
+            self._sizes.pop(key, None)
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(key, value)
@@ -0,0 +1,209 @@
+"""pipeline.py
+
+Asynchronous push queue for steady streams of transactions. Transactions are
+serialized, signed and pushed by a pool of worker tasks, so one transaction is
+being serialized and signed while others wait on the network. Serializing and
+signing run on an executor, keeping the event loop free. The queue, the number
+of transactions in flight and the pushes per endpoint are all bounded."""
+
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple, Union
+
+from antelopy.exceptions.exceptions import UnsupportedPackageError
+
+if TYPE_CHECKING:
+    from antelopy.cache.abicache import AbiCache
+
+
+class PushPipeline:
+    """Serializes, signs and pushes queued transactions with bounded
+    concurrency. Currently supports aioeos."""
+
+    def __init__(
+        self,
+        abi_cache: "AbiCache",
+        rpcs: Union[Any, Sequence[Any]],
+        signing_accounts: List[Any],
+        max_in_flight: int = 32,
+        max_per_endpoint: int = 8,
+        queue_size: int = 256,
+        executor: Union[Executor, None] = None,
+    ):
+        """Serializes, signs and pushes queued transactions
+
+        Args:
+            abi_cache (AbiCache): the cache holding the ABIs of the actions
+            rpcs (Union[Any, Sequence[Any]]): an RPC instance, such as
+                aioeos.EosJsonRpc, or several for different endpoints. Each push
+                goes to the endpoint with the fewest pushes in flight.
+            signing_accounts (List[Any]): default signing accounts, such as
+                aioeos.EosAccount
+            max_in_flight (int, optional): transactions processed at the same
+                time. Defaults to 32.
+            max_per_endpoint (int, optional): pushes in flight per endpoint.
+                Defaults to 8.
+            queue_size (int, optional): transactions waiting to be processed
+                before `submit` waits for room. Defaults to 256.
+            executor (Executor, optional): where transactions are serialized
+                and signed. Signing goes through the cache's `signing_stage`
+                when it has one. Defaults to the event loop's default executor.
+
+        Raises:
+            UnsupportedPackageError: Raised when the cache's chain package isn't
+                supported by the pipeline
+        """
+        if abi_cache.chain_package != "aioeos":
+            raise UnsupportedPackageError("PushPipeline currently only supports aioeos")
+        self.abi_cache = abi_cache
+        self.rpcs = list(rpcs) if isinstance(rpcs, (list, tuple)) else [rpcs]
+        self.signing_accounts = signing_accounts
+        self.max_in_flight = max_in_flight
+        self.max_per_endpoint = max_per_endpoint
+        self.queue_size = queue_size
+        self.executor = executor
+        self._queue: Union[asyncio.Queue, None] = None
+        self._workers: List[asyncio.Task] = []
+        self._endpoints: List[asyncio.Semaphore] = []
+        self._pushing: List[int] = [0] * len(self.rpcs)
+
+    def start(self) -> None:
+        """Starts the worker tasks. Called by `submit` if needed."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._endpoints = [asyncio.Semaphore(self.max_per_endpoint) for _ in self.rpcs]
+        self._workers = [
+            asyncio.ensure_future(self._work()) for _ in range(self.max_in_flight)
+        ]
+
+    async def submit(
+        self, trx: Any, signing_accounts: Union[List[Any], None] = None
+    ) -> asyncio.Future:
+        """Queues a transaction, waiting for room in the queue if it's full
+
+        Args:
+            trx (Any): the transaction, e.g. an aioeos.EosTransaction
+            signing_accounts (List[Any], optional): signing accounts for this
+                transaction. Defaults to the pipeline's signing accounts.
+
+        Returns:
+            asyncio.Future: resolves to the chain endpoint's response, or to the
+                error raised while serializing, signing or pushing
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((trx, signing_accounts, future))
+        return future
+
+    def submit_nowait(
+        self, trx: Any, signing_accounts: Union[List[Any], None] = None
+    ) -> asyncio.Future:
+        """Queues a transaction without waiting
+
+        Args:
+            trx (Any): the transaction, e.g. an aioeos.EosTransaction
+            signing_accounts (List[Any], optional): signing accounts for this
+                transaction. Defaults to the pipeline's signing accounts.
+
+        Raises:
+            asyncio.QueueFull: Raised when the queue is full
+
+        Returns:
+            asyncio.Future: resolves to the chain endpoint's response
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((trx, signing_accounts, future))
+        return future
+
+    async def push(
+        self, trx: Any, signing_accounts: Union[List[Any], None] = None
+    ) -> Dict[str, Any]:
+        """Queues a transaction and waits for it to be pushed
+
+        Args:
+            trx (Any): the transaction, e.g. an aioeos.EosTransaction
+            signing_accounts (List[Any], optional): signing accounts for this
+                transaction. Defaults to the pipeline's signing accounts.
+
+        Returns:
+            Dict[str, Any]: the chain endpoint's response
+        """
+        return await (await self.submit(trx, signing_accounts))
+
+    async def join(self) -> None:
+        """Waits until every queued transaction has been processed"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Processes the queued transactions, then stops the worker tasks"""
+        await self.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def __aenter__(self) -> "PushPipeline":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _work(self) -> None:
+        while True:
+            trx, signing_accounts, future = await self._queue.get()
+            try:
+                if not future.cancelled():
+                    result = await self._process(trx, signing_accounts)
+                    if not future.cancelled():
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                logging.debug("[ANTELOPY] pipelined push failed: %r", error)
+                if not future.cancelled():
+                    future.set_exception(error)
+            finally:
+                self._queue.task_done()
+
+    def _pick_endpoint(self) -> Tuple[int, Any]:
+        index = min(range(len(self.rpcs)), key=self._pushing.__getitem__)
+        return index, self.rpcs[index]
+
+    def _serialize_and_sign(
+        self, trx: Any, signing_accounts: List[Any]
+    ) -> Tuple[bytes, List[Any]]:
+        cache = self.abi_cache
+        serialized_transaction = cache.serialize(trx)
+        digest = cache.signing_digest(serialized_transaction)
+        signatures = cache.sign_digest(
+            [account.key for account in signing_accounts], digest
+        )
+        return serialized_transaction, signatures
+
+    async def _process(
+        self, trx: Any, signing_accounts: Union[List[Any], None]
+    ) -> Dict[str, Any]:
+        await self.abi_cache.set_reference_async(self.rpcs[0], trx)
+        loop = asyncio.get_running_loop()
+        serialized_transaction, signatures = await loop.run_in_executor(
+            self.executor,
+            self._serialize_and_sign,
+            trx,
+            signing_accounts or self.signing_accounts,
+        )
+        index, rpc = self._pick_endpoint()
+        self._pushing[index] += 1
+        try:
+            async with self._endpoints[index]:
+                return await rpc.push_transaction(
+                    signatures=signatures,
+                    serialized_transaction=serialized_transaction.hex(),
+                )
+        finally:
+            self._pushing[index] -= 1
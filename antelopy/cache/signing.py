@@ -0,0 +1,117 @@
+"""signing.py
+
+Signing stage that spreads the signatures of multisig transactions, or of a
+batch of transactions, across a thread or process pool. Signatures always come
+back in the order of the signers, whatever order the pool finishes them in."""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, List, Protocol, Sequence, Union
+
+
+class Signer(Protocol):
+    """Anything that signs a digest, such as eospy.keys.EOSKey or the `key` of
+    an aioeos.EosAccount"""
+
+    def sign(self, digest: Any) -> Any:
+        """Signs a digest"""
+
+
+def _sign(signer: Signer, digest: Any) -> Any:
+    # module level, so process pools can pickle it
+    return signer.sign(digest)
+
+
+class SigningStage:
+    """Signs digests with several signers on a pool of workers"""
+
+    def __init__(
+        self,
+        executor: Union[Executor, None] = None,
+        max_workers: Union[int, None] = None,
+        processes: bool = False,
+    ):
+        """Signs digests with several signers on a pool of workers
+
+        Threads suit signers that release the GIL, such as bindings to
+        libsecp256k1. Pure-Python signers only run in parallel on processes,
+        which requires the signers to be picklable.
+
+        Args:
+            executor (Executor, optional): the pool to sign on. Not shut down by
+                the stage. Defaults to a pool owned by the stage.
+            max_workers (int, optional): size of the stage's own pool
+            processes (bool, optional): use a process pool instead of a thread
+                pool for the stage's own pool. Defaults to False.
+        """
+        self._owns_executor = executor is None
+        if executor is None:
+            pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            executor = pool(max_workers=max_workers)
+        self.executor = executor
+
+    def sign(self, signers: Sequence[Signer], digest: Any) -> List[Any]:
+        """Signs a digest with every signer
+
+        Args:
+            signers (Sequence[Signer]): the signers
+            digest (Any): the digest, in the form the signers expect
+
+        Returns:
+            List[Any]: the signature of each signer, in the order of `signers`
+        """
+        if len(signers) == 1:
+            # not worth a round trip through the pool
+            return [signers[0].sign(digest)]
+        futures = [self.executor.submit(_sign, signer, digest) for signer in signers]
+        return [future.result() for future in futures]
+
+    def sign_many(
+        self, signers: Sequence[Signer], digests: Sequence[Any]
+    ) -> List[List[Any]]:
+        """Signs a batch of digests with every signer, all at once
+
+        Args:
+            signers (Sequence[Signer]): the signers
+            digests (Sequence[Any]): the digest of each transaction
+
+        Returns:
+            List[List[Any]]: the signatures of each digest, in the order of
+                `signers`
+        """
+        futures = [
+            [self.executor.submit(_sign, signer, digest) for signer in signers]
+            for digest in digests
+        ]
+        return [[future.result() for future in row] for row in futures]
+
+    async def sign_async(self, signers: Sequence[Signer], digest: Any) -> List[Any]:
+        """Signs a digest with every signer without blocking the event loop
+
+        Args:
+            signers (Sequence[Signer]): the signers
+            digest (Any): the digest, in the form the signers expect
+
+        Returns:
+            List[Any]: the signature of each signer, in the order of `signers`
+        """
+        loop = asyncio.get_running_loop()
+        return list(
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self.executor, _sign, signer, digest)
+                    for signer in signers
+                )
+            )
+        )
+
+    def shutdown(self) -> None:
+        """Shuts down the stage's own pool"""
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def __enter__(self) -> "SigningStage":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
@@ -0,0 +1,152 @@
+"""tapos.py
+
+Reference block (TAPOS) provider used when signing. Every transaction names a
+recent block through `ref_block_num` and `ref_block_prefix`, and any block
+from the last few hours will do, so one `get_info` result is reused for every
+transaction until it's older than `max_age` instead of being fetched per push."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Union
+
+from antelopy.types.transaction import ReferenceBlock
+
+
+class TaposProvider:
+    """Caches the reference block used by transactions and refreshes it on use
+    once it's stale, or in the background at an interval"""
+
+    def __init__(
+        self,
+        get_info: Union[Callable[[], Dict[str, Any]], None] = None,
+        get_info_async: Union[Callable[[], Awaitable[Dict[str, Any]]], None] = None,
+        max_age: float = 60,
+        irreversible: bool = True,
+    ):
+        """Caches the reference block used by transactions
+
+        Args:
+            get_info (Callable[[], Dict[str, Any]], optional): returns the result
+                of `/v1/chain/get_info`, e.g. `ChainInterface.get_info`
+            get_info_async (Callable[[], Awaitable[Dict[str, Any]]], optional):
+                async version of `get_info`, e.g. `AsyncChainInterface.get_info`.
+                Without it, `reference_async` calls `get_info` in a worker thread.
+            max_age (float, optional): seconds a reference block is reused for.
+                Defaults to 60.
+            irreversible (bool, optional): refer to the last irreversible block
+                instead of the head block. Defaults to True.
+        """
+        if get_info is None and get_info_async is None:
+            raise ValueError("TaposProvider requires get_info or get_info_async")
+        self._get_info = get_info
+        self._get_info_async = get_info_async
+        self.max_age = max_age
+        self.irreversible = irreversible
+        self.fetches = 0
+        self._reference: Union[ReferenceBlock, None] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._async_fetch: Union[asyncio.Future, None] = None
+        self._refresh_thread: Union[threading.Thread, None] = None
+        self._refresh_stop = threading.Event()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._reference is not None
+            and time.monotonic() - self._fetched_at < self.max_age
+        )
+
+    def _update(self, info: Dict[str, Any]) -> ReferenceBlock:
+        key = "last_irreversible_block_id" if self.irreversible else "head_block_id"
+        self._reference = ReferenceBlock.from_block_id(info[key])
+        self._fetched_at = time.monotonic()
+        self.fetches += 1
+        logging.debug("[ANTELOPY] reference block: %s", self._reference.block_num)
+        return self._reference
+
+    def refresh(self) -> ReferenceBlock:
+        """Fetches a new reference block
+
+        Returns:
+            ReferenceBlock: the reference block
+        """
+        if self._get_info is None:
+            raise ValueError("This TaposProvider can only be used from async code")
+        return self._update(self._get_info())
+
+    def reference(self) -> ReferenceBlock:
+        """Gets the cached reference block, fetching a new one if it's stale.
+        Threads needing a new reference wait for a single fetch.
+
+        Returns:
+            ReferenceBlock: the reference block
+        """
+        if self._is_fresh():
+            return self._reference
+        with self._lock:
+            if self._is_fresh():
+                return self._reference
+            return self.refresh()
+
+    async def reference_async(self) -> ReferenceBlock:
+        """Gets the cached reference block without blocking the event loop,
+        fetching a new one if it's stale. Tasks needing a new reference wait for
+        a single fetch.
+
+        Returns:
+            ReferenceBlock: the reference block
+        """
+        if self._is_fresh():
+            return self._reference
+        if self._async_fetch is None:
+            self._async_fetch = asyncio.ensure_future(self._fetch_async())
+            self._async_fetch.add_done_callback(self._clear_async_fetch)
+        # a cancelled waiter doesn't cancel the fetch the others are waiting for
+        return await asyncio.shield(self._async_fetch)
+
+    def _clear_async_fetch(self, _: asyncio.Future) -> None:
+        self._async_fetch = None
+
+    async def _fetch_async(self) -> ReferenceBlock:
+        if self._get_info_async is None:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.reference
+            )
+        return self._update(await self._get_info_async())
+
+    def start_background_refresh(self, interval: float) -> None:
+        """Starts a daemon thread that fetches a new reference block every
+        `interval` seconds, so signing never waits for one. Failed fetches are
+        logged and the previous reference is kept.
+
+        Args:
+            interval (float): seconds between fetches, normally below `max_age`
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_stop.clear()
+
+        def run() -> None:
+            while True:
+                try:
+                    self.refresh()
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    logging.warning(
+                        "[ANTELOPY] couldn't refresh reference block: %r", error
+                    )
+                if self._refresh_stop.wait(interval):
+                    return
+
+        self._refresh_thread = threading.Thread(
+            target=run, name="antelopy-tapos-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stops the thread started by `start_background_refresh`"""
+        self._refresh_stop.set()
+        if self._refresh_thread:
+            self._refresh_thread.join()
+            self._refresh_thread = None
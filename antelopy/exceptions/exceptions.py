@@ -27,6 +27,14 @@ class ActionMissingFieldError(Exception):
     """Missing field in action serialization"""
 
 
+class ChainEndpointNotDefinedError(Exception):
+    """Raised when chain data is needed but no chain endpoint was given"""
+
+
+class DeserializationError(Exception):
+    """Data was unable to be deserialized"""
+
+
 class PackageNotDefinedError(Exception):
     """Raised when Antelope package hasn't been specified"""
 
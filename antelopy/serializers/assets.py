@@ -57,3 +57,49 @@ def serialize_asset(asset_string: str) -> bytes:
     amount_bytes = struct.pack("Q", amount)
     symbol_bytes = serialize_symbol(precision, symbol_name)
     return amount_bytes + symbol_bytes
+
+
+def deserialize_symbol_code(b: bytes) -> str:
+    """Converts serialized symbol code bytes to a token name
+
+    Args:
+        b (bytes): serialized data
+
+    Returns:
+        str: token name, e.g. `WAX`
+    """
+    return bytes(b).rstrip(b"\x00").decode()
+
+
+def deserialize_symbol(b: bytes) -> str:
+    """Converts a serialized symbol to a precision,symbol string
+
+    Args:
+        b (bytes): serialized data (8 bytes)
+
+    Returns:
+        str: the symbol, e.g. `8,WAX`
+    """
+    return f"{b[0]},{deserialize_symbol_code(b[1:8])}"
+
+
+def deserialize_asset(b: bytes) -> str:
+    """Converts a serialized asset to an asset string
+
+    Args:
+        b (bytes): serialized data (16 bytes)
+
+    Returns:
+        str: the asset, e.g. "1.23450000 WAX"
+    """
+    (amount,) = struct.unpack_from("q", b)
+    precision = b[8]
+    symbol_name = deserialize_symbol_code(b[9:16])
+    sign = "-" if amount < 0 else ""
+    amount = abs(amount)
+    if precision:
+        scale = 10**precision
+        quantity = f"{amount // scale}.{amount % scale:0{precision}d}"
+    else:
+        quantity = str(amount)
+    return f"{sign}{quantity} {symbol_name}"
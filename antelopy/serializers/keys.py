@@ -1,41 +1,84 @@
 """keys.py
 
-Utility functions to serialize EOS keys and signatures into bytes"""
+Utility functions to serialize EOS keys and signatures into bytes
+
+Public keys are cached in both directions, since a batch of permission
+updates or new accounts tends to reuse the same few keys."""
 
 import struct
+from functools import lru_cache
 
-from antelopy.utils.base58 import b58decode
+from antelopy.exceptions.exceptions import DeserializationError, SerializationError
+from antelopy.utils.base58 import b58decode, b58encode
+from antelopy.utils.ripemd160 import ripemd160
 
 KEY_TYPES = {
     "k1": 0,
     "r1": 1,
     "wa": 2,
 }
-# TODO: add reverse implementations, and potentially key length validation
+KEY_SUFFIXES = {v: k.upper() for k, v in KEY_TYPES.items()}
+# Number of public keys kept by each of the encode and decode caches
+KEY_CACHE_SIZE = 1024
+# TODO: potentially add key length validation
 # based on eosjs-numeric.ts (EOSIO/eosjs)
 
 
+def _key_type(s: str) -> bytes:
+    """Reads the key-type byte of a PUB_XX_ key or SIG_XX_ signature"""
+    key_type = KEY_TYPES.get(s[4:6].lower())
+    if key_type is None:
+        raise SerializationError(f"Unknown key type in {s}")
+    return struct.pack("b", key_type)
+
+
+def _key_suffix(key_type: int) -> str:
+    """Gets the XX of PUB_XX_ and SIG_XX_ for a key-type byte"""
+    suffix = KEY_SUFFIXES.get(key_type)
+    if suffix is None:
+        raise DeserializationError(f"Unknown key type {key_type}")
+    return suffix
+
+
+def _encode_with_checksum(data: bytes, suffix: str) -> str:
+    """Base58 encodes key data with its ripemd160 checksum appended"""
+    checksum = ripemd160(data + suffix.encode())[:4]
+    return b58encode(data + checksum).decode()
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def serialize_public_key(s: str):
     """Converts string key to bytes with leading key-type byte"""
-    buf = b""
     if s[:3] == "EOS":
-        key_type = KEY_TYPES["k1"]
-        buf += struct.pack("b", key_type)
-        buf += b58decode(s[3:])[:-4]
-    elif s[:3] == "PUB":
-        key_type = KEY_TYPES[s[4:6].lower()]
-        sig = s[7:]
-        buf = b""
-        buf += struct.pack("b", key_type)
-        buf += b58decode(sig)[:-4]
-    return buf
+        return struct.pack("b", KEY_TYPES["k1"]) + b58decode(s[3:])[:-4]
+    if s[:3] == "PUB":
+        return _key_type(s) + b58decode(s[7:])[:-4]
+    return b""
 
 
 def serialize_signature(s: str):
     """Converts string signature (SIG_XX_...) to bytes with leading key-type byte"""
-    key_type = KEY_TYPES[s[4:6].lower()]
-    sig = s[7:]
-    buf = b""
-    buf += struct.pack("b", key_type)
-    buf += b58decode(sig)[:-4]
-    return buf
+    return _key_type(s) + b58decode(s[7:])[:-4]
+
+
+def deserialize_public_key(b: bytes) -> str:
+    """Converts a serialized key (leading key-type byte) to its string form.
+    K1 keys use the legacy EOS format, other key types use PUB_XX_ format."""
+    # memoryviews are copied so the cache doesn't hold on to the whole buffer
+    return _deserialize_public_key(bytes(b))
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _deserialize_public_key(b: bytes) -> str:
+    key_type = b[0]
+    data = b[1:]
+    if key_type == KEY_TYPES["k1"]:
+        return "EOS" + _encode_with_checksum(data, "")
+    suffix = _key_suffix(key_type)
+    return f"PUB_{suffix}_" + _encode_with_checksum(data, suffix)
+
+
+def deserialize_signature(b: bytes) -> str:
+    """Converts a serialized signature (leading key-type byte) to SIG_XX_ format"""
+    suffix = _key_suffix(b[0])
+    return f"SIG_{suffix}_" + _encode_with_checksum(bytes(b[1:]), suffix)
@@ -0,0 +1,79 @@
+"""name_arrays.py
+
+Vectorized conversion between columns of Antelope names and NumPy uint64
+arrays, for bulk data such as table scans and action histories. Names are
+split into their 5-bit symbols with array shifts and mapped through lookup
+tables, so no Python code runs per name.
+
+NumPy is an optional dependency: `pip install antelopy[numpy]`
+"""
+
+from typing import Any, List, Sequence, Union
+
+_SYMBOLS = b".12345abcdefghijklmnopqrstuvwxyz"
+
+# NumPy and the lookup tables are loaded on first use, see _require_numpy
+np: Any = None
+_SHIFTS: Any = None
+_MASKS: Any = None
+_SYMBOL_TO_CHAR: Any = None
+_CHAR_TO_SYMBOL: Any = None
+
+
+def _require_numpy() -> None:
+    global np, _SHIFTS, _MASKS, _SYMBOL_TO_CHAR, _CHAR_TO_SYMBOL
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Name arrays require NumPy. Install it with `pip install antelopy[numpy]`"
+        ) from None
+    # bit offset and width mask of each of the 13 symbols, first symbol first
+    _SHIFTS = numpy.array(
+        [64 - 5 * (i + 1) for i in range(12)] + [0], dtype=numpy.uint64
+    )
+    _MASKS = numpy.array([0x1F] * 12 + [0x0F], dtype=numpy.uint64)
+    _SYMBOL_TO_CHAR = numpy.frombuffer(_SYMBOLS, dtype=numpy.uint8)
+    # codepoint to symbol, anything outside of `.12345a-z` is treated as `.`
+    _CHAR_TO_SYMBOL = numpy.zeros(128, dtype=numpy.uint64)
+    _CHAR_TO_SYMBOL[_SYMBOL_TO_CHAR] = numpy.arange(32, dtype=numpy.uint64)
+    np = numpy
+
+
+def encode_names(values: Sequence[str]) -> Any:
+    """Converts plaintext names to their uint64 values
+
+    Args:
+        values (Sequence[str]): the plaintext names
+
+    Returns:
+        np.ndarray: uint64 array of the name values. `.astype("<u8").tobytes()`
+            gives the serialized names back to back.
+    """
+    _require_numpy()
+    # fixed-width unicode arrays store one uint32 codepoint per character,
+    # zero padded, and drop anything after the 13th character
+    chars = np.asarray(values, dtype="U13").view(np.uint32).reshape(-1, 13)
+    symbols = _CHAR_TO_SYMBOL[np.minimum(chars, 127)] & _MASKS
+    return np.bitwise_or.reduce(symbols << _SHIFTS, axis=1).astype(np.uint64)
+
+
+def decode_names(values: Union[Any, bytes, memoryview]) -> List[str]:
+    """Converts name values to plaintext names
+
+    Args:
+        values (Union[np.ndarray, bytes, memoryview]): uint64 array of name
+            values, or a buffer of serialized names back to back
+
+    Returns:
+        List[str]: the plaintext names
+    """
+    _require_numpy()
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        values = np.frombuffer(values, dtype="<u8")
+    values = np.asarray(values, dtype=np.uint64).reshape(-1, 1)
+    symbols = ((values >> _SHIFTS) & _MASKS).astype(np.uint8)
+    chars = np.ascontiguousarray(_SYMBOL_TO_CHAR[symbols]).view("S13").ravel()
+    return np.char.rstrip(chars, b".").astype("U13").tolist()
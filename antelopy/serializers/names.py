@@ -2,9 +2,26 @@
 
 Utility functions for serializing and deserializing Antelope names.
 
+A name packs up to 12 five-bit symbols and one final four-bit symbol into a
+uint64, most significant symbol first. Recently used names are cached in both
+directions, since the same accounts and permissions appear in most actions.
+
 Based off eosjs
 """
 
+import struct
+from functools import lru_cache
+
+_UINT64 = struct.Struct("<Q")
+
+# Number of names kept by each of the encode and decode caches
+NAME_CACHE_SIZE = 4096
+
+_SYMBOLS = ".12345abcdefghijklmnopqrstuvwxyz"
+_CHAR_TO_SYMBOL = {c: i for i, c in enumerate(_SYMBOLS)}
+# bit offset of each of the 13 symbols, with the width mask of that symbol
+_SHIFTS = tuple((64 - 5 * (i + 1), 0x1F) for i in range(12)) + ((0, 0x0F),)
+
 
 def char_to_symbol(c: int) -> int:
     """utility encoder from character int to symbol int"""
@@ -24,31 +41,51 @@ def symbol_to_char(s: int) -> str:
     return "."
 
 
+def name_to_uint64(s: str) -> int:
+    """Converts the string representation of a name to its uint64 value
+
+    Characters outside of `.12345a-z` are treated as `.`, and characters after
+    the 13th are ignored.
+
+    Args:
+        s (str): the plaintext name
+
+    Returns:
+        int: the name value
+    """
+    value = 0
+    lookup = _CHAR_TO_SYMBOL.get
+    for c, (shift, mask) in zip(s, _SHIFTS):
+        value |= (lookup(c, 0) & mask) << shift
+    return value
+
+
+def uint64_to_name(value: int) -> str:
+    """Converts the uint64 value of a name to its string representation
+
+    Args:
+        value (int): the name value
+
+    Returns:
+        str: the plaintext name
+    """
+    return "".join(
+        [_SYMBOLS[(value >> shift) & mask] for shift, mask in _SHIFTS]
+    ).rstrip(".")
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def serialize_name(s: str) -> bytes:
     """Converts the string representation to an 8 byte Antelope name"""
-    a = bytearray(8)
-    bit = 63
-    for i in s:
-        c = char_to_symbol(ord(i))
-        if bit < 5:
-            c = c << 1
-        for j in range(4, -1, -1):
-            if bit >= 0:
-                a[bit // 8] |= ((c >> j) & 1) << (bit % 8)
-                bit -= 1
-    return a
-
-
-def deserialize_name(v: bytes):
+    return _UINT64.pack(name_to_uint64(s))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _deserialize_name(v: bytes) -> str:
+    return uint64_to_name(_UINT64.unpack(v)[0])
+
+
+def deserialize_name(v: bytes) -> str:
     """Converts an Antelope name (8 bytes) to string"""
-    result = ""
-    bit = 63
-    while bit >= 0:
-        c = 0
-        for _ in range(0, 5):
-            if bit >= 0:
-                c = (c << 1) | ((v[bit // 8] >> bit % 8) & 1)
-                bit -= 1
-        result += symbol_to_char(c)
-    result = result.rstrip(".")
-    return result
+    # memoryviews are copied so the cache doesn't hold on to the whole buffer
+    return _deserialize_name(bytes(v))
@@ -0,0 +1,98 @@
+"""reader.py
+
+Cursor over serialized Antelope data, used by deserializers to read values
+without copying the underlying buffer"""
+
+import struct
+from typing import Any, Tuple, Union
+
+from antelopy.exceptions.exceptions import DeserializationError
+
+
+class ByteReader:
+    """Read cursor over a memoryview of serialized data"""
+
+    __slots__ = ("view", "pos")
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview], pos: int = 0):
+        """Read cursor over a memoryview of serialized data
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): the serialized data
+            pos (int): position to start reading from
+        """
+        self.view = data if isinstance(data, memoryview) else memoryview(data)
+        self.pos = pos
+
+    @property
+    def remaining(self) -> int:
+        """Number of bytes left to read"""
+        return len(self.view) - self.pos
+
+    def read(self, n: int) -> memoryview:
+        """Reads n bytes as a memoryview slice
+
+        Args:
+            n (int): number of bytes
+
+        Raises:
+            DeserializationError: Raised when there aren't enough bytes left
+
+        Returns:
+            memoryview: the bytes read, sharing memory with the source
+        """
+        start = self.pos
+        end = start + n
+        if end > len(self.view):
+            raise DeserializationError(
+                f"Tried to read {n} bytes at position {start}, "
+                f"but only {len(self.view) - start} remain"
+            )
+        self.pos = end
+        return self.view[start:end]
+
+    def read_byte(self) -> int:
+        """Reads a single byte as an int"""
+        pos = self.pos
+        if pos >= len(self.view):
+            raise DeserializationError(f"Tried to read past the end at position {pos}")
+        self.pos = pos + 1
+        return self.view[pos]
+
+    def read_varuint(self) -> int:
+        """Reads an unsigned LEB128 varint"""
+        view = self.view
+        size = len(view)
+        pos = self.pos
+        result = 0
+        shift = 0
+        while True:
+            if pos >= size:
+                raise DeserializationError("Varint runs past the end of the data")
+            byte = view[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+            shift += 7
+        self.pos = pos
+        return result
+
+    def unpack(self, packer: struct.Struct) -> Tuple[Any, ...]:
+        """Unpacks fixed-width values with a precompiled struct.Struct
+
+        Args:
+            packer (struct.Struct): the packer
+
+        Returns:
+            Tuple[Any, ...]: the unpacked values
+        """
+        pos = self.pos
+        end = pos + packer.size
+        if end > len(self.view):
+            raise DeserializationError(
+                f"Tried to read {packer.size} bytes at position {pos}, "
+                f"but only {len(self.view) - pos} remain"
+            )
+        self.pos = end
+        return packer.unpack_from(self.view, pos)
@@ -15,16 +15,22 @@ def serialize_varint(n: int) -> bytes:
     Returns:
         bytes: encoded int
     """
-    buf = b""
-    while True:
-        chunk = n & 0x7F
+    buf = bytearray()
+    write_varint(buf, n)
+    return bytes(buf)
+
+
+def write_varint(buf: bytearray, n: int) -> None:
+    """Appends a positive integer to a buffer as a varint
+
+    Args:
+        buf (bytearray): the output buffer
+        n (int): the integer to encode
+    """
+    while n > 0x7F:
+        buf.append((n & 0x7F) | 0x80)
         n >>= 7
-        if n:
-            buf += (chunk | 0x80).to_bytes(1, "little")
-        else:
-            buf += chunk.to_bytes(1, "little")
-            break
-    return buf
+    buf.append(n)
 
 
 # Stream conversion isn't needed for this project, and iterating
@@ -0,0 +1,117 @@
+"""vectors.py
+
+Bulk encoding of numeric vectors such as `uint64[]`. The values are written
+as one contiguous little-endian block after the varuint length, and decoded
+into an `array.array` that shares none of the per-element Python overhead.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any, Union
+
+from antelopy.serializers import varints
+from antelopy.serializers.reader import ByteReader
+from antelopy.types.types import NUMERIC_FORMATS
+
+# struct format of each numeric type that can be bulk encoded
+VECTOR_FORMATS = NUMERIC_FORMATS
+
+_BIG_ENDIAN = sys.byteorder == "big"
+# largest finite float32
+_FLOAT32_MAX = struct.unpack("<f", b"\xff\xff\x7f\x7f")[0]
+
+
+def _array_typecode(fmt: str) -> str:
+    """Finds the array typecode with the same size and signedness as a struct
+    format character, e.g. `L` or `Q` for `Q` depending on the platform"""
+    if fmt in "fd":
+        return fmt
+    size = struct.calcsize(fmt)
+    candidates = "bhilq" if fmt.islower() else "BHILQ"
+    return next(c for c in candidates if array(c).itemsize == size)
+
+
+ARRAY_TYPECODES = {fmt: _array_typecode(fmt) for fmt in VECTOR_FORMATS.values()}
+
+
+def numpy_fits(fmt: str, values: Any) -> bool:
+    """Checks that a NumPy array can be cast to a struct format without
+    wrapping, truncating or overflowing, where `struct.pack` raises instead
+
+    Args:
+        fmt (str): the struct format character, e.g. `Q`
+        values (Any): the NumPy array
+
+    Returns:
+        bool: whether the cast keeps every value
+    """
+    kind = values.dtype.kind
+    if kind not in "biuf" or (kind == "f" and fmt not in "fd"):
+        return False
+    if not values.size:
+        return True
+    if fmt not in "fd":
+        bits = struct.calcsize(fmt) * 8
+        if fmt.islower():
+            low, high = -(1 << bits - 1), (1 << bits - 1) - 1
+        else:
+            low, high = 0, (1 << bits) - 1
+        return low <= int(values.min()) and int(values.max()) <= high
+    if fmt == "f" and kind == "f":
+        magnitude = abs(values)
+        return not ((magnitude > _FLOAT32_MAX) & (magnitude != float("inf"))).any()
+    return True
+
+
+def _block(fmt: str, values: Any) -> bytes:
+    if isinstance(values, array) and values.typecode == ARRAY_TYPECODES[fmt]:
+        if _BIG_ENDIAN:
+            values = array(values.typecode, values)
+            values.byteswap()
+        return values.tobytes()
+    if hasattr(values, "__array_interface__"):
+        # NumPy arrays, converted without importing NumPy here
+        if numpy_fits(fmt, values):
+            return values.astype("<" + fmt, copy=False).tobytes()
+        # let struct raise the same error it would for a list
+        values = values.tolist()
+    return struct.pack(f"<{len(values)}{fmt}", *values)
+
+
+def write_vector(buf: bytearray, fmt: str, values: Any) -> None:
+    """Appends a numeric vector to the buffer as a varuint length followed by
+    a little-endian block. Nothing is written when the values can't be packed.
+
+    Args:
+        buf (bytearray): the output buffer
+        fmt (str): struct format character of the item type, e.g. `Q`
+        values (Any): list, array.array or NumPy array of numbers
+
+    Raises:
+        struct.error: Raised when a value can't be packed with the format,
+            e.g. a number given as str or out of range. NumPy arrays are
+            checked the same way instead of wrapping around when cast.
+        OverflowError: Raised when a float is too large for `f`
+    """
+    block = _block(fmt, values)
+    varints.write_varint(buf, len(values))
+    buf += block
+
+
+def read_vector(reader: ByteReader, fmt: str) -> array:
+    """Reads a numeric vector from a serialized data cursor
+
+    Args:
+        reader (ByteReader): the cursor
+        fmt (str): struct format character of the item type, e.g. `Q`
+
+    Returns:
+        array: the values
+    """
+    values = array(ARRAY_TYPECODES[fmt])
+    n = reader.read_varuint()
+    values.frombytes(reader.read(n * values.itemsize))
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
@@ -1,19 +1,23 @@
 """abi.py
 Contains the Abi type classes for ABI interactions"""
 
-import logging
-from typing import Any, List, Union
+from typing import Any, Dict, List, Mapping, Sequence, TypeVar, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
-from antelopy.exceptions.exceptions import ActionMissingFieldError, SerializationError
-from antelopy.serializers import varints
-from antelopy.types.serializables import (
-    SERIALIZER_MAP,
-    BasicSerializable,
-    ListSerializable,
-)
-from antelopy.types.types import DEFAULT_TYPES
+from antelopy.serializers.reader import ByteReader
+from antelopy.types import columnar
+from antelopy.types.compiler import AbiCompiler, StructPlan, field_type
+
+T = TypeVar("T")
+
+
+def _index(items: List[T], key: str) -> Dict[str, T]:
+    """Indexes a list of ABI entries by an attribute, keeping the first match"""
+    index: Dict[str, T] = {}
+    for item in items:
+        index.setdefault(getattr(item, key), item)
+    return index
 
 
 class AbiBaseClass(BaseModel):
@@ -88,6 +92,28 @@ class AbiVariants(AbiBaseClass):
 
     name: str
     types: List[str]
+    _type_indexes: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        for i, t in enumerate(self.types):
+            self._type_indexes.setdefault(t, i)
+
+    @property
+    def type_indexes(self) -> Dict[str, int]:
+        """Map of each variant type to its index in the variant"""
+        return self._type_indexes
+
+    def type_index(self, variant_type: str) -> Union[int, None]:
+        """Gets the index of a type within the variant
+
+        Args:
+            variant_type (str): the type
+
+        Returns:
+            int | None: the index if the type is part of the variant, otherwise None
+        """
+        return self._type_indexes.get(variant_type)
 
 
 class Abi(AbiBaseClass):
@@ -103,6 +129,11 @@ class Abi(AbiBaseClass):
     error_messages: List[AbiErrorMessages] = []
     abi_extensions: List[AbiExtensions] = []
     variants: List[AbiVariants] = []
+    _actions_by_name: Dict[str, AbiAction] = PrivateAttr(default_factory=dict)
+    _types_by_name: Dict[str, AbiType] = PrivateAttr(default_factory=dict)
+    _structs_by_name: Dict[str, AbiStruct] = PrivateAttr(default_factory=dict)
+    _variants_by_name: Dict[str, AbiVariants] = PrivateAttr(default_factory=dict)
+    _compiler: AbiCompiler = PrivateAttr()
 
     def __init__(self, name: str, **data: Any):
         """Pydantic model represenation of an ABI for serialization
@@ -112,11 +143,15 @@ class Abi(AbiBaseClass):
         """
         super().__init__(**data)
         self.name = name
+        self._actions_by_name = _index(self.actions, "name")
+        self._types_by_name = _index(self.types, "new_type_name")
+        self._structs_by_name = _index(self.structs, "name")
+        self._variants_by_name = _index(self.variants, "name")
         for action in self.actions:
-            for s in self.structs:
-                if action.name == s.name:
-                    action.fields = s.fields
-                    break
+            if s := self._structs_by_name.get(action.name):
+                action.fields = s.fields
+        self._compiler = AbiCompiler(self)
+        self._compiler.compile()
 
     def get_action(self, action_name: str) -> Union[AbiAction, None]:
         """Gets an AbiAction from the ABI
@@ -127,10 +162,7 @@ class Abi(AbiBaseClass):
         Returns:
             AbiAction | None: the AbiAction if found, otherwise None
         """
-        actions = [a for a in self.actions if a.name == action_name]
-        if actions:
-            return actions[0]
-        return None
+        return self._actions_by_name.get(action_name)
 
     def find_type(self, name: str) -> Union[AbiType, None]:
         """Gets an AbiType from the ABI
@@ -141,10 +173,7 @@ class Abi(AbiBaseClass):
         Returns:
             AbiType | None: the AbiType if found, otherwise None
         """
-        type_options = [nt for nt in self.types if name == nt.new_type_name]
-        if type_options:
-            return type_options[0]
-        return None
+        return self._types_by_name.get(name)
 
     def find_struct(self, name: str) -> Union[AbiStruct, None]:
         """Gets an AbiStruct from the ABI
@@ -155,10 +184,7 @@ class Abi(AbiBaseClass):
         Returns:
             AbiStruct | None: the AbiStruct if found, otherwise None
         """
-        struct_options = [s for s in self.structs if name == s.name]
-        if struct_options:
-            return struct_options[0]
-        return None
+        return self._structs_by_name.get(name)
 
     def find_variant(self, name: str) -> Union[AbiVariants, None]:
         """Gets an AbiVariant from the ABI
@@ -169,10 +195,7 @@ class Abi(AbiBaseClass):
         Returns:
             AbiVariants | None: the AbiVariant if found, otherwise None
         """
-        variant_options = [v for v in self.variants if name == v.name]
-        if variant_options:
-            return variant_options[0]
-        return None
+        return self._variants_by_name.get(name)
 
     # Note: Function name is `serialize` for compatability with v0.1.6
     def serialize(self, action: Union[AbiAction, AbiStruct], data: Any) -> bytes:
@@ -190,17 +213,22 @@ class Abi(AbiBaseClass):
         Returns:
             bytes: the serialized data
         """
-        buf = b""
-        for field in action.fields:
-            value = data.get(field.name)
-            if value is None:
-                if field.optional:
-                    continue
-                raise ActionMissingFieldError(
-                    f"Action {action.name} is missing field {field.name}"
-                )
-            buf += self.serialize_field(field, value)
-        return buf
+        buf = bytearray()
+        self.get_plan(action).encode(buf, data)
+        return bytes(buf)
+
+    def serialize_into(
+        self, buf: bytearray, action: Union[AbiAction, AbiStruct], data: Any
+    ) -> None:
+        """Appends a serialized action or struct to a shared buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            action (Union[AbiAction, AbiStruct]): The AbiAction or AbiStruct
+                that should be used to serialize the data
+            data (Any): the data to be serialized, normally `dict[str,Any]`
+        """
+        self.get_plan(action).encode(buf, data)
 
     def serialize_field(self, field: AbiStructField, value: Any) -> bytes:
         """Serializes a field's data to bytes
@@ -216,61 +244,116 @@ class Abi(AbiBaseClass):
         Returns:
             bytes: the serialized value
         """
-        if field.type not in DEFAULT_TYPES:
-            # handle custom types
-            if t := self.find_type(field.type):
-                logging.debug("%s uses internal type %s", field.type, t.type)
-                new_field = AbiStructField(
-                    name=t.new_type_name, type=t.type, is_list=t.is_list
-                )
-                if field.is_list:
-                    serialized = ListSerializable(
-                        [
-                            self.serialize_field(new_field, list_val)
-                            for list_val in value
-                        ],
-                        serialized=True,
-                    ).serialize()
-                else:
-                    serialized = self.serialize_field(new_field, value)
-                return serialized
-            # handle custom structs
-            if s := self.find_struct(field.type):
-                logging.debug("%s uses internal struct %s", field.type, s.name)
-                if field.is_list:
-                    serialized = ListSerializable(
-                        [self.serialize(s, list_val) for list_val in value],
-                        serialized=True,
-                    ).serialize()
-                else:
-                    serialized = self.serialize(s, value)
-                return serialized
-            if v := self.find_variant(field.type):
-                # handle custom variants
-                logging.debug("%s uses internal variant %s", field.type, v.name)
-                if field.is_list:
-                    return ListSerializable(
-                        [
-                            self.serialize_field(
-                                AbiStructField(
-                                    name=v.name, type=list_val[0], is_list=field.is_list
-                                ),
-                                list_val,
-                            )
-                            for list_val in value
-                        ],
-                        serialized=True,
-                    ).serialize()
-                variant_type, new_value = value
-                buf = varints.serialize_varint(v.types.index(variant_type))
-                new_field = AbiStructField(
-                    name=v.name, type=variant_type, is_list=field.is_list
-                )
-                return buf + self.serialize_field(new_field, new_value)
-            raise SerializationError(f"Field {field.name} couldn't be serialized.")
-        if field.is_list:
-            serializable = ListSerializable(value, field.type)
-            return serializable.serialize()
-
-        serializable = BasicSerializable(value, SERIALIZER_MAP[field.type])
-        return serializable.serialize()
+        buf = bytearray()
+        self._compiler.encoder(field_type(field))(buf, value)
+        return bytes(buf)
+
+    def serialize_columns(
+        self,
+        action: Union[AbiAction, AbiStruct],
+        columns: Mapping[str, Any],
+        constants: Union[Mapping[str, Any], None] = None,
+    ) -> List[bytes]:
+        """Serializes many instances of an action or struct from columns of
+        field values. Requires NumPy.
+
+        Args:
+            action (Union[AbiAction, AbiStruct]): The AbiAction or AbiStruct
+                that should be used to serialize the data
+            columns (Mapping[str, Any]): field name to a NumPy array, sequence or
+                AssetColumn holding one value per instance
+            constants (Mapping[str, Any], optional): field name to a value shared
+                by every instance, e.g. a memo
+
+        Returns:
+            List[bytes]: the serialized data of each instance
+        """
+        plan = self.get_plan(action)
+        return columnar.serialize_columns(plan, plan.types, columns, constants)
+
+    def deserialize_columns(
+        self, action: Union[AbiAction, AbiStruct], rows: Sequence[bytes]
+    ) -> Dict[str, Any]:
+        """Deserializes many instances of an action or struct into columns of
+        field values, e.g. the rows of a table scan. Requires NumPy.
+
+        Args:
+            action (Union[AbiAction, AbiStruct]): The AbiAction or AbiStruct
+                that should be used to deserialize the data
+            rows (Sequence[bytes]): the serialized data of each instance
+
+        Raises:
+            DeserializationError: Raised when a row couldn't be deserialized
+
+        Returns:
+            Dict[str, Any]: field name to a NumPy array (numeric fields of fixed
+                width structs) or a list of values
+        """
+        plan = self.get_plan(action)
+        return columnar.deserialize_columns(plan, plan.types, rows)
+
+    def deserialize(
+        self,
+        action: Union[AbiAction, AbiStruct],
+        data: Union[bytes, bytearray, memoryview, ByteReader],
+    ) -> Dict[str, Any]:
+        """Deserializes an action or struct from bytes
+
+        Args:
+            action (Union[AbiAction, AbiStruct]): The AbiAction or AbiStruct
+                that should be used to deserialize the data
+            data (Union[bytes, bytearray, memoryview, ByteReader]): the serialized
+                data, or a cursor positioned at the start of it
+
+        Raises:
+            DeserializationError: Raised when the data couldn't be deserialized
+
+        Returns:
+            Dict[str, Any]: the deserialized data
+        """
+        reader = data if isinstance(data, ByteReader) else ByteReader(data)
+        return self.get_plan(action).decode(reader)
+
+    def deserialize_field(
+        self,
+        field: AbiStructField,
+        data: Union[bytes, bytearray, memoryview, ByteReader],
+    ) -> Any:
+        """Deserializes a field's data from bytes
+
+        Args:
+            field (AbiStructField): The field that should be used
+                as a guide to deserialize the value
+            data (Union[bytes, bytearray, memoryview, ByteReader]): the serialized
+                data, or a cursor positioned at the start of it
+
+        Raises:
+            DeserializationError: Raised when the field couldn't be deserialized
+
+        Returns:
+            Any: the deserialized value
+        """
+        reader = data if isinstance(data, ByteReader) else ByteReader(data)
+        return self._compiler.decoder(field_type(field))(reader)
+
+    def get_plan(self, action: Union[AbiAction, AbiStruct]) -> StructPlan:
+        """Gets the compiled serialization plan of an action or struct
+
+        Args:
+            action (Union[AbiAction, AbiStruct]): the AbiAction or AbiStruct
+
+        Returns:
+            StructPlan: the compiled plan
+        """
+        name = action.type if isinstance(action, AbiAction) else action.name
+        plan = self._compiler.plans.get(name)
+        if plan is None:
+            # actions or structs that aren't part of this ABI
+            plan = StructPlan(action.name)
+            plan.fields = self._compiler.compile_fields(action.fields)
+            plan.decoders = self._compiler.compile_field_decoders(action.fields)
+            plan.types = [
+                self._compiler.resolve_type(field_type(f)) for f in action.fields
+            ]
+            plan.coalesce()
+        return plan
@@ -0,0 +1,123 @@
+"""abi_def.py
+
+Binary form of ABIs (`abi_def`), as stored on chain and returned by
+`/v1/chain/get_raw_abi`. It is encoded with antelopy's own compiled plans,
+from an ABI describing the ABI format itself."""
+
+import copy
+import hashlib
+from typing import Any, Dict, Union
+
+from antelopy.types.abi import Abi
+
+# Fields of abi_def, in order, with the value used when an ABI leaves one out
+ABI_DEF_DEFAULTS = {
+    "version": "eosio::abi/1.2",
+    "types": [],
+    "structs": [],
+    "actions": [],
+    "tables": [],
+    "ricardian_clauses": [],
+    "error_messages": [],
+    "abi_extensions": [],
+    "variants": [],
+    "action_results": [],
+}
+
+
+def _struct(name: str, *fields: str) -> Dict[str, Any]:
+    pairs = [f.split(":") for f in fields]
+    return {
+        "name": name,
+        "base": "",
+        "fields": [{"name": n, "type": t} for n, t in pairs],
+    }
+
+
+ABI_DEF = Abi(
+    name="abi_def",
+    structs=[
+        _struct("type_def", "new_type_name:string", "type:string"),
+        _struct("field_def", "name:string", "type:string"),
+        _struct("struct_def", "name:string", "base:string", "fields:field_def[]"),
+        _struct("action_def", "name:name", "type:string", "ricardian_contract:string"),
+        _struct(
+            "table_def",
+            "name:name",
+            "index_type:string",
+            "key_names:string[]",
+            "key_types:string[]",
+            "type:string",
+        ),
+        _struct("clause_pair", "id:string", "body:string"),
+        _struct("error_message", "error_code:uint64", "error_msg:string"),
+        _struct("extensions_entry", "tag:uint16", "value:bytes"),
+        _struct("variant_def", "name:string", "types:string[]"),
+        _struct("action_result_def", "name:name", "result_type:string"),
+        _struct(
+            "abi_def",
+            "version:string",
+            "types:type_def[]",
+            "structs:struct_def[]",
+            "actions:action_def[]",
+            "tables:table_def[]",
+            "ricardian_clauses:clause_pair[]",
+            "error_messages:error_message[]",
+            "abi_extensions:extensions_entry[]",
+            "variants:variant_def[]$",
+            "action_results:action_result_def[]$",
+        ),
+    ],
+)
+_ABI_DEF_STRUCT = ABI_DEF.find_struct("abi_def")
+
+
+def pack_abi(raw_abi: Dict[str, Any]) -> bytes:
+    """Encodes a JSON ABI, as returned by `/v1/chain/get_abi`, to binary
+
+    Args:
+        raw_abi (Dict[str, Any]): the ABI
+
+    Returns:
+        bytes: the binary ABI
+    """
+    data = {key: raw_abi.get(key, default) for key, default in ABI_DEF_DEFAULTS.items()}
+    data["abi_extensions"] = [
+        {**e, "value": bytes.fromhex(e["value"])} if isinstance(e["value"], str) else e
+        for e in data["abi_extensions"]
+    ]
+    return ABI_DEF.serialize(_ABI_DEF_STRUCT, data)
+
+
+def unpack_abi(data: Union[bytes, bytearray, memoryview]) -> Dict[str, Any]:
+    """Decodes a binary ABI to its JSON form
+
+    Args:
+        data (Union[bytes, bytearray, memoryview]): the binary ABI
+
+    Raises:
+        DeserializationError: Raised when the data isn't a valid binary ABI
+
+    Returns:
+        Dict[str, Any]: the ABI
+    """
+    raw_abi = ABI_DEF.deserialize(_ABI_DEF_STRUCT, data)
+    for key, default in ABI_DEF_DEFAULTS.items():
+        # copied, as the decoded ABI may be kept and changed
+        raw_abi.setdefault(key, copy.copy(default))
+    raw_abi["abi_extensions"] = [
+        {**e, "value": e["value"].hex()} for e in raw_abi["abi_extensions"]
+    ]
+    return raw_abi
+
+
+def abi_hash(data: Union[bytes, bytearray, memoryview]) -> str:
+    """Hashes a binary ABI the same way as the chain's `abi_hash`
+
+    Args:
+        data (Union[bytes, bytearray, memoryview]): the binary ABI
+
+    Returns:
+        str: the hex-encoded sha256 digest
+    """
+    return hashlib.sha256(data).hexdigest()
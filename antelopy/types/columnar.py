@@ -0,0 +1,321 @@
+"""columnar.py
+
+Columnar (struct-of-arrays) serialization and deserialization of many
+instances of one action or struct. Fixed-width fields are packed and unpacked
+with vectorized NumPy dtype views, and only the variable-width fields are
+handled row by row.
+
+NumPy is an optional dependency: `pip install antelopy[numpy]`
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Sequence, Union
+
+from antelopy.exceptions.exceptions import ActionMissingFieldError, SerializationError
+from antelopy.serializers import assets, name_arrays
+from antelopy.serializers.reader import ByteReader
+from antelopy.serializers.vectors import numpy_fits
+from antelopy.types.compiler import StructPlan
+from antelopy.types.types import NUMERIC_FORMATS
+
+# imported on first use, see _require_numpy
+np: Any = None
+
+if TYPE_CHECKING:
+    from antelopy.types.compiler import Encoder
+
+# Types that can be written straight from a NumPy array of the given dtype
+NUMERIC_DTYPES = {
+    "bool": "u1",
+    **{name: "<" + fmt for name, fmt in NUMERIC_FORMATS.items()},
+}
+
+# Types that are always serialized to the same number of bytes
+FIXED_WIDTHS = {
+    "name": 8,
+    "symbol": 8,
+    "symbol_code": 8,
+    "asset": 16,
+    "checksum160": 20,
+    "checksum256": 32,
+    "checksum512": 64,
+    "int128": 16,
+    "uint128": 16,
+    "time_point": 8,
+    "time_point_sec": 4,
+}
+
+# Time points given as integer arrays are stored as-is
+TIME_POINT_DTYPES = {"time_point": "<u8", "time_point_sec": "<u4"}
+
+
+class AssetColumn:
+    """An asset column given as integer amounts and a symbol
+
+    e.g. `AssetColumn([100000000, 250000000], "8,WAX")` for 1 WAX and 2.5 WAX
+    """
+
+    def __init__(self, amounts: Any, symbol: str):
+        """An asset column given as integer amounts and a symbol
+
+        Args:
+            amounts (Any): NumPy array or sequence of amounts in the smallest unit
+            symbol (str): the symbol shared by every row, e.g. `8,WAX`
+        """
+        self.amounts = amounts
+        self.symbol = symbol
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+
+def _require_numpy() -> None:
+    global np
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Columnar serialization requires NumPy. "
+            "Install it with `pip install antelopy[numpy]`"
+        ) from None
+    np = numpy
+
+
+def _is_integer_array(column: Any) -> bool:
+    return isinstance(column, np.ndarray) and column.dtype.kind in "iu"
+
+
+def _encode_rows(encoder: Encoder, column: Sequence[Any]) -> List[bytes]:
+    """Encodes a column value by value with the compiled encoder"""
+    rows = []
+    for value in column:
+        buf = bytearray()
+        encoder(buf, value)
+        rows.append(bytes(buf))
+    return rows
+
+
+def _encode_unique(encoder: Encoder, column: Sequence[Any]) -> bytes:
+    """Encodes a fixed-width column, encoding each distinct value only once"""
+    encoded: Dict[Any, bytes] = {}
+    parts = []
+    for value in column:
+        b = encoded.get(value)
+        if b is None:
+            buf = bytearray()
+            encoder(buf, value)
+            b = encoded[value] = bytes(buf)
+        parts.append(b)
+    return b"".join(parts)
+
+
+def _name_block(column: Any) -> Any:
+    if _is_integer_array(column):
+        return np.ascontiguousarray(column, dtype="<u8")
+    return name_arrays.encode_names(column).astype("<u8")
+
+
+def _asset_block(column: Any, encoder: Encoder, rows: int) -> Any:
+    if isinstance(column, AssetColumn):
+        precision, symbol_name = column.symbol.split(",")
+        block = np.empty((rows, 16), dtype=np.uint8)
+        amounts = np.asarray(column.amounts)
+        if amounts.size and (
+            amounts.dtype.kind not in "iu" or not numpy_fits("q", amounts)
+        ):
+            raise SerializationError(
+                f"Asset amounts must be int64 integers, got {amounts.dtype} values"
+            )
+        amounts = amounts.astype("<i8", copy=False)
+        block[:, :8] = amounts.view(np.uint8).reshape(rows, 8)
+        symbol = assets.serialize_symbol(int(precision), symbol_name.strip())
+        block[:, 8:] = np.frombuffer(symbol, dtype=np.uint8)
+        return block
+    return np.frombuffer(_encode_unique(encoder, column), dtype=np.uint8)
+
+
+def _numeric_block(type_name: str, column: Any, encoder: Encoder) -> Any:
+    values = np.asarray(column)
+    if not values.size:
+        return values.astype(NUMERIC_DTYPES[type_name])
+    if values.dtype.kind not in "biuf":
+        # e.g. numbers given as strings, converted like serialize_data does
+        return np.frombuffer(_encode_unique(encoder, column), dtype=np.uint8)
+    fmt = "B" if type_name == "bool" else NUMERIC_FORMATS[type_name]
+    if not numpy_fits(fmt, values) or (type_name == "bool" and values.max() > 1):
+        # casting would wrap or truncate, where serialize_data raises
+        raise SerializationError(
+            f"Column of {values.dtype} values doesn't fit type {type_name}"
+        )
+    return values.astype(NUMERIC_DTYPES[type_name], copy=False)
+
+
+def _fixed_block(type_name: str, column: Any, encoder: Encoder, rows: int) -> Any:
+    """Packs a fixed-width column into a (rows, width) uint8 array"""
+    if type_name in NUMERIC_DTYPES:
+        block = _numeric_block(type_name, column, encoder)
+    elif type_name == "name":
+        block = _name_block(column)
+    elif type_name == "asset":
+        block = _asset_block(column, encoder, rows)
+    elif type_name in TIME_POINT_DTYPES and _is_integer_array(column):
+        block = np.asarray(column, dtype=TIME_POINT_DTYPES[type_name])
+    else:
+        block = np.frombuffer(_encode_unique(encoder, column), dtype=np.uint8)
+    return np.ascontiguousarray(block).view(np.uint8).reshape(rows, -1)
+
+
+def serialize_columns(
+    plan: StructPlan,
+    field_types: List[str],
+    columns: Mapping[str, Any],
+    constants: Union[Mapping[str, Any], None] = None,
+) -> List[bytes]:
+    """Serializes N instances of a struct from columns of field values
+
+    Args:
+        plan (StructPlan): the compiled plan of the struct
+        field_types (List[str]): resolved type of each field in the plan
+        columns (Mapping[str, Any]): field name to a NumPy array, sequence or
+            AssetColumn holding one value per row
+        constants (Mapping[str, Any], optional): field name to a value shared
+            by every row, e.g. a memo
+
+    Raises:
+        ValueError: Raised when there are no columns, or they have different lengths
+        ActionMissingFieldError: Raised when a required field has no column
+        SerializationError: Raised when a numeric column holds values that
+            don't fit its type, e.g. negative values for an unsigned field
+
+    Returns:
+        List[bytes]: the serialized data of each row
+    """
+    _require_numpy()
+    constants = constants or {}
+    lengths = {len(c) for c in columns.values()}
+    if len(lengths) != 1:
+        raise ValueError(
+            f"Expected at least one column, all the same length. Got {lengths}"
+        )
+    rows = lengths.pop()
+    if rows == 0:
+        return []
+
+    # Each segment is either a (rows, width) uint8 block of consecutive
+    # fixed-width fields, or a list of per-row bytes for a variable-width field
+    segments: List[Any] = []
+    fixed: List[Any] = []
+
+    def flush_fixed() -> None:
+        if fixed:
+            segments.append(np.hstack(fixed) if len(fixed) > 1 else fixed[0])
+            fixed.clear()
+
+    for (name, optional, nullable, encoder), type_name in zip(plan.fields, field_types):
+        if name in columns:
+            column = columns[name]
+            if type_name in NUMERIC_DTYPES or type_name in FIXED_WIDTHS:
+                fixed.append(_fixed_block(type_name, column, encoder, rows))
+            else:
+                flush_fixed()
+                segments.append(_encode_rows(encoder, column))
+            continue
+        value = constants.get(name)
+        if value is None and not nullable:
+            if optional:
+                continue
+            raise ActionMissingFieldError(f"Action {plan.name} is missing field {name}")
+        buf = bytearray()
+        encoder(buf, value)
+        if type_name in NUMERIC_DTYPES or type_name in FIXED_WIDTHS:
+            constant = np.frombuffer(bytes(buf), dtype=np.uint8)
+            fixed.append(np.broadcast_to(constant, (rows, len(constant))))
+        else:
+            flush_fixed()
+            segments.append(bytes(buf))
+    flush_fixed()
+
+    if len(segments) == 1 and not isinstance(segments[0], (list, bytes)):
+        block = segments[0]
+        data = block.tobytes()
+        width = block.shape[1]
+        return [data[i * width : (i + 1) * width] for i in range(rows)]
+
+    parts: List[Any] = []
+    for segment in segments:
+        if isinstance(segment, bytes):
+            parts.append([segment] * rows)
+        elif isinstance(segment, list):
+            parts.append(segment)
+        else:
+            data = segment.tobytes()
+            width = segment.shape[1]
+            parts.append([data[i * width : (i + 1) * width] for i in range(rows)])
+    return [b"".join(row) for row in zip(*parts)]
+
+
+def _fixed_columns(
+    plan: StructPlan, field_types: List[str], rows: Sequence[bytes]
+) -> Union[Dict[str, Any], None]:
+    """Unpacks rows of a struct that only has fixed-width fields, or returns
+    None when the struct or the rows don't allow it"""
+    widths = []
+    for type_name in field_types:
+        width = FIXED_WIDTHS.get(type_name)
+        if width is None and type_name in NUMERIC_DTYPES:
+            width = np.dtype(NUMERIC_DTYPES[type_name]).itemsize
+        if width is None:
+            return None
+        widths.append(width)
+    row_width = sum(widths)
+    if any(len(row) != row_width for row in rows):
+        return None
+    block = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), row_width)
+
+    columns: Dict[str, Any] = {}
+    offset = 0
+    for (name, _, decoder), type_name, width in zip(plan.decoders, field_types, widths):
+        cells = np.ascontiguousarray(block[:, offset : offset + width])
+        offset += width
+        if type_name in NUMERIC_DTYPES:
+            column = cells.view(NUMERIC_DTYPES[type_name]).ravel()
+            columns[name] = column.astype(bool) if type_name == "bool" else column
+        elif type_name == "name":
+            columns[name] = name_arrays.decode_names(cells.view("<u8").ravel())
+        else:
+            columns[name] = [decoder(ByteReader(cell.tobytes())) for cell in cells]
+    return columns
+
+
+def deserialize_columns(
+    plan: StructPlan, field_types: List[str], rows: Sequence[bytes]
+) -> Dict[str, Any]:
+    """Deserializes N instances of a struct into columns of field values
+
+    When every field is fixed-width, numeric fields are unpacked as NumPy
+    arrays and names are decoded as a whole column. Otherwise each row is
+    decoded with the compiled plan and the values are gathered into lists,
+    with None for binary extension fields that a row leaves out.
+
+    Args:
+        plan (StructPlan): the compiled plan of the struct
+        field_types (List[str]): resolved type of each field in the plan
+        rows (Sequence[bytes]): the serialized data of each instance
+
+    Raises:
+        DeserializationError: Raised when a row couldn't be deserialized
+
+    Returns:
+        Dict[str, Any]: field name to a NumPy array or list of values
+    """
+    _require_numpy()
+    columns = _fixed_columns(plan, field_types, rows)
+    if columns is not None:
+        return columns
+    decoded = [plan.decode(ByteReader(row)) for row in rows]
+    # binary extension fields missing from a row are None, so every column
+    # keeps one entry per row
+    return {name: [row.get(name) for row in decoded] for name, _, _ in plan.decoders}
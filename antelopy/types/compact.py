@@ -0,0 +1,191 @@
+"""compact.py
+
+Compact form of an ABI for long-running processes holding many contracts.
+Only the compiled serialization plans and the binary `abi_def` are kept.
+Ricardian contracts and clauses are dropped, and the JSON form is regenerated
+from the binary form when needed."""
+
+from typing import Any, Dict, List, Mapping, Sequence, Union
+
+from antelopy.serializers.reader import ByteReader
+from antelopy.types import columnar
+from antelopy.types.abi import Abi
+from antelopy.types.abi_def import pack_abi, unpack_abi
+from antelopy.types.compiler import StructPlan
+
+
+def strip_ricardian(raw_abi: Dict[str, Any]) -> Dict[str, Any]:
+    """Copies a JSON ABI without its ricardian contracts and clauses
+
+    Args:
+        raw_abi (Dict[str, Any]): the ABI
+
+    Returns:
+        Dict[str, Any]: the ABI without ricardian text
+    """
+    stripped = dict(raw_abi)
+    stripped["actions"] = [
+        {**action, "ricardian_contract": ""} for action in raw_abi.get("actions", [])
+    ]
+    stripped["ricardian_clauses"] = []
+    return stripped
+
+
+class CompactAction:
+    """An action of a CompactAbi"""
+
+    __slots__ = ("name", "type")
+
+    def __init__(self, name: str, type_name: str):
+        self.name = name
+        self.type = type_name
+
+    def __repr__(self) -> str:
+        return f"CompactAction(name={self.name!r}, type={self.type!r})"
+
+
+class CompactAbi:
+    """ABI reduced to its compiled action plans and binary form"""
+
+    __slots__ = ("name", "packed", "_actions", "_plans")
+
+    def __init__(self, name: str, raw_abi: Dict[str, Any]):
+        """ABI reduced to its compiled action plans and binary form
+
+        Args:
+            name (str): name of the ABI account
+            raw_abi (Dict[str, Any]): the JSON ABI. Ricardian text is dropped.
+        """
+        stripped = strip_ricardian(raw_abi)
+        # the full model is only needed to compile the plans
+        abi = Abi(name=name, **stripped)
+        self.name = name
+        self.packed = pack_abi(stripped)
+        self._actions: Dict[str, CompactAction] = {}
+        self._plans: Dict[str, StructPlan] = {}
+        for action in abi.actions:
+            if action.name not in self._actions:
+                self._actions[action.name] = CompactAction(action.name, action.type)
+                self._plans[action.name] = abi.get_plan(action)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Regenerates the JSON form of the ABI, without ricardian text
+
+        Returns:
+            Dict[str, Any]: the ABI
+        """
+        return unpack_abi(self.packed)
+
+    @property
+    def actions(self) -> List[CompactAction]:
+        """The actions of the ABI"""
+        return list(self._actions.values())
+
+    def get_action(self, action_name: str) -> Union[CompactAction, None]:
+        """Gets an action from the ABI
+
+        Args:
+            action_name (str): the name of the action
+
+        Returns:
+            CompactAction | None: the action if found, otherwise None
+        """
+        return self._actions.get(action_name)
+
+    def get_plan(self, action: CompactAction) -> StructPlan:
+        """Gets the compiled serialization plan of an action
+
+        Args:
+            action (CompactAction): the action
+
+        Returns:
+            StructPlan: the compiled plan
+        """
+        return self._plans[action.name]
+
+    def serialize(self, action: CompactAction, data: Any) -> bytes:
+        """Serializes an action to bytes
+
+        Args:
+            action (CompactAction): the action
+            data (Any): the data to be serialized, normally `dict[str,Any]`
+
+        Raises:
+            ActionMissingFieldError: Data is missing a field specified in
+                the serialization template
+
+        Returns:
+            bytes: the serialized data
+        """
+        buf = bytearray()
+        self._plans[action.name].encode(buf, data)
+        return bytes(buf)
+
+    def serialize_into(self, buf: bytearray, action: CompactAction, data: Any) -> None:
+        """Appends a serialized action to a shared buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            action (CompactAction): the action
+            data (Any): the data to be serialized, normally `dict[str,Any]`
+        """
+        self._plans[action.name].encode(buf, data)
+
+    def deserialize(
+        self,
+        action: CompactAction,
+        data: Union[bytes, bytearray, memoryview, ByteReader],
+    ) -> Dict[str, Any]:
+        """Deserializes an action from bytes
+
+        Args:
+            action (CompactAction): the action
+            data (Union[bytes, bytearray, memoryview, ByteReader]): the serialized
+                data, or a cursor positioned at the start of it
+
+        Raises:
+            DeserializationError: Raised when the data couldn't be deserialized
+
+        Returns:
+            Dict[str, Any]: the deserialized data
+        """
+        reader = data if isinstance(data, ByteReader) else ByteReader(data)
+        return self._plans[action.name].decode(reader)
+
+    def serialize_columns(
+        self,
+        action: CompactAction,
+        columns: Mapping[str, Any],
+        constants: Union[Mapping[str, Any], None] = None,
+    ) -> List[bytes]:
+        """Serializes many instances of an action from columns of field values.
+        Requires NumPy.
+
+        Args:
+            action (CompactAction): the action
+            columns (Mapping[str, Any]): field name to a NumPy array, sequence or
+                AssetColumn holding one value per instance
+            constants (Mapping[str, Any], optional): field name to a value shared
+                by every instance
+
+        Returns:
+            List[bytes]: the serialized data of each instance
+        """
+        plan = self._plans[action.name]
+        return columnar.serialize_columns(plan, plan.types, columns, constants)
+
+    def deserialize_columns(
+        self, action: CompactAction, rows: Sequence[bytes]
+    ) -> Dict[str, Any]:
+        """Deserializes many instances of an action into columns of field values.
+        Requires NumPy.
+
+        Args:
+            action (CompactAction): the action
+            rows (Sequence[bytes]): the serialized data of each instance
+
+        Returns:
+            Dict[str, Any]: field name to a NumPy array or list of values
+        """
+        plan = self._plans[action.name]
+        return columnar.deserialize_columns(plan, plan.types, rows)
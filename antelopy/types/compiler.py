@@ -0,0 +1,501 @@
+"""compiler.py
+
+Compiles the structs and actions of an Abi into serialization plans, so that
+type resolution happens once when the ABI is loaded instead of on every call.
+Each plan holds both the encoders and the decoders of its fields, and runs of
+consecutive fixed-width fields are packed with a single struct.Struct."""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from antelopy.exceptions.exceptions import (
+    ActionMissingFieldError,
+    DeserializationError,
+    SerializationError,
+)
+from antelopy.serializers import names, varints, vectors
+from antelopy.serializers.reader import ByteReader
+from antelopy.types.serializables import SERIALIZER_MAP
+from antelopy.types.types import DEFAULT_TYPES, NUMERIC_FORMATS
+
+if TYPE_CHECKING:
+    from antelopy.types.abi import Abi, AbiStructField
+
+# An encoder appends the serialized form of a value to the buffer
+Encoder = Callable[[bytearray, Any], None]
+# A decoder reads a value from the cursor
+Decoder = Callable[[ByteReader], Any]
+
+# Resolved types that can be part of a packed run, with their `struct` format
+PACKED_FORMATS = {
+    **NUMERIC_FORMATS,
+    "bool": "?",
+    # packed as the uint64 value of the name
+    "name": "Q",
+}
+
+
+def field_type(field: AbiStructField) -> str:
+    """Rebuilds the full ABI type string of a struct field
+
+    Args:
+        field (AbiStructField): the field
+
+    Returns:
+        str: the type string, e.g. `uint64[]`
+    """
+    return field.type + "[]" if field.is_list else field.type
+
+
+class StructPlan:
+    """Precomputed serialization plan for a struct or action"""
+
+    __slots__ = ("name", "fields", "decoders", "types", "steps", "decode_steps")
+
+    def __init__(self, name: str):
+        self.name = name
+        # (name, optional, nullable, encoder) per field
+        self.fields: List[Tuple[str, bool, bool, Encoder]] = []
+        # (name, binary extension, decoder) per field
+        self.decoders: List[Tuple[str, bool, Decoder]] = []
+        # field types with aliases resolved, e.g. `uint64` for `asset_id_type`
+        self.types: List[str] = []
+        # fields and decoders with packed runs in place of their fields.
+        # Packed runs have no name, and take the whole struct data.
+        self.steps: List[Tuple[Any, bool, bool, Any]] = []
+        self.decode_steps: List[Tuple[Any, bool, Any]] = []
+
+    def coalesce(self) -> None:
+        """Builds the encode and decode steps, replacing each run of two or more
+        consecutive fixed-width fields with a single packed run"""
+        self.steps = []
+        self.decode_steps = []
+        run: List[int] = []
+        for i, (field, type_name) in enumerate(zip(self.decoders, self.types)):
+            if type_name in PACKED_FORMATS and not field[1]:
+                run.append(i)
+                continue
+            self._add_run(run)
+            run = []
+            self.steps.append(self.fields[i])
+            self.decode_steps.append(self.decoders[i])
+        self._add_run(run)
+
+    def _add_run(self, run: List[int]) -> None:
+        if len(run) < 2:
+            self.steps.extend(self.fields[i] for i in run)
+            self.decode_steps.extend(self.decoders[i] for i in run)
+            return
+        fields = [self.fields[i] for i in run]
+        types = [self.types[i] for i in run]
+        packer = struct.Struct("<" + "".join(PACKED_FORMATS[t] for t in types))
+        self.steps.append(
+            (None, False, False, self._run_encoder(fields, types, packer))
+        )
+        self.decode_steps.append((None, False, _run_decoder(fields, types, packer)))
+
+    def _run_encoder(
+        self,
+        fields: List[Tuple[str, bool, bool, Encoder]],
+        types: List[str],
+        packer: struct.Struct,
+    ) -> Callable[[bytearray, Any], None]:
+        field_names = [f[0] for f in fields]
+        name_positions = [i for i, t in enumerate(types) if t == "name"]
+        name_to_uint64 = names.name_to_uint64
+        pack = packer.pack
+
+        def encode(buf: bytearray, data: Any) -> None:
+            values = [data.get(f) for f in field_names]
+            if None not in values:
+                try:
+                    for i in name_positions:
+                        values[i] = name_to_uint64(values[i])
+                    buf += pack(*values)
+                    return
+                except (struct.error, TypeError):
+                    pass
+            # missing fields or values that need converting, e.g. numbers as str
+            self._encode_fields(buf, data, fields)
+
+        return encode
+
+    def encode(self, buf: bytearray, data: Any) -> None:
+        """Appends the serialized struct to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            data (Any): the struct data, normally `dict[str,Any]`
+
+        Raises:
+            ActionMissingFieldError: Data is missing a required field
+        """
+        for name, optional, nullable, encoder in self.steps:
+            if name is None:
+                encoder(buf, data)
+                continue
+            value = data.get(name)
+            if value is None and not nullable:
+                if optional:
+                    continue
+                raise ActionMissingFieldError(
+                    f"Action {self.name} is missing field {name}"
+                )
+            encoder(buf, value)
+
+    def _encode_fields(
+        self,
+        buf: bytearray,
+        data: Any,
+        fields: List[Tuple[str, bool, bool, Encoder]],
+    ) -> None:
+        for name, optional, nullable, encoder in fields:
+            value = data.get(name)
+            if value is None and not nullable:
+                if optional:
+                    continue
+                raise ActionMissingFieldError(
+                    f"Action {self.name} is missing field {name}"
+                )
+            encoder(buf, value)
+
+    def decode(self, reader: ByteReader) -> Dict[str, Any]:
+        """Reads the struct from the cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            Dict[str, Any]: the struct data. Binary extension fields are left out
+                when the data ends before them.
+        """
+        result = {}
+        for name, extension, decoder in self.decode_steps:
+            if extension and not reader.remaining:
+                break
+            if name is None:
+                result.update(decoder(reader))
+            else:
+                result[name] = decoder(reader)
+        return result
+
+
+def _run_decoder(
+    fields: List[Tuple[str, bool, bool, Encoder]],
+    types: List[str],
+    packer: struct.Struct,
+) -> Callable[[ByteReader], List[Tuple[str, Any]]]:
+    field_names = [f[0] for f in fields]
+    name_positions = [i for i, t in enumerate(types) if t == "name"]
+    uint64_to_name = names.uint64_to_name
+
+    def decode(reader: ByteReader) -> List[Tuple[str, Any]]:
+        values = list(reader.unpack(packer))
+        for i in name_positions:
+            values[i] = uint64_to_name(values[i])
+        return list(zip(field_names, values))
+
+    return decode
+
+
+def _basic_encoder(type_name: str) -> Encoder:
+    return SERIALIZER_MAP[type_name].serialize_into
+
+
+def _list_encoder(item_encoder: Encoder) -> Encoder:
+    write_length = varints.write_varint
+
+    def encode(buf: bytearray, values: Any) -> None:
+        write_length(buf, len(values))
+        for value in values:
+            item_encoder(buf, value)
+
+    return encode
+
+
+def _vector_encoder(fmt: str, item_encoder: Encoder) -> Encoder:
+    write_vector = vectors.write_vector
+    fallback = _list_encoder(item_encoder)
+
+    def encode(buf: bytearray, values: Any) -> None:
+        try:
+            write_vector(buf, fmt, values)
+        except (struct.error, TypeError):
+            # e.g. numbers given as str
+            fallback(buf, values)
+
+    return encode
+
+
+def _optional_encoder(inner_encoder: Encoder) -> Encoder:
+    def encode(buf: bytearray, value: Any) -> None:
+        if value is None:
+            buf.append(0)
+        else:
+            buf.append(1)
+            inner_encoder(buf, value)
+
+    return encode
+
+
+def _unsupported_encoder(type_name: str) -> Encoder:
+    def encode(buf: bytearray, value: Any) -> None:
+        raise SerializationError(f"Type {type_name} couldn't be serialized.")
+
+    return encode
+
+
+def _basic_decoder(type_name: str) -> Decoder:
+    return SERIALIZER_MAP[type_name].deserialize_from
+
+
+def _list_decoder(item_decoder: Decoder) -> Decoder:
+    def decode(reader: ByteReader) -> List[Any]:
+        return [item_decoder(reader) for _ in range(reader.read_varuint())]
+
+    return decode
+
+
+def _vector_decoder(fmt: str) -> Decoder:
+    read_vector = vectors.read_vector
+
+    def decode(reader: ByteReader) -> Any:
+        return read_vector(reader, fmt)
+
+    return decode
+
+
+def _optional_decoder(inner_decoder: Decoder) -> Decoder:
+    def decode(reader: ByteReader) -> Any:
+        return inner_decoder(reader) if reader.read_byte() else None
+
+    return decode
+
+
+def _unsupported_decoder(type_name: str) -> Decoder:
+    def decode(reader: ByteReader) -> Any:
+        raise DeserializationError(f"Type {type_name} couldn't be deserialized.")
+
+    return decode
+
+
+class AbiCompiler:
+    """Resolves the types of an Abi into trees of encoder callables"""
+
+    def __init__(self, abi: Abi):
+        self.abi = abi
+        self.plans: Dict[str, StructPlan] = {}
+        self._encoders: Dict[str, Encoder] = {}
+        self._decoders: Dict[str, Decoder] = {}
+
+    def compile(self) -> Dict[str, StructPlan]:
+        """Compiles a plan for every struct in the ABI
+
+        Returns:
+            Dict[str, StructPlan]: the plans, indexed by struct name
+        """
+        for abi_struct in self.abi.structs:
+            self.struct_plan(abi_struct.name)
+        return self.plans
+
+    def struct_plan(self, name: str) -> StructPlan:
+        """Gets the plan for a struct, compiling it if needed
+
+        Args:
+            name (str): the name of the struct
+
+        Raises:
+            SerializationError: Raised when the struct isn't in the ABI
+
+        Returns:
+            StructPlan: the compiled plan
+        """
+        plan = self.plans.get(name)
+        if plan is not None:
+            return plan
+        abi_struct = self.abi.find_struct(name)
+        if abi_struct is None:
+            raise SerializationError(f"Struct {name} couldn't be found.")
+        # registered before compiling the fields, so recursive structs resolve
+        plan = self.plans[name] = StructPlan(name)
+        if abi_struct.base:
+            base = self.struct_plan(abi_struct.base)
+            plan.fields.extend(base.fields)
+            plan.decoders.extend(base.decoders)
+            plan.types.extend(base.types)
+        plan.fields.extend(self.compile_fields(abi_struct.fields))
+        plan.decoders.extend(self.compile_field_decoders(abi_struct.fields))
+        plan.types.extend(self.resolve_type(field_type(f)) for f in abi_struct.fields)
+        plan.coalesce()
+        return plan
+
+    def compile_fields(
+        self, fields: List[AbiStructField]
+    ) -> List[Tuple[str, bool, bool, Encoder]]:
+        """Compiles a list of struct fields
+
+        Args:
+            fields (List[AbiStructField]): the fields
+
+        Returns:
+            List[Tuple[str, bool, bool, Encoder]]: (name, optional, nullable, encoder)
+                per field. Nullable fields (`type?`) serialize missing values as empty.
+        """
+        compiled = []
+        for field in fields:
+            t = field_type(field)
+            nullable = t.rstrip("$").endswith("?")
+            compiled.append((field.name, field.optional, nullable, self.encoder(t)))
+        return compiled
+
+    def compile_field_decoders(
+        self, fields: List[AbiStructField]
+    ) -> List[Tuple[str, bool, Decoder]]:
+        """Compiles the decoders of a list of struct fields
+
+        Args:
+            fields (List[AbiStructField]): the fields
+
+        Returns:
+            List[Tuple[str, bool, Decoder]]: (name, binary extension, decoder) per field
+        """
+        compiled = []
+        for field in fields:
+            t = field_type(field)
+            compiled.append((field.name, t.endswith("$"), self.decoder(t)))
+        return compiled
+
+    def resolve_type(self, type_name: str) -> str:
+        """Follows type aliases to the underlying type
+
+        Args:
+            type_name (str): the ABI type, e.g. `ATTRIBUTE_MAP`
+
+        Returns:
+            str: the underlying type, e.g. `pair_string_ATOMIC_ATTRIBUTE[]`
+        """
+        for suffix in ("$", "[]", "?"):
+            if type_name.endswith(suffix):
+                resolved = self.resolve_type(type_name[: -len(suffix)])
+                return resolved if suffix == "$" else resolved + suffix
+        if type_name in DEFAULT_TYPES:
+            return type_name
+        if t := self.abi.find_type(type_name):
+            return self.resolve_type(t.type + "[]" if t.is_list else t.type)
+        return type_name
+
+    def encoder(self, type_name: str) -> Encoder:
+        """Gets the encoder for an ABI type, compiling it if needed
+
+        Args:
+            type_name (str): the ABI type, e.g. `name`, `uint64[]`, `ATTRIBUTE_MAP`
+
+        Returns:
+            Encoder: the encoder
+        """
+        encoder = self._encoders.get(type_name)
+        if encoder is None:
+            encoder = self._build_encoder(type_name)
+            self._encoders[type_name] = encoder
+        return encoder
+
+    def _build_encoder(self, type_name: str) -> Encoder:
+        if type_name.endswith("$"):
+            # binary extensions are serialized as the type itself
+            return self.encoder(type_name[:-1])
+        if type_name.endswith("[]"):
+            fmt = vectors.VECTOR_FORMATS.get(self.resolve_type(type_name[:-2]))
+            if fmt:
+                return _vector_encoder(fmt, self.encoder(type_name[:-2]))
+            return _list_encoder(self.encoder(type_name[:-2]))
+        if type_name.endswith("?"):
+            return _optional_encoder(self.encoder(type_name[:-1]))
+        if type_name in SERIALIZER_MAP:
+            return _basic_encoder(type_name)
+        if type_name in DEFAULT_TYPES:
+            return _unsupported_encoder(type_name)
+        if t := self.abi.find_type(type_name):
+            return self.encoder(t.type + "[]" if t.is_list else t.type)
+        if self.abi.find_struct(type_name):
+            return self.struct_plan(type_name).encode
+        if self.abi.find_variant(type_name):
+            return self._variant_encoder(type_name)
+        return _unsupported_encoder(type_name)
+
+    def _variant_encoder(self, type_name: str) -> Encoder:
+        variant = self.abi.find_variant(type_name)
+        serialize_index = varints.serialize_varint
+        options: Dict[str, Tuple[bytes, Encoder]] = {}
+
+        def encode(buf: bytearray, value: Any) -> None:
+            variant_type, variant_value = value
+            option = options.get(variant_type)
+            if option is None:
+                raise SerializationError(
+                    f"Type {variant_type} isn't part of variant {type_name}"
+                )
+            buf += option[0]
+            option[1](buf, variant_value)
+
+        # registered before compiling the options, so recursive variants resolve
+        self._encoders[type_name] = encode
+        for t, i in variant.type_indexes.items():
+            options[t] = (serialize_index(i), self.encoder(t))
+        return encode
+
+    def decoder(self, type_name: str) -> Decoder:
+        """Gets the decoder for an ABI type, compiling it if needed
+
+        Args:
+            type_name (str): the ABI type, e.g. `name`, `uint64[]`, `ATTRIBUTE_MAP`
+
+        Returns:
+            Decoder: the decoder
+        """
+        decoder = self._decoders.get(type_name)
+        if decoder is None:
+            decoder = self._build_decoder(type_name)
+            self._decoders[type_name] = decoder
+        return decoder
+
+    def _build_decoder(self, type_name: str) -> Decoder:
+        if type_name.endswith("$"):
+            return self.decoder(type_name[:-1])
+        if type_name.endswith("[]"):
+            fmt = vectors.VECTOR_FORMATS.get(self.resolve_type(type_name[:-2]))
+            if fmt:
+                return _vector_decoder(fmt)
+            return _list_decoder(self.decoder(type_name[:-2]))
+        if type_name.endswith("?"):
+            return _optional_decoder(self.decoder(type_name[:-1]))
+        if type_name in SERIALIZER_MAP:
+            return _basic_decoder(type_name)
+        if type_name in DEFAULT_TYPES:
+            return _unsupported_decoder(type_name)
+        if t := self.abi.find_type(type_name):
+            return self.decoder(t.type + "[]" if t.is_list else t.type)
+        if self.abi.find_struct(type_name):
+            return self.struct_plan(type_name).decode
+        if self.abi.find_variant(type_name):
+            return self._variant_decoder(type_name)
+        return _unsupported_decoder(type_name)
+
+    def _variant_decoder(self, type_name: str) -> Decoder:
+        variant = self.abi.find_variant(type_name)
+        options: List[Tuple[str, Decoder]] = []
+
+        def decode(reader: ByteReader) -> List[Any]:
+            index = reader.read_varuint()
+            if index >= len(options):
+                raise DeserializationError(
+                    f"Index {index} is out of range for variant {type_name}"
+                )
+            variant_type, decoder = options[index]
+            return [variant_type, decoder(reader)]
+
+        # registered before compiling the options, so recursive variants resolve
+        self._decoders[type_name] = decode
+        options.extend((t, self.decoder(t)) for t in variant.types)
+        return decode
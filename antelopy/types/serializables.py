@@ -2,10 +2,12 @@
 
 Contains classes to hold serializable data"""
 
+import struct
 from typing import Any, Dict, List, Protocol
 
+from antelopy.serializers import varints, vectors
 from antelopy.types import serializers
-from antelopy.types.transaction import PreSerializedTransaction, Transaction
+from antelopy.types.transaction import Transaction
 
 
 class Serializable(Protocol):
@@ -15,6 +17,10 @@ class Serializable(Protocol):
         """Protocol template for serializable classes"""
         raise NotImplementedError("This hasn't been implemented yet")
 
+    def serialize_into(self, buf: bytearray) -> None:
+        """Appends the serialized value to a shared buffer"""
+        buf += self.serialize()
+
     def deserialize(self):
         """Protocol template for serializable classes"""
         raise NotImplementedError("This hasn't been implemented yet")
@@ -31,6 +37,10 @@ class BasicSerializable(Serializable):
         """Serialize the serializable's value"""
         return self.strategy.serialize(self.value)
 
+    def serialize_into(self, buf: bytearray) -> None:
+        """Append the serializable's value to the buffer"""
+        self.strategy.serialize_into(buf, self.value)
+
     def deserialize(self):
         """Deserialize the serializable's value"""
         raise NotImplementedError("This hasn't been implemented yet")
@@ -43,17 +53,34 @@ class ListSerializable(Serializable):
         self, values: List[Any], field_type: str = "", serialized: bool = False
     ):
         self.values = values
+        self.field_type = field_type
         self.serialized = serialized
         strategy = SERIALIZER_MAP.get(field_type)
         self.strategy = strategy
 
     def serialize(self):
         """Serialize the serializable's value"""
+        buf = bytearray()
+        self.serialize_into(buf)
+        return bytes(buf)
+
+    def serialize_into(self, buf: bytearray) -> None:
+        """Append the serializable's value to the buffer"""
+        fmt = vectors.VECTOR_FORMATS.get(self.field_type)
+        if fmt and not self.serialized:
+            try:
+                vectors.write_vector(buf, fmt, self.values)
+                return
+            except (struct.error, TypeError):
+                pass
+        varints.write_varint(buf, len(self.values))
         if self.strategy and not self.serialized:
-            serialized_values = [self.strategy.serialize(v) for v in self.values]
+            serialize_into = self.strategy.serialize_into
+            for v in self.values:
+                serialize_into(buf, v)
         else:
-            serialized_values = [bytes(b) for b in self.values]
-        return serializers.ListSerializer().serialize(serialized_values)
+            for b in self.values:
+                buf += b
 
     def deserialize(self):
         """Deserialize the serializable's value"""
@@ -84,29 +111,32 @@ class TransactionSerializable(Serializable):
     """Helper class for serializing transactions"""
 
     def __init__(self, package: str, transaction: Any):
-        self.transaction = Transaction.from_ext(package, transaction)
+        if isinstance(transaction, Transaction):
+            # e.g. a transaction decoded by TransactionSerializer
+            self.transaction = transaction
+        else:
+            self.transaction = Transaction.from_ext(package, transaction)
 
     def serialize(self) -> bytes:
         """Serialize the serializable's value"""
-        t = serializers.TransactionExtensionSerializer()
+        buf = bytearray()
+        self.serialize_into(buf)
+        return bytes(buf)
+
+    def serialize_into(self, buf: bytearray) -> None:
+        """Append the serialized transaction to the buffer. Actions are written
+        directly into the buffer rather than being serialized separately."""
+        trx = self.transaction
+        serializers.TransactionSerializer().serialize_header_into(buf, trx)
         a = serializers.ActionSerializer()
-        preserialized_trx = PreSerializedTransaction(
-            expiration=self.transaction.expiration,
-            ref_block_num=self.transaction.ref_block_num,
-            ref_block_prefix=self.transaction.ref_block_prefix,
-            max_net_usage_words=self.transaction.max_net_usage_words,
-            max_cpu_usage_ms=self.transaction.max_cpu_usage_ms,
-            delay_sec=self.transaction.delay_sec,
-            context_free_actions=[
-                a.serialize(action) for action in self.transaction.context_free_actions
-            ],
-            actions=[a.serialize(action) for action in self.transaction.actions],
-            transaction_extensions=[
-                t.serialize(trx_ext)
-                for trx_ext in self.transaction.transaction_extensions
-            ],
-        )
-        return serializers.TransactionSerializer().serialize(preserialized_trx)
+        for actions in (trx.context_free_actions, trx.actions):
+            varints.write_varint(buf, len(actions))
+            for action in actions:
+                a.serialize_into(buf, action)
+        t = serializers.TransactionExtensionSerializer()
+        varints.write_varint(buf, len(trx.transaction_extensions))
+        for trx_ext in trx.transaction_extensions:
+            t.serialize_into(buf, trx_ext)
 
     def deserialize(self):
         """Deserialize the serializable's value"""
@@ -117,9 +147,9 @@ SERIALIZER_MAP = {
     "asset": serializers.AssetSerializer(),
     "bool": serializers.BooleanSerializer(),
     "bytes": serializers.BytesSerializer(),
-    "checksum160": serializers.ChecksumSerializer(),
-    "checksum256": serializers.ChecksumSerializer(),
-    "checksum512": serializers.ChecksumSerializer(),
+    "checksum160": serializers.ChecksumSerializer(20),
+    "checksum256": serializers.ChecksumSerializer(32),
+    "checksum512": serializers.ChecksumSerializer(64),
     "float32": serializers.NumberSerializer("float32"),
     "float64": serializers.NumberSerializer("float64"),
     "int8": serializers.NumberSerializer("int8"),
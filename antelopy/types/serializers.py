@@ -8,15 +8,27 @@ from __future__ import annotations
 import binascii
 import struct
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Protocol, Tuple, Union
+from typing import Any, Callable, List, Protocol, Tuple, Union
 
 from antelopy.exceptions import ActionDataNotSerializedError
 from antelopy.serializers import assets, keys, names, time_points, varints
-from antelopy.types.transaction import PreSerializedTransaction
+from antelopy.serializers.reader import ByteReader
+from antelopy.types.transaction import (
+    Action,
+    Authorization,
+    LazyActionData,
+    PreSerializedTransaction,
+    Transaction,
+    TransactionExtension,
+)
 from antelopy.types.types import DEFAULT_TYPES
 
-if TYPE_CHECKING:
-    from antelopy.types.transaction import Action, Authorization, TransactionExtension
+UINT16 = struct.Struct("<H")
+UINT32 = struct.Struct("<I")
+UINT64 = struct.Struct("<Q")
+UINT128 = struct.Struct("<QQ")
+# expiration, ref_block_num, ref_block_prefix
+TRX_HEADER = struct.Struct("<IHI")
 
 
 def split_and_pack_128(n: int):
@@ -30,10 +42,7 @@ def split_and_pack_128(n: int):
     """
     if n < 0:
         n = (1 << 128) + n
-    buf = b""
-    buf += struct.pack("Q", n & (2**64 - 1))
-    buf += struct.pack("Q", n >> 64)
-    return buf
+    return UINT128.pack(n & (2**64 - 1), n >> 64)
 
 
 class Serializer(Protocol):
@@ -43,25 +52,60 @@ class Serializer(Protocol):
         """Protocol template for serializaton function"""
         raise NotImplementedError("This hasn't been implemented yet")
 
+    def serialize_into(self, buf: bytearray, v: Any) -> None:
+        """Appends the serialized data to a shared buffer
+
+        Serializers that build their output from several parts override this
+        to write each part directly into the buffer.
+
+        Args:
+            buf (bytearray): the output buffer
+            v (Any): the value to be serialized
+        """
+        buf += self.serialize(v)
+
     def deserialize(self, v: Any) -> bytes:
         """Protocol template for deserialization function"""
         raise NotImplementedError("This hasn't been implemented yet")
 
+    def deserialize_from(self, reader: ByteReader) -> Any:
+        """Protocol template for reading a value from a serialized data cursor"""
+        raise NotImplementedError("This hasn't been implemented yet")
+
 
 class ActionSerializer(Serializer):
     """Serialization strategy class for Action types"""
 
+    def __init__(
+        self,
+        data_loader: Union[Callable[[str, str, memoryview], Any], None] = None,
+    ):
+        """Serialization strategy class for Action types
+
+        Args:
+            data_loader (Callable[[str, str, memoryview], Any], optional): called
+                with the account, action name and serialized data of each
+                deserialized action. Defaults to copying the data to bytes.
+        """
+        self.data_loader = data_loader
+
     def serialize(self, v: Action) -> bytes:
-        buf = b""
-        a = AuthorizationSerializer()
-        buf += NameSerializer().serialize(v.account)
-        buf += NameSerializer().serialize(v.name)
-        buf += ListSerializer().serialize(
-            [a.serialize(auth) for auth in v.authorization]
-        )
-        if isinstance(v.data, bytes):
-            buf += VaruintSerializer().serialize(len(v.data)) + v.data
-        else:
+        buf = bytearray()
+        self.serialize_into(buf, v)
+        return bytes(buf)
+
+    def serialize_into(self, buf: bytearray, v: Action) -> None:
+        """Appends a serialized Action to the buffer. Action data must already
+        be serialized.
+
+        Args:
+            buf (bytearray): the output buffer
+            v (Action): the Action to be serialized
+        """
+        data = v.data
+        if isinstance(data, LazyActionData):
+            data = data.raw
+        elif not isinstance(data, bytes):
             raise ActionDataNotSerializedError(
                 "Action data needs to be serialized before the action can be serialized"
             )
@@ -69,11 +113,55 @@ class ActionSerializer(Serializer):
         # name: str
         # authorization: List[Authorization]
         # data: Union[bytes,Dict[str, Any]]
-        return buf
+        buf += names.serialize_name(v.account)
+        buf += names.serialize_name(v.name)
+        varints.write_varint(buf, len(v.authorization))
+        for auth in v.authorization:
+            buf += names.serialize_name(auth.actor)
+            buf += names.serialize_name(auth.permission)
+        varints.write_varint(buf, len(data))
+        buf += data
+
+    def deserialize(self, v: bytes) -> Action:
+        """Deserializes an Action from bytes
 
-    def deserialize(self, v: Any) -> bytes:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+        Args:
+            v (bytes): the serialized Action
+
+        Returns:
+            Action: the Action
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> Action:
+        """Reads an Action from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            Action: the Action, with data loaded by the data loader
+        """
+        account = names.deserialize_name(reader.read(8))
+        name = names.deserialize_name(reader.read(8))
+        read_name = names.deserialize_name
+        authorization = [
+            Authorization.model_construct(
+                actor=read_name(reader.read(8)), permission=read_name(reader.read(8))
+            )
+            for _ in range(reader.read_varuint())
+        ]
+        data = reader.read(reader.read_varuint())
+        return Action.model_construct(
+            account=account,
+            name=name,
+            authorization=authorization,
+            data=(
+                self.data_loader(account, name, data)
+                if self.data_loader
+                else bytes(data)
+            ),
+        )
 
 
 class AssetSerializer(Serializer):
@@ -90,9 +178,27 @@ class AssetSerializer(Serializer):
         """
         return assets.serialize_asset(v)
 
-    def deserialize(self, v: Any) -> bytes:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> str:
+        """Deserializes an Asset from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            str: the Asset string, e.g. `1.00000000 WAX`
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads an Asset from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the Asset string, e.g. `1.00000000 WAX`
+        """
+        return assets.deserialize_asset(reader.read(16))
 
 
 class AuthorizationSerializer(Serializer):
@@ -107,12 +213,42 @@ class AuthorizationSerializer(Serializer):
         Returns:
             bytes: the serialized data
         """
-        n = NameSerializer()
-        return n.serialize(v.actor) + n.serialize(v.permission)
+        return names.serialize_name(v.actor) + names.serialize_name(v.permission)
 
-    def deserialize(self, v: Any) -> bytes:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def serialize_into(self, buf: bytearray, v: Authorization) -> None:
+        """Appends a serialized Authorization to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (Authorization): the Authorization to be serialized
+        """
+        buf += names.serialize_name(v.actor)
+        buf += names.serialize_name(v.permission)
+
+    def deserialize(self, v: bytes) -> Authorization:
+        """Deserializes an Authorization from bytes
+
+        Args:
+            v (bytes): the serialized Authorization
+
+        Returns:
+            Authorization: the Authorization
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> Authorization:
+        """Reads an Authorization from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            Authorization: the Authorization
+        """
+        return Authorization.model_construct(
+            actor=names.deserialize_name(reader.read(8)),
+            permission=names.deserialize_name(reader.read(8)),
+        )
 
 
 class BooleanSerializer(Serializer):
@@ -129,9 +265,27 @@ class BooleanSerializer(Serializer):
         """
         return b"\x01" if v else b"\x00"
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> bool:
+        """Deserializes a Boolean from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            bool: the Boolean
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> bool:
+        """Reads a Boolean from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            bool: the Boolean
+        """
+        return reader.read_byte() != 0
 
 
 class BytesSerializer(Serializer):
@@ -146,16 +300,49 @@ class BytesSerializer(Serializer):
         Returns:
             bytes: the serialized data
         """
-        return VaruintSerializer().serialize(len(v)) + v
+        buf = bytearray()
+        self.serialize_into(buf, v)
+        return bytes(buf)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def serialize_into(self, buf: bytearray, v: bytes) -> None:
+        """Appends serialized Bytes to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (bytes): the Bytes to be serialized
+        """
+        varints.write_varint(buf, len(v))
+        buf += v
+
+    def deserialize(self, v: bytes) -> bytes:
+        """Deserializes Bytes from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            bytes: the Bytes
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> bytes:
+        """Reads Bytes from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            bytes: the Bytes
+        """
+        return bytes(reader.read(reader.read_varuint()))
 
 
 class ChecksumSerializer(Serializer):
     """Serialization strategy class for Checksum types"""
 
+    def __init__(self, size: Union[int, None] = None):
+        self.size = size
+
     def serialize(self, v: Union[str, bytes]) -> bytes:
         """Serialize the data to Antelope-compatible Checksum format
 
@@ -175,14 +362,37 @@ class ChecksumSerializer(Serializer):
             return v
         raise ValueError("serializing checksums expects str or bytes format")
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> str:
+        """Deserializes a Checksum from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            str: the hex-encoded Checksum
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads a Checksum from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the hex-encoded Checksum
+        """
+        if self.size is None:
+            raise ValueError("deserializing checksums requires a checksum size")
+        return reader.read(self.size).hex()
 
 
 class ListSerializer(Serializer):
     """Serialization strategy class for List types"""
 
+    def __init__(self, item_serializer: Union[Serializer, None] = None):
+        self.item_serializer = item_serializer
+
     def serialize(self, v: List[bytes]) -> bytes:
         """Serialize a list of serialized data to Antelope-compatible List format
 
@@ -192,11 +402,45 @@ class ListSerializer(Serializer):
         Returns:
             bytes: the serialized data
         """
-        return varints.serialize_varint(len(v)) + b"".join(v)
+        buf = bytearray()
+        self.serialize_into(buf, v)
+        return bytes(buf)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def serialize_into(self, buf: bytearray, v: List[bytes]) -> None:
+        """Appends a list of serialized data to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (List[bytes]): the list of data
+        """
+        varints.write_varint(buf, len(v))
+        for item in v:
+            buf += item
+
+    def deserialize(self, v: bytes) -> List[Any]:
+        """Deserializes a list using the item serializer
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            List[Any]: the list of values
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> List[Any]:
+        """Reads a list from a serialized data cursor using the item serializer
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            List[Any]: the list of values
+        """
+        if self.item_serializer is None:
+            raise ValueError("deserializing lists requires an item serializer")
+        read_item = self.item_serializer.deserialize_from
+        return [read_item(reader) for _ in range(reader.read_varuint())]
 
 
 class NameSerializer(Serializer):
@@ -213,6 +457,15 @@ class NameSerializer(Serializer):
         """
         return names.serialize_name(v)
 
+    def serialize_into(self, buf: bytearray, v: str) -> None:
+        """Appends a serialized Name to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (str): the plaintext name
+        """
+        buf += names.serialize_name(v)
+
     def deserialize(self, v: bytes) -> str:
         """deserialize a Name from bytes to str
 
@@ -224,12 +477,28 @@ class NameSerializer(Serializer):
         """
         return names.deserialize_name(v)
 
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads a Name from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the plaintext name
+        """
+        return names.deserialize_name(reader.read(8))
+
 
 class NumberSerializer(Serializer):
     """Serialization strategy class for Number types"""
 
     def __init__(self, number_type: str):
         self.type = number_type
+        self.is_128 = number_type.endswith("128")
+        # converter for numbers given as str
+        self.from_str = int if "int" in number_type else float
+        if DEFAULT_TYPES[number_type]:
+            self.packer = struct.Struct("<" + DEFAULT_TYPES[number_type])
 
     def serialize(self, v: Union[int, float, str]) -> bytes:
         """Serialize a number to Antelope-compatible format
@@ -245,24 +514,53 @@ class NumberSerializer(Serializer):
             bytes: the serialized data
         """
         if isinstance(v, str):
-            if "int" in self.type:
-                v = int(v)
-            elif "float" in self.type:
-                v = float(v)
-            else:
-                raise ValueError(
-                    f"Value {v} could not be converted to an integer or float"
-                )
-        if self.type.endswith("128"):
+            v = self.from_str(v)
+        if self.is_128:
             if isinstance(v, float):
                 # see antelopy/types/types comments for float128
                 raise ValueError("Python doesn't handle float128")
             return split_and_pack_128(v)
-        return struct.pack(DEFAULT_TYPES[self.type], v)
+        return self.packer.pack(v)
 
-    def deserialize(self, v: bytes) -> str:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def serialize_into(self, buf: bytearray, v: Union[int, float, str]) -> None:
+        """Appends a serialized number to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (Union[int, float, str]): the number to be serialized
+        """
+        if self.is_128 or isinstance(v, str):
+            buf += self.serialize(v)
+        else:
+            buf += self.packer.pack(v)
+
+    def deserialize(self, v: bytes) -> Union[int, float]:
+        """Deserializes a number from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            Union[int, float]: the number
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> Union[int, float]:
+        """Reads a number from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            Union[int, float]: the number
+        """
+        if self.is_128:
+            low, high = reader.unpack(UINT128)
+            n = (high << 64) | low
+            if self.type == "int128" and n >= 1 << 127:
+                n -= 1 << 128
+            return n
+        return reader.unpack(self.packer)[0]
 
 
 class PublicKeySerializer(Serializer):
@@ -279,9 +577,34 @@ class PublicKeySerializer(Serializer):
         """
         return keys.serialize_public_key(v)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> str:
+        """Deserializes a public key from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            str: the public key. K1 keys use the legacy EOS format
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads a public key from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the public key. K1 keys use the legacy EOS format
+        """
+        start = reader.pos
+        key_type = reader.read_byte()
+        reader.read(33)
+        if key_type == keys.KEY_TYPES["wa"]:
+            # user presence flag and relying party id
+            reader.read(1)
+            reader.read(reader.read_varuint())
+        return keys.deserialize_public_key(reader.view[start : reader.pos])
 
 
 class SignatureSerializer(Serializer):
@@ -298,9 +621,34 @@ class SignatureSerializer(Serializer):
         """
         return keys.serialize_signature(v)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> str:
+        """Deserializes a signature from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            str: the signature in SIG_ format
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads a signature from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the signature in SIG_ format
+        """
+        start = reader.pos
+        key_type = reader.read_byte()
+        reader.read(65)
+        if key_type == keys.KEY_TYPES["wa"]:
+            # authenticator data and client JSON
+            reader.read(reader.read_varuint())
+            reader.read(reader.read_varuint())
+        return keys.deserialize_signature(reader.view[start : reader.pos])
 
 
 class StringSerializer(Serializer):
@@ -315,11 +663,42 @@ class StringSerializer(Serializer):
         Returns:
             bytes: the serialized data
         """
-        return VaruintSerializer().serialize(len(v)) + v.encode("utf-8")
+        buf = bytearray()
+        self.serialize_into(buf, v)
+        return bytes(buf)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def serialize_into(self, buf: bytearray, v: str) -> None:
+        """Appends a serialized string to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (str): the string
+        """
+        encoded = v.encode("utf-8")
+        varints.write_varint(buf, len(encoded))
+        buf += encoded
+
+    def deserialize(self, v: bytes) -> str:
+        """Deserializes a string from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            str: the string
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads a string from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the string
+        """
+        return str(reader.read(reader.read_varuint()), "utf-8")
 
 
 class SymbolCodeSerializer(Serializer):
@@ -334,11 +713,30 @@ class SymbolCodeSerializer(Serializer):
         Returns:
             bytes: the serialized data
         """
-        return assets.serialize_symbol_code(v)
+        # symbol codes are stored as a uint64 when not part of a symbol
+        return assets.serialize_symbol_code(v) + b"\x00"
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> str:
+        """Deserializes a symbol code from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            str: the symbol code (e.g. `WAX`, `EOS`)
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads a symbol code from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the symbol code (e.g. `WAX`, `EOS`)
+        """
+        return assets.deserialize_symbol_code(reader.read(8))
 
 
 class SymbolSerializer(Serializer):
@@ -356,9 +754,27 @@ class SymbolSerializer(Serializer):
         precision, symbol_name = v.split(",")
         return assets.serialize_symbol(int(precision), symbol_name)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> str:
+        """Deserializes a Symbol from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            str: the symbol (e.g. `8,WAX`)
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> str:
+        """Reads a Symbol from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            str: the symbol (e.g. `8,WAX`)
+        """
+        return assets.deserialize_symbol(reader.read(8))
 
 
 class TimePointSerializer(Serializer):
@@ -376,9 +792,27 @@ class TimePointSerializer(Serializer):
         """
         return time_points.serialize_time_point(v)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> int:
+        """Deserializes a time point from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            int: the time point as stored on chain
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> int:
+        """Reads a time point from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            int: the time point as stored on chain
+        """
+        return reader.unpack(UINT64)[0]
 
 
 class TimePointSecSerializer(Serializer):
@@ -395,14 +829,41 @@ class TimePointSecSerializer(Serializer):
         """
         return time_points.serialize_time_point_sec(v)
 
-    def deserialize(self, v: Any) -> Any:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def deserialize(self, v: bytes) -> int:
+        """Deserializes a time point with second precision from bytes
+
+        Args:
+            v (bytes): the serialized data
+
+        Returns:
+            int: the time point in seconds
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> int:
+        """Reads a time point with second precision from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            int: the time point in seconds
+        """
+        return reader.unpack(UINT32)[0]
 
 
 class TransactionSerializer(Serializer):
     """Serialization strategy class for Transactio types"""
 
+    def __init__(self, action_serializer: Union[ActionSerializer, None] = None):
+        """Serialization strategy class for Transaction types
+
+        Args:
+            action_serializer (ActionSerializer, optional): strategy used to
+                deserialize actions, e.g. one that loads action data lazily
+        """
+        self.action_serializer = action_serializer or ActionSerializer()
+
     def serialize(self, v: PreSerializedTransaction) -> bytes:
         """Serializes a transaction. Action data and extensions must already
         be serialized.
@@ -413,23 +874,83 @@ class TransactionSerializer(Serializer):
         Returns:
             bytes: the serialized transaction
         """
-        buf = b""
-        buf += TimePointSecSerializer().serialize(v.expiration)
-        buf += NumberSerializer("uint16").serialize(v.ref_block_num)
-        buf += NumberSerializer("uint32").serialize(v.ref_block_prefix)
-        buf += VaruintSerializer().serialize(v.max_net_usage_words)
-        buf += NumberSerializer("uint8").serialize(v.max_cpu_usage_ms)
-        buf += VaruintSerializer().serialize(v.delay_sec)
+        buf = bytearray()
+        self.serialize_into(buf, v)
+        return bytes(buf)
+
+    def serialize_into(self, buf: bytearray, v: PreSerializedTransaction) -> None:
+        """Appends a serialized transaction to the buffer. Action data and
+        extensions must already be serialized.
 
+        Args:
+            buf (bytearray): the output buffer
+            v (PreSerializedTransaction): The partially-serialized transaction
+        """
+        self.serialize_header_into(buf, v)
         # must be serialized
-        buf += ListSerializer().serialize(v.context_free_actions)
-        buf += ListSerializer().serialize(v.actions)
-        buf += ListSerializer().serialize(v.transaction_extensions)
-        return buf
+        lists = ListSerializer()
+        lists.serialize_into(buf, v.context_free_actions)
+        lists.serialize_into(buf, v.actions)
+        lists.serialize_into(buf, v.transaction_extensions)
 
-    def deserialize(self, v: Any) -> bytes:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def serialize_header_into(self, buf: bytearray, v: Transaction) -> None:
+        """Appends the transaction header (expiration, TAPOS and resource limits)
+        to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (Transaction): the transaction
+        """
+        buf += time_points.serialize_time_point_sec(v.expiration)
+        buf += struct.pack("<HI", v.ref_block_num, v.ref_block_prefix)
+        varints.write_varint(buf, v.max_net_usage_words)
+        buf.append(v.max_cpu_usage_ms)
+        varints.write_varint(buf, v.delay_sec)
+
+    def deserialize(self, v: bytes) -> Transaction:
+        """Deserializes a packed transaction
+
+        Args:
+            v (bytes): the packed transaction
+
+        Returns:
+            Transaction: the transaction
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> Transaction:
+        """Reads a packed transaction from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            Transaction: the transaction
+        """
+        expiration, ref_block_num, ref_block_prefix = reader.unpack(TRX_HEADER)
+        max_net_usage_words = reader.read_varuint()
+        max_cpu_usage_ms = reader.read_byte()
+        delay_sec = reader.read_varuint()
+        read_action = self.action_serializer.deserialize_from
+        context_free_actions = [
+            read_action(reader) for _ in range(reader.read_varuint())
+        ]
+        actions = [read_action(reader) for _ in range(reader.read_varuint())]
+        e = TransactionExtensionSerializer()
+        transaction_extensions = [
+            e.deserialize_from(reader) for _ in range(reader.read_varuint())
+        ]
+        return Transaction.model_construct(
+            expiration=datetime.fromtimestamp(expiration),
+            ref_block_num=ref_block_num,
+            ref_block_prefix=ref_block_prefix,
+            max_net_usage_words=max_net_usage_words,
+            max_cpu_usage_ms=max_cpu_usage_ms,
+            delay_sec=delay_sec,
+            context_free_actions=context_free_actions,
+            actions=actions,
+            transaction_extensions=transaction_extensions,
+        )
 
 
 class TransactionExtensionSerializer(Serializer):
@@ -444,11 +965,45 @@ class TransactionExtensionSerializer(Serializer):
         Returns:
             bytes: the serialized extension
         """
-        return NumberSerializer("uint16").serialize(v.type) + v.data
+        buf = bytearray()
+        self.serialize_into(buf, v)
+        return bytes(buf)
 
-    def deserialize(self, v: Any) -> bytes:
-        """Protocol template for deserialization function"""
-        raise NotImplementedError("This hasn't been implemented yet")
+    def serialize_into(self, buf: bytearray, v: TransactionExtension) -> None:
+        """Appends a serialized transaction extension to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (TransactionExtension): the extension
+        """
+        buf += struct.pack("<H", v.type)
+        varints.write_varint(buf, len(v.data))
+        buf += v.data
+
+    def deserialize(self, v: bytes) -> TransactionExtension:
+        """Deserializes a transaction extension
+
+        Args:
+            v (bytes): the serialized extension
+
+        Returns:
+            TransactionExtension: the extension
+        """
+        return self.deserialize_from(ByteReader(v))
+
+    def deserialize_from(self, reader: ByteReader) -> TransactionExtension:
+        """Reads a transaction extension from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            TransactionExtension: the extension
+        """
+        (extension_type,) = reader.unpack(UINT16)
+        return TransactionExtension.model_construct(
+            type=extension_type, data=bytes(reader.read(reader.read_varuint()))
+        )
 
 
 class VarintSerializer(Serializer):
@@ -465,8 +1020,30 @@ class VarintSerializer(Serializer):
         """
         return varints.serialize_varint((v << 1) ^ (v >> 31))
 
+    def serialize_into(self, buf: bytearray, v: int) -> None:
+        """Appends a serialized varint to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (int): the value to serialize
+        """
+        varints.write_varint(buf, (v << 1) ^ (v >> 31))
+
     def deserialize(self, v: bytes) -> Tuple[int, bytes]:
-        return varints.deserialize_varint(v)
+        n, remainder = varints.deserialize_varint(v)
+        return (n >> 1) ^ -(n & 1), remainder
+
+    def deserialize_from(self, reader: ByteReader) -> int:
+        """Reads a varint from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            int: the value
+        """
+        n = reader.read_varuint()
+        return (n >> 1) ^ -(n & 1)
 
 
 class VaruintSerializer(Serializer):
@@ -483,5 +1060,25 @@ class VaruintSerializer(Serializer):
         """
         return varints.serialize_varint(v)
 
+    def serialize_into(self, buf: bytearray, v: int) -> None:
+        """Appends a serialized varuint to the buffer
+
+        Args:
+            buf (bytearray): the output buffer
+            v (int): the value to serialize
+        """
+        varints.write_varint(buf, v)
+
     def deserialize(self, v: bytes) -> Tuple[int, bytes]:
         return varints.deserialize_varint(v)
+
+    def deserialize_from(self, reader: ByteReader) -> int:
+        """Reads a varuint from a serialized data cursor
+
+        Args:
+            reader (ByteReader): the cursor
+
+        Returns:
+            int: the value
+        """
+        return reader.read_varuint()
@@ -5,15 +5,67 @@ Contains classes to handle the various different transaction formats used by pyt
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Union
 
 from pydantic import BaseModel, Field
 
 from antelopy.exceptions import UnsupportedPackageError
 
 
+class LazyActionData(Mapping):
+    """Serialized action data that is only deserialized when it's first read
+
+    Behaves like a read-only dict of the action data. The serialized bytes are
+    kept, so the action can be re-serialized without being decoded.
+    """
+
+    __slots__ = ("_raw", "_decoder", "_decoded")
+
+    def __init__(
+        self,
+        raw: Union[bytes, memoryview],
+        decoder: Callable[[Union[bytes, memoryview]], Dict[str, Any]],
+    ):
+        """Serialized action data that is only deserialized when it's first read
+
+        Args:
+            raw (Union[bytes, memoryview]): the serialized action data
+            decoder (Callable): function that deserializes the data
+        """
+        self._raw = raw
+        self._decoder = decoder
+        self._decoded: Union[Dict[str, Any], None] = None
+
+    @property
+    def raw(self) -> Union[bytes, memoryview]:
+        """The serialized action data"""
+        return self._raw
+
+    @property
+    def decoded(self) -> Dict[str, Any]:
+        """The deserialized action data, decoded on first access"""
+        if self._decoded is None:
+            self._decoded = self._decoder(self._raw)
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self.decoded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.decoded)
+
+    def __len__(self) -> int:
+        return len(self.decoded)
+
+    def __repr__(self) -> str:
+        if self._decoded is None:
+            return f"LazyActionData({bytes(self._raw).hex()})"
+        return f"LazyActionData({self._decoded!r})"
+
+
 class Action(BaseModel):
     """Pydantic representation of an Antelope Action object"""
 
@@ -88,6 +140,36 @@ class PreSerializedTransaction(Transaction):
     transaction_extensions: List[bytes] = []
 
 
+class ReferenceBlock(BaseModel):
+    """Block a transaction refers to through `ref_block_num` and
+    `ref_block_prefix` (TAPOS)"""
+
+    block_num: int
+    block_id: str
+    ref_block_num: int
+    ref_block_prefix: int
+
+    @classmethod
+    def from_block_id(cls, block_id: str) -> "ReferenceBlock":
+        """Builds the reference from a block id, which starts with the
+        big-endian block number
+
+        Args:
+            block_id (str): the hex-encoded block id
+
+        Returns:
+            ReferenceBlock: the reference
+        """
+        raw = bytes.fromhex(block_id)
+        block_num = int.from_bytes(raw[:4], "big")
+        return cls(
+            block_num=block_num,
+            block_id=block_id,
+            ref_block_num=block_num & 0xFFFF,
+            ref_block_prefix=int.from_bytes(raw[8:12], "little"),
+        )
+
+
 class PackedTransaction(BaseModel):
     """Pydantic representation of a PackedTransaction"""
 
@@ -37,6 +37,10 @@ DEFAULT_TYPES = {
     "extended_asset": "",  # TODO
 }
 
+# Numeric types with a fixed-width little-endian form, and their `struct` format.
+# The packed runs, numeric vectors and NumPy columns are all derived from this.
+NUMERIC_FORMATS = {name: fmt for name, fmt in DEFAULT_TYPES.items() if fmt}
+
 
 ValidTypes = Literal[
     "bool",
@@ -7,6 +7,11 @@ with aioeos, eospy, and pyntelope :P
 from typing import Union
 
 ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_ALPHABET_BYTES = ALPHABET.encode("ascii")
+# byte value to digit, -1 for bytes that aren't part of the alphabet
+_DIGITS = [-1] * 256
+for _i, _c in enumerate(_ALPHABET_BYTES):
+    _DIGITS[_c] = _i
 
 
 def b58encode(b: Union[bytes, str]) -> bytes:
@@ -20,18 +25,14 @@ def b58encode(b: Union[bytes, str]) -> bytes:
     """
     if isinstance(b, str):
         b = b.encode("ascii")
-    r = b""
-    zeros = 0
-    for i in b:
-        if i == 0:
-            zeros += 1
-        else:
-            break
+    zeros = len(b) - len(bytes(b).lstrip(b"\x00"))
     n = int.from_bytes(b, "big")
+    digits = bytearray()
     while n:
         n, mod = divmod(n, 58)
-        r = ALPHABET[mod].encode() + r
-    return b"1" * zeros + r
+        digits.append(_ALPHABET_BYTES[mod])
+    digits.reverse()
+    return b"1" * zeros + bytes(digits)
 
 
 def b58decode(b: Union[bytes, str]) -> bytes:
@@ -40,20 +41,19 @@ def b58decode(b: Union[bytes, str]) -> bytes:
     Args:
         b (Union[bytes, str): b58 encoded input
 
+    Raises:
+        ValueError: Raised when the input has a character outside of the alphabet
+
     Returns:
         bytes: bytes
     """
     if isinstance(b, str):
         b = b.encode("ascii")
-    ones = 0
-    for i in b:
-        if chr(i) == "1":
-            ones += 1
-        else:
-            break
+    ones = len(b) - len(bytes(b).lstrip(b"1"))
     r = 0
-    p = 1
     for i in b:
-        r += (58 ** (len(b) - p)) * ALPHABET.index(chr(i))
-        p += 1
+        digit = _DIGITS[i]
+        if digit < 0:
+            raise ValueError(f"Invalid base58 character {chr(i)!r}")
+        r = r * 58 + digit
     return b"\x00" * ones + r.to_bytes((r.bit_length() + 7) // 8, "big")
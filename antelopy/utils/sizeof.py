@@ -0,0 +1,69 @@
+"""sizeof.py
+
+Approximate memory footprint of object graphs, such as an ABI and its
+compiled model."""
+
+import sys
+from functools import partial
+from types import BuiltinMethodType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+
+def deep_sizeof(*objs: Any) -> int:
+    """Estimates the bytes used by objects and everything they reference.
+    Objects shared between them, such as interned strings, are counted once.
+
+    Args:
+        *objs (Any): the objects
+
+    Returns:
+        int: the approximate size in bytes
+    """
+    seen = set()
+    stack = list(objs)
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, FunctionType):
+            # compiled encoders and decoders keep their state in closures
+            for cell in obj.__closure__ or ():
+                try:
+                    stack.append(cell.cell_contents)
+                except ValueError:
+                    # cell not filled yet
+                    pass
+            stack.extend((obj.__defaults__, obj.__kwdefaults__, obj.__dict__))
+        elif isinstance(obj, partial):
+            stack.extend((obj.func, obj.args, obj.keywords))
+        elif isinstance(obj, (MethodType, BuiltinMethodType)):
+            # e.g. the `pack` of a compiled struct.Struct, but not module functions
+            if not isinstance(obj.__self__, ModuleType):
+                stack.append(obj.__self__)
+            stack.append(getattr(obj, "__func__", None))
+        elif isinstance(obj, ModuleType):
+            continue
+        elif callable(obj) and not hasattr(obj, "__dict__"):
+            # other builtins
+            continue
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    stack.append(getattr(obj, slot, None))
+            # pydantic models keep private attributes outside of __dict__
+            private = getattr(obj, "__pydantic_private__", None)
+            if private:
+                stack.append(private)
+    return size
@@ -1,6 +1,29 @@
+import base64
+import copy
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 from antelopy import AbiCache
+from antelopy.types.abi_def import pack_abi
+
+CHAIN_ID = "1064487b3cd1a897ce03ae5b6a865651747e2e152090f99c1d19d44e01aea5a4"
+TRANSFER = {
+    "from": "stuckatsixpm",
+    "to": "atomictoolsx",
+    "asset_ids": [1099903907686],
+    "memo": "link",
+}
+
+
+class FakeKey:
+    """Signer returning a made-up signature derived from the digest"""
+
+    def sign(self, digest):
+        return "SIG_K1_" + bytes(digest).hex()[:8]
 
 
 @pytest.fixture
@@ -19,3 +42,138 @@ def abi_cache():
     # read from chain
     cache.read_abi("atomictoolsx")
     return cache
+
+
+def chain_abi(abi):
+    """Binary ABI as set on chain by tools that leave out the empty `variants`
+    and `action_results` extensions, which `pack_abi` always writes"""
+    packed = pack_abi(abi)
+    if abi.get("action_results"):
+        return packed
+    return packed[:-2] if not abi.get("variants") else packed[:-1]
+
+
+class LocalNode(ThreadingHTTPServer):
+    """Stand-in chain endpoint serving the ABIs in tests/data"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), NodeHandler)
+        self.chain_id = CHAIN_ID
+        self.requests = []
+        self.head_block_num = 100_000
+        self.lib_block_num = 99_700
+        self.abis = {}
+        self.packed_abis = {}
+        for account in ("atomicassets", "atomictoolsx", "farmersworld"):
+            with open(f"tests/data/{account}.abi", "r", encoding="utf-8") as jfp:
+                self.set_abi(account, json.load(jfp))
+
+    def set_abi(self, account, abi):
+        """Sets an account's ABI, kept in binary the way the chain stores it"""
+        self.abis[account] = abi
+        self.packed_abis[account] = chain_abi(abi) if abi else b""
+
+    @staticmethod
+    def block_id(block_num):
+        return (
+            block_num.to_bytes(4, "big").hex()
+            + hashlib.sha256(str(block_num).encode()).hexdigest()[8:]
+        )
+
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class NodeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        node = self.server
+        node.requests.append((self.path, body))
+        if self.path == "/v1/chain/get_info":
+            return self.reply(
+                200,
+                {
+                    "chain_id": CHAIN_ID,
+                    "head_block_num": node.head_block_num,
+                    "head_block_id": node.block_id(node.head_block_num),
+                    "last_irreversible_block_num": node.lib_block_num,
+                    "last_irreversible_block_id": node.block_id(node.lib_block_num),
+                },
+            )
+        if self.path == "/v1/chain/get_abi":
+            account = body.get("account_name")
+            if account in node.abis:
+                return self.reply(
+                    200, {"account_name": account, "abi": node.abis[account]}
+                )
+            return self.reply(
+                500, {"error": {"what": "(unknown key (eosio::chain::name): x)"}}
+            )
+        if self.path == "/v1/chain/get_raw_abi":
+            account = body.get("account_name")
+            if account not in node.packed_abis:
+                return self.reply(
+                    500, {"error": {"what": "(unknown key (eosio::chain::name): x)"}}
+                )
+            packed = node.packed_abis[account]
+            result = {
+                "account_name": account,
+                "abi_hash": hashlib.sha256(packed).hexdigest() if packed else "0" * 64,
+            }
+            if packed and body.get("abi_hash") != result["abi_hash"]:
+                # like nodeos, without base64 padding
+                result["abi"] = base64.b64encode(packed).decode().rstrip("=")
+            return self.reply(200, result)
+        self.reply(404, {})
+
+
+@pytest.fixture
+def local_node():
+    node = LocalNode()
+    thread = threading.Thread(target=node.serve_forever, daemon=True)
+    thread.start()
+    yield node
+    node.shutdown()
+    node.server_close()
+
+
+@pytest.fixture
+def transfer():
+    return copy.deepcopy(TRANSFER)
+
+
+@pytest.fixture
+def transfer_action(transfer):
+    return {
+        "account": "atomicassets",
+        "name": "transfer",
+        "authorization": [{"actor": "stuckatsixpm", "permission": "active"}],
+        "data": transfer,
+    }
+
+
+@pytest.fixture
+def serialized_transfer():
+    return b"206b77381b8874c6d071a434232769360166b7611700010000046c696e6b"
+
+
+@pytest.fixture
+def fake_key():
+    return FakeKey()
@@ -1,4 +1,4 @@
-from binascii import hexlify
+from binascii import hexlify, unhexlify
 
 from antelopy.serializers import assets
 
@@ -27,3 +27,17 @@ def test_serialize_asset():
         hexlify(assets.serialize_asset("1234.000000 MYTOKEN"))
         == b"80588d4900000000064d59544f4b454e"
     ), "Asset string conversion failed"
+
+
+def test_deserialize_asset():
+    assert (
+        assets.deserialize_asset(unhexlify("009236bb1c0000000857415800000000"))
+        == "1234.00000000 WAX"
+    ), "Asset bytes conversion failed"
+    assert (
+        assets.deserialize_asset(unhexlify("80588d4900000000064d59544f4b454e"))
+        == "1234.000000 MYTOKEN"
+    ), "Asset bytes conversion failed"
+    assert (
+        assets.deserialize_symbol(unhexlify("0857415800000000")) == "8,WAX"
+    ), "Symbol bytes conversion failed"
@@ -0,0 +1,50 @@
+import anyio
+import pytest
+
+from antelopy import AbiCache
+from antelopy.exceptions.exceptions import AccountNotFoundError
+
+pytest.importorskip("aiohttp")
+
+from antelopy.cache.async_chain_interface import AsyncChainInterface  # noqa: E402
+
+
+@pytest.mark.anyio
+async def test_create_async(local_node):
+    cache = await AbiCache.create_async(local_node.endpoint, max_connections=4)
+    try:
+        assert cache.chain_id.hex() == local_node.chain_id
+        await cache.read_abi_async("atomicassets")
+        assert (
+            cache.serialize_data(
+                "atomicassets",
+                "transfer",
+                {
+                    "from": "stuckatsixpm",
+                    "to": "atomictoolsx",
+                    "asset_ids": [1099903907686],
+                    "memo": "link",
+                },
+            )
+            == b"206b77381b8874c6d071a434232769360166b7611700010000046c696e6b"
+        )
+    finally:
+        await cache.aclose()
+
+
+@pytest.mark.anyio
+async def test_concurrent_reads(local_node):
+    async with AsyncChainInterface(local_node.endpoint, max_connections=2) as chain:
+        results = {}
+
+        async def fetch(account):
+            results[account] = await chain.get_raw_abi(account)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(10):
+                for account in local_node.abis:
+                    tg.start_soon(fetch, account)
+        assert results == local_node.abis
+        assert len(local_node.requests) == 30
+        with pytest.raises(AccountNotFoundError):
+            await chain.get_raw_abi("nobody")
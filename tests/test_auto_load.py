@@ -0,0 +1,93 @@
+import threading
+
+import anyio
+import pytest
+
+from antelopy import AbiCache
+from antelopy.exceptions.exceptions import (
+    ABINotCachedError,
+    ABINotFoundError,
+    AccountNotFoundError,
+)
+
+
+def get_abi_calls(node, account):
+    return [
+        r
+        for r in node.requests
+        if r[0] == "/v1/chain/get_raw_abi" and r[1]["account_name"] == account
+    ]
+
+
+def test_disabled_by_default(local_node, transfer):
+    cache = AbiCache(local_node.endpoint)
+    with pytest.raises(ABINotCachedError):
+        cache.serialize_data("atomicassets", "transfer", transfer)
+
+
+def test_single_flight_threads(local_node, transfer, serialized_transfer):
+    cache = AbiCache(local_node.endpoint, auto_load=True)
+    results = []
+
+    def serialize():
+        results.append(cache.serialize_data("atomicassets", "transfer", transfer))
+
+    threads = [threading.Thread(target=serialize) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [serialized_transfer] * 16
+    assert len(get_abi_calls(local_node, "atomicassets")) == 1
+
+
+def test_negative_cache(local_node):
+    local_node.set_abi("noabi", {})
+    cache = AbiCache(local_node.endpoint, auto_load=True)
+    for account, error in (
+        ("nobody", AccountNotFoundError),
+        ("noabi", ABINotFoundError),
+    ):
+        with pytest.raises(error):
+            cache.get_cached_abi(account)
+        for _ in range(3):
+            with pytest.raises(ABINotFoundError):
+                cache.get_cached_abi(account)
+        assert len(get_abi_calls(local_node, account)) == 1
+    # nothing is kept per account once its load is done
+    assert cache._load_locks == {}
+
+
+def test_missing_accounts_expire(local_node):
+    cache = AbiCache(local_node.endpoint, auto_load=True, negative_ttl=0)
+    for account in ("nobody", "nobody2", "nobody3"):
+        with pytest.raises(AccountNotFoundError):
+            cache.get_cached_abi(account)
+    assert list(cache._missing) == ["nobody3"]
+    assert cache._load_locks == {}
+
+
+@pytest.mark.anyio
+async def test_single_flight_tasks(local_node, transfer, serialized_transfer):
+    pytest.importorskip("aiohttp")
+    cache = AbiCache(local_node.endpoint)
+    results = []
+
+    async def serialize():
+        results.append(
+            await cache.serialize_data_async("atomicassets", "transfer", transfer)
+        )
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for _ in range(16):
+                tg.start_soon(serialize)
+        assert results == [serialized_transfer] * 16
+        assert len(get_abi_calls(local_node, "atomicassets")) == 1
+        with pytest.raises(AccountNotFoundError):
+            await cache.ensure_abi_async("nobody")
+        with pytest.raises(ABINotFoundError):
+            await cache.ensure_abi_async("nobody")
+        assert len(get_abi_calls(local_node, "nobody")) == 1
+    finally:
+        await cache.aclose()
@@ -0,0 +1,15 @@
+import pytest
+
+from antelopy.utils.base58 import b58decode, b58encode
+
+
+def test_b58_round_trip():
+    assert b58encode(b"\x00\x00hello world") == b"11StV1DL6CwTryKyV"
+    assert b58decode("11StV1DL6CwTryKyV") == b"\x00\x00hello world"
+    assert b58encode(b"") == b""
+    assert b58decode(b"") == b""
+
+
+def test_b58_invalid_character():
+    with pytest.raises(ValueError):
+        b58decode("0OIl")
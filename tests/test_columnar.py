@@ -0,0 +1,199 @@
+from array import array
+
+import pytest
+
+from antelopy import AbiCache
+
+np = pytest.importorskip("numpy")
+
+from antelopy.exceptions.exceptions import SerializationError  # noqa: E402
+from antelopy.types.abi import Abi  # noqa: E402
+from antelopy.types.columnar import AssetColumn  # noqa: E402
+
+
+def test_fixed_width_columns(abi_cache: AbiCache):
+    ids = np.array([1099903907686, 1, 2**63], dtype=np.uint64)
+    owners = ["stuckatsixpm", "atomictoolsx", "c4vr2.wam"]
+    rows = [
+        {
+            "payer": "stuckatsixpm",
+            "asset_owner": owner,
+            "asset_id": int(i),
+            "token_to_back": q,
+        }
+        for owner, i, q in zip(
+            owners, ids, ["1.00000000 WAX", "0.00000001 WAX", "2.50000000 WAX"]
+        )
+    ]
+    result = abi_cache.serialize_columns(
+        "atomicassets",
+        "backasset",
+        {
+            "asset_owner": owners,
+            "asset_id": ids,
+            "token_to_back": AssetColumn([100000000, 1, 250000000], "8,WAX"),
+        },
+        constants={"payer": "stuckatsixpm"},
+    )
+    assert result == abi_cache.serialize_many("atomicassets", "backasset", rows)
+
+
+def test_variable_width_columns(abi_cache: AbiCache):
+    columns = {
+        "from": ["stuckatsixpm", "atomictoolsx"],
+        "to": ["atomictoolsx", "stuckatsixpm"],
+        "asset_ids": [[1099903907686], [1, 2, 3]],
+        "memo": ["link", ""],
+    }
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    result = abi_cache.serialize_columns("atomicassets", "transfer", columns, raw=True)
+    assert result == abi_cache.serialize_many(
+        "atomicassets", "transfer", rows, raw=True
+    )
+
+
+def test_column_errors(abi_cache: AbiCache):
+    with pytest.raises(ValueError):
+        abi_cache.serialize_columns(
+            "atomicassets", "withdraw", {"owner": ["a"], "token_to_withdraw": []}
+        )
+
+
+def test_lossy_numeric_columns():
+    abi = Abi(
+        name="num",
+        structs=[
+            {
+                "name": "row",
+                "base": "",
+                "fields": [
+                    {"name": "u", "type": "uint64"},
+                    {"name": "i", "type": "int8"},
+                    {"name": "b", "type": "bool"},
+                    {"name": "q", "type": "asset"},
+                ],
+            }
+        ],
+    )
+    struct = abi.find_struct("row")
+    columns = {
+        "u": np.array([1, 2**40], dtype=np.int64),
+        "i": [-128, 127],
+        "b": np.array([True, False]),
+        "q": AssetColumn(np.array([1, 250000000]), "8,WAX"),
+    }
+    rows = [
+        {"u": 1, "i": -128, "b": True, "q": "0.00000001 WAX"},
+        {"u": 2**40, "i": 127, "b": False, "q": "2.50000000 WAX"},
+    ]
+    assert abi.serialize_columns(struct, columns) == [
+        abi.serialize(struct, row) for row in rows
+    ]
+    for name, column in (
+        ("u", np.array([-1, 1], dtype=np.int64)),
+        ("u", np.array([1.7, 1.0])),
+        ("i", [1, 128]),
+        ("i", np.array([-129, 0], dtype=np.int16)),
+        ("b", np.array([2, 0], dtype=np.uint8)),
+        ("q", AssetColumn(np.array([1.5, 1.0]), "8,WAX")),
+        ("q", AssetColumn(np.array([2**63, 1], dtype=np.uint64), "8,WAX")),
+    ):
+        with pytest.raises(SerializationError):
+            abi.serialize_columns(struct, {**columns, name: column})
+
+
+def test_empty_columns(abi_cache: AbiCache):
+    assert (
+        abi_cache.serialize_columns(
+            "atomicassets",
+            "backasset",
+            {
+                "asset_owner": [],
+                "asset_id": np.array([], dtype=np.uint64),
+                "token_to_back": AssetColumn([], "8,WAX"),
+            },
+            constants={"payer": "stuckatsixpm"},
+        )
+        == []
+    )
+    columns = {"from": [], "to": [], "asset_ids": [], "memo": []}
+    assert abi_cache.serialize_columns("atomicassets", "transfer", columns) == []
+
+
+def test_deserialize_columns(abi_cache: AbiCache):
+    rows = [
+        {
+            "payer": "stuckatsixpm",
+            "asset_owner": "c4vr2.wam",
+            "asset_id": 1099903907686,
+            "token_to_back": "1.00000000 WAX",
+        },
+        {
+            "payer": "atomictoolsx",
+            "asset_owner": "stuckatsixpm",
+            "asset_id": 1,
+            "token_to_back": "0.00000001 WAX",
+        },
+    ]
+    serialized = abi_cache.serialize_many("atomicassets", "backasset", rows)
+    columns = abi_cache.deserialize_columns(
+        "atomicassets", "backasset", [s.decode() for s in serialized]
+    )
+    assert columns["payer"] == ["stuckatsixpm", "atomictoolsx"]
+    assert columns["asset_owner"] == ["c4vr2.wam", "stuckatsixpm"]
+    assert columns["asset_id"].dtype == np.dtype("<u8")
+    assert columns["asset_id"].tolist() == [1099903907686, 1]
+    assert columns["token_to_back"] == ["1.00000000 WAX", "0.00000001 WAX"]
+
+    transfers = [
+        {"from": "a", "to": "b", "asset_ids": [1, 2], "memo": "x"},
+        {"from": "c", "to": "d", "asset_ids": [], "memo": ""},
+    ]
+    serialized = abi_cache.serialize_many(
+        "atomicassets", "transfer", transfers, raw=True
+    )
+    columns = abi_cache.deserialize_columns("atomicassets", "transfer", serialized)
+    assert columns == {
+        "from": ["a", "c"],
+        "to": ["b", "d"],
+        "asset_ids": [array("Q", [1, 2]), array("Q")],
+        "memo": ["x", ""],
+    }
+
+
+def test_deserialize_extension_columns():
+    abi = Abi(
+        name="ext",
+        structs=[
+            {
+                "name": "row",
+                "base": "",
+                "fields": [
+                    {"name": "a", "type": "string"},
+                    {"name": "b", "type": "uint32$"},
+                ],
+            }
+        ],
+    )
+    struct = abi.find_struct("row")
+    rows = [
+        abi.serialize(struct, {"a": "x"}),
+        abi.serialize(struct, {"a": "y", "b": 3}),
+        abi.serialize(struct, {"a": "z"}),
+    ]
+    assert abi.deserialize_columns(struct, rows) == {
+        "a": ["x", "y", "z"],
+        "b": [None, 3, None],
+    }
+
+
+def test_deserialize_empty_columns(abi_cache: AbiCache):
+    columns = abi_cache.deserialize_columns("atomicassets", "backasset", [])
+    assert columns["asset_id"].tolist() == []
+    assert columns["payer"] == []
+    assert abi_cache.deserialize_columns("atomicassets", "transfer", []) == {
+        "from": [],
+        "to": [],
+        "asset_ids": [],
+        "memo": [],
+    }
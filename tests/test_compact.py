@@ -0,0 +1,35 @@
+import json
+
+from antelopy import AbiCache
+from antelopy.types.compact import CompactAbi
+
+
+def test_compact_cache(transfer):
+    cache = AbiCache(chain_id="00" * 32, compact=True)
+    cache.read_abi_from_json("atomicassets", "tests/data/atomicassets.abi")
+    full = AbiCache(chain_id="00" * 32)
+    full.read_abi_from_json("atomicassets", "tests/data/atomicassets.abi")
+    abi = cache.get_cached_abi("atomicassets")
+    assert isinstance(abi, CompactAbi)
+    assert not hasattr(abi, "__dict__")
+    assert cache._raw_abis == {}
+    assert cache.serialize_data(
+        "atomicassets", "transfer", transfer
+    ) == full.serialize_data("atomicassets", "transfer", transfer)
+    serialized = cache.serialize_action_bytes("atomicassets", "transfer", transfer)
+    assert (
+        cache.deserialize_data("atomicassets", "transfer", serialized)["memo"] == "link"
+    )
+
+
+def test_compact_json(local_node):
+    cache = AbiCache(local_node.endpoint, compact=True)
+    cache.read_abi("atomicassets")
+    raw_abi = json.loads(cache.dump_abi_as_json("atomicassets"))
+    original = local_node.abis["atomicassets"]
+    assert raw_abi["structs"] == original["structs"]
+    assert raw_abi["ricardian_clauses"] == []
+    assert all(a["ricardian_contract"] == "" for a in raw_abi["actions"])
+    assert any(a["ricardian_contract"] for a in original["actions"])
+    # the hash is still the one of the full ABI on chain
+    assert cache.refresh_if_changed("atomicassets") is False
@@ -0,0 +1,111 @@
+import json
+from binascii import hexlify
+
+import pytest
+
+from antelopy.exceptions import SerializationError
+from antelopy.types.abi import Abi
+
+
+def load_abi(name: str) -> Abi:
+    with open(f"tests/data/{name}.abi", "r", encoding="utf-8") as jfp:
+        return Abi(name=name, **json.load(jfp))
+
+
+def test_plans_compiled_on_load():
+    abi = load_abi("atomicassets")
+    assert set(abi._compiler.plans) == {s.name for s in abi.structs}
+    plan = abi.get_plan(abi.get_action("transfer"))
+    assert [f[0] for f in plan.fields] == ["from", "to", "asset_ids", "memo"]
+
+
+def test_plan_serialization():
+    abi = load_abi("atomicassets")
+    data = {
+        "asset_ids": ["1099903907686"],
+        "from": "stuckatsixpm",
+        "memo": "link",
+        "to": "atomictoolsx",
+    }
+    assert (
+        hexlify(abi.serialize(abi.get_action("transfer"), data))
+        == b"206b77381b8874c6d071a434232769360166b7611700010000046c696e6b"
+    ), "compiled plan serialization failed"
+
+
+def test_struct_base_and_variant_list():
+    abi = Abi(
+        name="mock",
+        types=[{"new_type_name": "ids", "type": "uint16[]"}],
+        structs=[
+            {"name": "parent", "base": "", "fields": [{"name": "a", "type": "uint8"}]},
+            {
+                "name": "child",
+                "base": "parent",
+                "fields": [
+                    {"name": "b", "type": "ids"},
+                    {"name": "c", "type": "var[]"},
+                    {"name": "d", "type": "uint8?"},
+                ],
+            },
+        ],
+        variants=[{"name": "var", "types": ["uint8", "string"]}],
+    )
+    data = {"a": 1, "b": [2, 3], "c": [["string", "x"], ["uint8", 4]], "d": None}
+    assert (
+        hexlify(abi.serialize(abi.find_struct("child"), data))
+        == b"01020200030002010178000400"
+    ), "base struct and variant list serialization failed"
+
+
+def test_unsupported_type():
+    abi = Abi(
+        name="mock",
+        structs=[
+            {"name": "s", "base": "", "fields": [{"name": "a", "type": "unknown"}]}
+        ],
+    )
+    with pytest.raises(SerializationError):
+        abi.serialize(abi.find_struct("s"), {"a": 1})
+
+
+def test_indexed_lookups():
+    abi = load_abi("atomicassets")
+    assert abi.get_action("transfer").name == "transfer"
+    assert abi.get_action("notanaction") is None
+    assert abi.find_type("ATTRIBUTE_MAP").type == "pair_string_ATOMIC_ATTRIBUTE"
+    assert abi.find_struct("transfer").name == "transfer"
+    variant = abi.find_variant(abi.find_type("ATOMIC_ATTRIBUTE").type)
+    assert variant.type_index("string") == variant.types.index("string")
+    assert variant.type_index("notatype") is None
+
+
+def test_packed_runs():
+    abi = Abi(
+        name="mock",
+        types=[{"new_type_name": "id_type", "type": "uint64"}],
+        structs=[
+            {
+                "name": "row",
+                "base": "",
+                "fields": [
+                    {"name": "owner", "type": "name"},
+                    {"name": "id", "type": "id_type"},
+                    {"name": "flag", "type": "bool"},
+                    {"name": "memo", "type": "string"},
+                    {"name": "count", "type": "uint32"},
+                ],
+            }
+        ],
+    )
+    struct = abi.find_struct("row")
+    plan = abi.get_plan(struct)
+    # owner, id and flag are packed together; count is on its own
+    assert [s[0] for s in plan.steps] == [None, "memo", "count"]
+    data = {"owner": "eosio", "id": 7, "flag": True, "memo": "hi", "count": 9}
+    expected = b"0000000000ea305507000000000000000102686909000000"
+    assert hexlify(abi.serialize(struct, data)) == expected
+    assert abi.deserialize(struct, bytes.fromhex(expected.decode())) == data
+    # numbers given as str fall back to the field encoders
+    assert hexlify(abi.serialize(struct, {**data, "id": "7"})) == expected
+    assert hexlify(abi.serialize(struct, {**data, "owner": None})) == expected[16:]
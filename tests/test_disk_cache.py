@@ -0,0 +1,63 @@
+import json
+import os
+import threading
+
+from antelopy import AbiCache
+from antelopy.cache.disk import AbiDiskCache
+from antelopy.types.abi_def import abi_hash, pack_abi, unpack_abi
+
+
+def get_abi_calls(node):
+    return [r for r in node.requests if r[0] == "/v1/chain/get_raw_abi"]
+
+
+def test_abi_def_round_trip():
+    for account in ("atomicassets", "farmersworld", "mock"):
+        with open(f"tests/data/{account}.abi", "r", encoding="utf-8") as jfp:
+            raw_abi = json.load(jfp)
+        packed = pack_abi(raw_abi)
+        assert len(packed) < len(json.dumps(raw_abi))
+        unpacked = unpack_abi(packed)
+        assert {k: unpacked[k] for k in raw_abi} == raw_abi
+
+
+def test_unpacked_defaults_not_shared(local_node):
+    first = unpack_abi(local_node.packed_abis["atomictoolsx"])
+    second = unpack_abi(local_node.packed_abis["farmersworld"])
+    first["action_results"].append({"name": "x", "result_type": "uint8"})
+    assert second["action_results"] == []
+    assert unpack_abi(local_node.packed_abis["atomictoolsx"])["action_results"] == []
+
+
+def test_shared_directory(local_node, tmp_path):
+    caches = [AbiCache(local_node.endpoint, cache_dir=str(tmp_path)) for _ in range(8)]
+    threads = [
+        threading.Thread(target=c.read_abi, args=("atomicassets",)) for c in caches
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # one process fetched it, the others read the stored copy
+    assert len(get_abi_calls(local_node)) == 1
+    # stored under the hash the chain reports
+    packed = local_node.packed_abis["atomicassets"]
+    assert os.listdir(tmp_path) == [f"atomicassets@{abi_hash(packed)}.abi"]
+    with open(tmp_path / os.listdir(tmp_path)[0], "rb") as fp:
+        assert fp.read() == packed
+
+    # loaded lazily on first use after a restart
+    restarted = AbiCache(local_node.endpoint, cache_dir=str(tmp_path))
+    assert restarted.get_cached_abi("atomicassets").name == "atomicassets"
+    restarted.read_abi("atomicassets", refresh=True)
+    assert len(get_abi_calls(local_node)) == 2
+
+
+def test_corrupt_file_ignored(tmp_path):
+    disk = AbiDiskCache(str(tmp_path))
+    with open("tests/data/mock.abi", "r", encoding="utf-8") as jfp:
+        hash_hex = disk.store_packed("mock", pack_abi(json.load(jfp)))
+    with open(disk.path("mock", hash_hex), "r+b") as fp:
+        fp.write(b"\x00")
+    assert disk.load("mock") is None
+    assert disk.load("nobody") is None
@@ -1,5 +1,8 @@
 from binascii import hexlify
 
+import pytest
+
+from antelopy.exceptions.exceptions import DeserializationError, SerializationError
 from antelopy.serializers import keys
 
 
@@ -34,3 +37,39 @@ def test_serialize_signature():
         )
         == b"001f6ac18f71903cc23d6aad1f7798b50ca93516c4e170ec42e6a254c07d22b589d24d84142cfd1b1dfd36ba112d633111cdb897df26fb9f414ff8f4c2703fd6b0f8"
     ), "K1 Signature failed conversion"
+
+
+def test_deserialize_public_key():
+    key = "EOS5o5CnexdMvaV83fbmNBQVhUAi6zuJQHm3vY4p2L2fzH7VUGp7p"
+    assert (
+        keys.deserialize_public_key(keys.serialize_public_key(key)) == key
+    ), "Key bytes to EOS Public Key failed"
+
+
+def test_deserialize_signature():
+    sig = "SIG_K1_K9Dr5zUy9qsvySPQ4fWFRXKuadDPcXo3hRkeyo4gMuE8D6uaRZbiWiCuZHEB51X1aoqP8q1jUGSVAW7Qxydu6GvDvKzfRt"
+    assert (
+        keys.deserialize_signature(keys.serialize_signature(sig)) == sig
+    ), "Signature bytes to K1 Signature failed"
+
+
+def test_public_key_cache():
+    key = "EOS5m4K6EFnMEmAUekqnxqfaM5b2vCJFooD9JH352iXJDQ9umMDs6"
+    keys.serialize_public_key.cache_clear()
+    serialized = keys.serialize_public_key(key)
+    assert keys.serialize_public_key(key) is serialized
+    assert keys.serialize_public_key.cache_info().hits == 1
+    assert keys.deserialize_public_key(memoryview(serialized)) == key
+
+
+def test_unknown_key_type():
+    with pytest.raises(SerializationError):
+        keys.serialize_public_key(
+            "PUB_XX_6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5BoDq"
+        )
+    with pytest.raises(SerializationError):
+        keys.serialize_signature("SIG_XX_" + "1" * 40)
+    with pytest.raises(DeserializationError):
+        keys.deserialize_public_key(b"\x07" + bytes(33))
+    with pytest.raises(DeserializationError):
+        keys.deserialize_signature(b"\x07" + bytes(65))
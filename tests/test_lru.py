@@ -0,0 +1,69 @@
+import functools
+import struct
+
+from antelopy import AbiCache
+from antelopy.cache.lru import LRUCache
+from antelopy.utils.sizeof import deep_sizeof
+
+
+def test_lru_entries_and_pinning():
+    evicted = []
+    cache = LRUCache(max_entries=2, on_evict=lambda k, v: evicted.append(k))
+    cache.pin("a")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    assert evicted == ["b"]
+    assert cache.get("c") == 3
+    assert cache.get("b") is None
+    cache.unpin("a")
+    cache["d"] = 4
+    assert evicted == ["b", "a"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 2)
+    assert list(cache) == ["c", "d"]
+
+
+def test_lru_byte_budget():
+    cache = LRUCache(max_bytes=10, sizeof=lambda k, v: len(v))
+    cache["a"] = "xxxx"
+    cache["b"] = "xxxx"
+    assert cache.get("a") == "xxxx"
+    cache["c"] = "xxxx"
+    # b was the least recently used
+    assert list(cache) == ["a", "c"]
+    assert cache.total_bytes == 8
+    # an entry over the budget on its own is still kept
+    cache["d"] = "x" * 20
+    assert list(cache) == ["d"]
+
+
+def test_bounded_abi_cache():
+    cache = AbiCache("http://127.0.0.1:1", chain_id="00" * 32, max_abis=2)
+    cache.pin_abi("atomicassets")
+    for account in ("atomicassets", "farmersworld", "craft.tag", "mock"):
+        cache.read_abi_from_json(account, f"tests/data/{account}.abi")
+    stats = cache.cache_stats()
+    assert sorted(stats["sizes"]) == ["atomicassets", "mock"]
+    assert stats["evictions"] == 2
+    assert stats["sizes"]["atomicassets"] > stats["sizes"]["mock"] > 0
+    assert sorted(cache._raw_abis) == ["atomicassets", "mock"]
+
+
+def test_deep_sizeof_callables():
+    state = list(range(1000))
+    state_size = deep_sizeof(state)
+
+    def make_encoder(values):
+        def encode(buf):
+            buf.extend(values)
+
+        return encode
+
+    assert deep_sizeof(make_encoder(state)) > state_size
+    assert deep_sizeof(functools.partial(sorted, state)) > state_size
+    assert deep_sizeof(functools.partial(len, key=state)) > state_size
+    packer = struct.Struct("<" + "Q" * 1000)
+    assert deep_sizeof(packer.pack) >= deep_sizeof(packer)
+    # shared modules aren't counted
+    assert deep_sizeof(make_encoder(struct)) < state_size
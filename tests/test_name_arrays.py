@@ -0,0 +1,25 @@
+import pytest
+
+from antelopy.serializers import names
+
+np = pytest.importorskip("numpy")
+
+from antelopy.serializers import name_arrays  # noqa: E402
+
+NAMES = ["stuckatsixpm", "c4vr2.wam", "abcdefg12345a", "eosio", ""]
+
+
+def test_encode_names():
+    encoded = name_arrays.encode_names(NAMES)
+    assert encoded.dtype == np.uint64
+    assert encoded.astype("<u8").tobytes() == b"".join(
+        names.serialize_name(n) for n in NAMES
+    )
+
+
+def test_decode_names():
+    serialized = b"".join(names.serialize_name(n) for n in NAMES)
+    assert name_arrays.decode_names(serialized) == NAMES
+    values = np.frombuffer(serialized, dtype="<u8")
+    assert name_arrays.decode_names(values) == NAMES
+    assert name_arrays.decode_names(np.array([], dtype=np.uint64)) == []
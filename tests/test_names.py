@@ -25,3 +25,24 @@ def test_deserialize_name():
     assert (
         names.deserialize_name(unhexlify("56c810812d95d031")) == "abcdefg12345a"
     ), "Name conversion from bytes to string failed"
+
+
+def test_name_uint64():
+    assert names.name_to_uint64("eosio") == 6138663577826885632
+    assert names.uint64_to_name(6138663577826885632) == "eosio"
+    assert names.uint64_to_name(0) == ""
+    # the 13th character only has 4 bits
+    assert names.uint64_to_name(names.name_to_uint64("zzzzzzzzzzzzz")) == (
+        "zzzzzzzzzzzzj"
+    )
+
+
+def test_name_cache():
+    names.serialize_name.cache_clear()
+    for _ in range(3):
+        names.serialize_name("stuckatsixpm")
+    info = names.serialize_name.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+    assert names.deserialize_name(memoryview(b"\x20\x6b\x77\x38\x1b\x88\x74\xc6")) == (
+        "stuckatsixpm"
+    )
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+from antelopy import AbiCache
+from antelopy.exceptions import ChainEndpointNotDefinedError
+
+
+def test_cache_without_endpoint(transfer, serialized_transfer):
+    cache = AbiCache(chain_id="00" * 32)
+    cache.read_abi_from_json("atomicassets", "tests/data/atomicassets.abi")
+    assert cache.chain_id == bytes(32)
+    assert (
+        cache.serialize_data("atomicassets", "transfer", transfer)
+        == serialized_transfer
+    )
+    with pytest.raises(ChainEndpointNotDefinedError):
+        cache.read_abi("atomictoolsx")
+
+
+def test_chain_id_needs_endpoint():
+    cache = AbiCache()
+    with pytest.raises(ChainEndpointNotDefinedError):
+        cache.chain_id
+
+
+def test_lazy_chain_id(local_node):
+    cache = AbiCache(local_node.endpoint)
+    assert local_node.requests == []
+    assert cache.chain_id.hex() == local_node.chain_id
+    assert cache.chain_id.hex() == local_node.chain_id
+    assert [path for path, _ in local_node.requests] == ["/v1/chain/get_info"]
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, antelopy\n"
+        "heavy = ('antelopy.cache.abicache', 'pydantic', 'requests', 'numpy')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+        "antelopy.AbiCache\n"
+        "print('requests' in sys.modules, 'pydantic' in sys.modules)\n"
+        "late = ('asyncio', 'concurrent.futures', 'multiprocessing')\n"
+        "print(','.join(m for m in late if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert out == ["", "False True", ""]
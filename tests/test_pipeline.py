@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+import pytest
+
+from antelopy import AbiCache
+from antelopy.cache.pipeline import PushPipeline
+from antelopy.cache.tapos import TaposProvider
+from antelopy.exceptions.exceptions import (
+    ActionNotFoundError,
+    UnsupportedPackageError,
+)
+from antelopy.types.transaction import Transaction
+
+CHAIN_ID = "00" * 32
+# block 1234
+BLOCK_ID = "000004d2" + "11" * 28
+
+
+class FakeAccount:
+    def __init__(self, key):
+        self.key = key
+
+
+class ThreadRecordingKey:
+    def __init__(self, key):
+        self.key = key
+        self.threads = set()
+
+    def sign(self, digest):
+        self.threads.add(threading.get_ident())
+        return self.key.sign(digest)
+
+
+class FakeRpc:
+    def __init__(self):
+        self.pushed = []
+        self.pushing = 0
+        self.max_pushing = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def push_transaction(self, signatures, serialized_transaction):
+        self.pushing += 1
+        self.max_pushing = max(self.max_pushing, self.pushing)
+        try:
+            await self.release.wait()
+            await asyncio.sleep(0.001)
+            self.pushed.append(serialized_transaction)
+            return {"signatures": signatures, "packed_trx": serialized_transaction}
+        finally:
+            self.pushing -= 1
+
+
+def make_cache():
+    cache = AbiCache(chain_package="aioeos", chain_id=CHAIN_ID)
+    cache.read_abi_from_json("atomicassets", "tests/data/atomicassets.abi")
+
+    async def get_info():
+        return {"last_irreversible_block_id": BLOCK_ID}
+
+    cache.tapos = TaposProvider(get_info_async=get_info)
+    return cache
+
+
+@pytest.fixture
+def make_transfer(transfer_action):
+    def make(memo, action="transfer"):
+        data = {**transfer_action["data"], "memo": memo}
+        return Transaction(actions=[{**transfer_action, "name": action, "data": data}])
+
+    return make
+
+
+@pytest.mark.anyio
+async def test_pipeline_results_and_limits(make_transfer, fake_key):
+    cache = make_cache()
+    rpcs = [FakeRpc(), FakeRpc()]
+    key = ThreadRecordingKey(fake_key)
+    async with PushPipeline(
+        cache, rpcs, [FakeAccount(key)], max_in_flight=8, max_per_endpoint=2
+    ) as pipeline:
+        futures = [await pipeline.submit(make_transfer(f"memo {i}")) for i in range(40)]
+        results = await asyncio.gather(*futures)
+    assert all(rpc.pushed for rpc in rpcs)
+    assert max(rpc.max_pushing for rpc in rpcs) <= 2
+    assert sum(len(rpc.pushed) for rpc in rpcs) == 40
+    for i, result in enumerate(results):
+        trx = cache.deserialize_transaction(result["packed_trx"])
+        assert trx.ref_block_num == 1234
+        assert trx.actions[0].data["memo"] == f"memo {i}"
+        assert result["signatures"][0].startswith("SIG_K1_")
+    # signed off the event loop
+    assert threading.get_ident() not in key.threads
+
+
+@pytest.mark.anyio
+async def test_pipeline_errors_and_backpressure(make_transfer, fake_key):
+    cache = make_cache()
+    rpc = FakeRpc()
+    rpc.release.clear()
+    pipeline = PushPipeline(
+        cache, rpc, [FakeAccount(fake_key)], max_in_flight=1, queue_size=2
+    )
+    bad = pipeline.submit_nowait(make_transfer("bad", action="nosuchaction"))
+    good = [pipeline.submit_nowait(make_transfer("good"))]
+    await asyncio.sleep(0.01)
+    # one transaction is waiting on the endpoint, the queue holds two more
+    good += [pipeline.submit_nowait(make_transfer("good")) for _ in range(2)]
+    with pytest.raises(asyncio.QueueFull):
+        pipeline.submit_nowait(make_transfer("good"))
+    rpc.release.set()
+    await pipeline.close()
+    with pytest.raises(ActionNotFoundError):
+        bad.result()
+    assert len(await asyncio.gather(*good)) == 3
+
+
+def test_pipeline_package():
+    cache = AbiCache(chain_package="eospy", chain_id=CHAIN_ID)
+    with pytest.raises(UnsupportedPackageError):
+        PushPipeline(cache, FakeRpc(), [])
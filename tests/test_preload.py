@@ -0,0 +1,32 @@
+import json
+
+from antelopy import AbiCache
+from antelopy.exceptions.exceptions import AccountNotFoundError
+from antelopy.types.abi_def import unpack_abi
+
+
+def test_read_abis(local_node):
+    cache = AbiCache(local_node.endpoint)
+    failures = cache.read_abis(
+        ["atomicassets", "nobody", "atomictoolsx", "farmersworld"], max_workers=4
+    )
+    assert list(failures) == ["nobody"]
+    assert isinstance(failures["nobody"], AccountNotFoundError)
+    for account, packed in local_node.packed_abis.items():
+        assert cache.get_cached_raw_abi(account) == unpack_abi(packed)
+
+
+def test_read_abi_manifest(local_node, tmp_path):
+    manifest = tmp_path / "manifest.json"
+    (tmp_path / "mock.abi").write_text(
+        open("tests/data/mock.abi", "r", encoding="utf-8").read()
+    )
+    manifest.write_text(
+        json.dumps({"mock": "mock.abi", "atomicassets": None, "missing": "nope.abi"})
+    )
+    cache = AbiCache(local_node.endpoint)
+    failures = cache.read_abi_manifest(str(manifest))
+    assert list(failures) == ["missing"]
+    assert isinstance(failures["missing"], FileNotFoundError)
+    assert cache.get_cached_abi("mock").name == "mock"
+    assert cache.get_cached_abi("atomicassets").name == "atomicassets"
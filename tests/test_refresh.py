@@ -0,0 +1,88 @@
+import copy
+import time
+
+from antelopy import AbiCache
+from antelopy.types.abi_def import abi_hash, pack_abi
+
+
+def raw_abi_calls(node):
+    return [r for r in node.requests if r[0] == "/v1/chain/get_raw_abi"]
+
+
+def upgrade(node, account):
+    abi = copy.deepcopy(node.abis[account])
+    abi["structs"].append(
+        {"name": "newaction", "base": "", "fields": [{"name": "x", "type": "uint8"}]}
+    )
+    abi["actions"].append(
+        {"name": "newaction", "type": "newaction", "ricardian_contract": ""}
+    )
+    node.set_abi(account, abi)
+
+
+def test_refresh_if_changed(local_node):
+    cache = AbiCache(local_node.endpoint)
+    cache.read_abi("atomicassets")
+    abi = cache.get_cached_abi("atomicassets")
+    assert cache.refresh_if_changed("atomicassets") is False
+    assert cache.get_cached_abi("atomicassets") is abi
+    # the known hash was sent, so the node left out the ABI
+    assert raw_abi_calls(local_node)[-1][1]["abi_hash"] == cache.abi_hash(
+        "atomicassets"
+    )
+
+    upgrade(local_node, "atomicassets")
+    assert cache.refresh_if_changed("atomicassets") is True
+    assert cache.serialize_data("atomicassets", "newaction", {"x": 5}) == b"05"
+    assert cache.refresh_if_changed("atomicassets") is False
+
+
+def test_chain_hash(local_node):
+    # the node's bytes leave out extensions that re-packing the JSON would add
+    packed = local_node.packed_abis["atomictoolsx"]
+    assert pack_abi(local_node.abis["atomictoolsx"]) != packed
+    cache = AbiCache(local_node.endpoint)
+    cache.read_abi("atomictoolsx")
+    assert cache.abi_hash("atomictoolsx") == abi_hash(packed)
+    assert cache.refresh_if_changed("atomictoolsx") is False
+    assert raw_abi_calls(local_node)[-1][1]["abi_hash"] == abi_hash(packed)
+
+    for compact in (False, True):
+        cache = AbiCache(local_node.endpoint, compact=compact)
+        cache.read_abi_from_json("atomictoolsx", "tests/data/atomictoolsx.abi")
+        abi = cache.get_cached_abi("atomictoolsx")
+        # the hash of a JSON ABI isn't known until it's checked against chain
+        assert cache.abi_hash("atomictoolsx") is None
+        assert cache.refresh_if_changed("atomictoolsx") is False
+        assert cache.get_cached_abi("atomictoolsx") is abi
+        assert cache.abi_hash("atomictoolsx") == abi_hash(packed)
+
+
+def test_ttl(local_node, tmp_path):
+    cache = AbiCache(local_node.endpoint, cache_dir=str(tmp_path), abi_ttl=0.05)
+    cache.read_abi("atomictoolsx")
+    cache.get_cached_abi("atomictoolsx")
+    assert len(raw_abi_calls(local_node)) == 1
+    time.sleep(0.06)
+    upgrade(local_node, "atomictoolsx")
+    assert cache.get_cached_abi("atomictoolsx").get_action("newaction")
+    assert len(raw_abi_calls(local_node)) == 2
+
+    # the stored copy was updated too
+    restarted = AbiCache(local_node.endpoint, cache_dir=str(tmp_path))
+    assert restarted.get_cached_abi("atomictoolsx").get_action("newaction")
+    assert restarted.abi_hash("atomictoolsx") == cache.abi_hash("atomictoolsx")
+
+
+def test_background_refresh(local_node):
+    cache = AbiCache(local_node.endpoint)
+    cache.read_abi("farmersworld")
+    upgrade(local_node, "farmersworld")
+    cache.start_background_refresh(0.02)
+    try:
+        deadline = time.monotonic() + 2
+        while not cache.get_cached_abi("farmersworld").get_action("newaction"):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        cache.stop_background_refresh()
@@ -0,0 +1,21 @@
+import hashlib
+
+import pytest
+
+from antelopy.utils import ripemd160
+
+
+@pytest.mark.parametrize("size", [0, 1, 33, 55, 56, 64, 65, 200])
+def test_python_ripemd160(size):
+    data = bytes(range(256))[:size] * 2
+    try:
+        expected = hashlib.new("ripemd160", data).digest()
+    except ValueError:
+        pytest.skip("ripemd160 isn't available in hashlib")
+    assert ripemd160._ripemd160_python(data) == expected, "ripemd160 digest failed"
+
+
+def test_ripemd160_known_value():
+    assert (
+        ripemd160.ripemd160(b"abc").hex() == "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"
+    ), "ripemd160 digest failed"
@@ -1,5 +1,8 @@
 import json
 import logging
+import struct
+
+import pytest
 
 from antelopy import AbiCache
 
@@ -191,3 +194,102 @@ def test_gift_link_cancellation(abi_cache: AbiCache):
 
     serialized = abi_cache.serialize_data("atomictoolsx", "cancellink", mock)
     assert serialized == b"3a442a0000000000", "Gift link cancellation failed"
+
+
+def test_serialize_into(abi_cache: AbiCache):
+    mock = {"link_id": 2769978}
+    buf = bytearray(b"\xff" * 4)
+    end = abi_cache.serialize_into(buf, "atomictoolsx", "cancellink", mock)
+    assert end == 12 and buf == b"\xff" * 4 + bytes.fromhex("3a442a0000000000")
+    end = abi_cache.serialize_into(buf, "atomictoolsx", "cancellink", mock, offset=2)
+    assert (
+        end == 10
+        and buf == b"\xff" * 2 + bytes.fromhex("3a442a0000000000") + b"\x00" * 2
+    )
+    # overwriting part of a longer buffer keeps the bytes after the action
+    buf = bytearray(b"\xff" * 16)
+    end = abi_cache.serialize_into(buf, "atomictoolsx", "cancellink", mock, offset=4)
+    assert end == 12
+    assert buf == b"\xff" * 4 + bytes.fromhex("3a442a0000000000") + b"\xff" * 4
+    # a failed write leaves the buffer as it was
+    with pytest.raises(struct.error):
+        abi_cache.serialize_into(
+            buf, "atomictoolsx", "cancellink", {"link_id": -1}, offset=4
+        )
+    assert len(buf) == 16 and buf[4:12] == bytes.fromhex("3a442a0000000000")
+    for offset in (17, -1):
+        with pytest.raises(ValueError):
+            abi_cache.serialize_into(
+                buf, "atomictoolsx", "cancellink", mock, offset=offset
+            )
+    assert len(buf) == 16
+
+
+def test_large_vectors(abi_cache: AbiCache):
+    mock = {
+        "asset_ids": list(range(1000)),
+        "from": "stuckatsixpm",
+        "memo": "x" * 4096,
+        "to": "atomictoolsx",
+    }
+    result = abi_cache.serialize_data("atomicassets", "transfer", mock)
+    assert len(result) == 2 * (16 + 2 + 8000 + 2 + 4096)
+
+
+def test_serialize_action_bytes(abi_cache: AbiCache):
+    mock = {"link_id": 2769978}
+    serialized = abi_cache.serialize_action_bytes("atomictoolsx", "cancellink", mock)
+    assert serialized == bytes.fromhex("3a442a0000000000")
+    assert abi_cache.hexlify(serialized) == abi_cache.serialize_data(
+        "atomictoolsx", "cancellink", mock
+    )
+
+
+def test_serialize_transaction(abi_cache: AbiCache):
+    abi_cache.chain_package = "eospy"
+    trx = {
+        "expiration": "2023-11-14T22:13:20",
+        "actions": [
+            {
+                "account": "atomictoolsx",
+                "name": "cancellink",
+                "authorization": [{"actor": "stuckatsixpm", "permission": "active"}],
+                "data": {"link_id": 2769978},
+            }
+        ],
+    }
+    serialized = abi_cache.serialize(trx)
+    assert serialized.endswith(
+        bytes.fromhex(
+            "0001d071a4342327693600009c2e4685a64101206b77381b8874c600000000a8ed3232083a442a000000000000"
+        )
+    ), f"transaction serialization failed: {serialized.hex()}"
+
+
+def test_serialize_many(abi_cache: AbiCache):
+    mocks = [{"link_id": 2769978}, {"link_id": 1}]
+    expected = [b"3a442a0000000000", b"0100000000000000"]
+    assert abi_cache.serialize_many("atomictoolsx", "cancellink", mocks) == expected
+    streamed = abi_cache.serialize_many(
+        "atomictoolsx", "cancellink", iter(mocks), raw=True, stream=True
+    )
+    assert list(streamed) == [bytes.fromhex(e.decode()) for e in expected]
+
+
+def test_serialize_actions(abi_cache: AbiCache):
+    transfer = {
+        "asset_ids": ["1099903907686"],
+        "from": "stuckatsixpm",
+        "memo": "link",
+        "to": "atomictoolsx",
+    }
+    actions = [
+        {"account": "atomictoolsx", "name": "cancellink", "data": {"link_id": 1}},
+        {"account": "atomicassets", "name": "transfer", "data": transfer},
+        {"account": "atomictoolsx", "name": "cancellink", "data": {"link_id": 2}},
+    ]
+    assert abi_cache.serialize_actions(actions) == [
+        b"0100000000000000",
+        b"206b77381b8874c6d071a434232769360166b7611700010000046c696e6b",
+        b"0200000000000000",
+    ]
@@ -0,0 +1,80 @@
+import hashlib
+import hmac
+import threading
+import time
+
+import pytest
+
+from antelopy import AbiCache
+from antelopy.cache.signing import SigningStage
+
+
+class HmacSigner:
+    """Deterministic stand-in for a private key, picklable for process pools"""
+
+    def __init__(self, secret, delay=0.0):
+        self.secret = secret
+        self.delay = delay
+
+    def sign(self, digest):
+        time.sleep(self.delay)
+        return "SIG_" + hmac.new(self.secret, digest, hashlib.sha256).hexdigest()
+
+
+class CountingSigner(HmacSigner):
+    threads = set()
+
+    def sign(self, digest):
+        CountingSigner.threads.add(threading.get_ident())
+        return super().sign(digest)
+
+
+def expected(signers, digest):
+    return [HmacSigner(s.secret).sign(digest) for s in signers]
+
+
+def test_signature_order():
+    # later signers finish first
+    signers = [HmacSigner(bytes([i]), delay=0.05 - i * 0.01) for i in range(5)]
+    digest = hashlib.sha256(b"trx").digest()
+    with SigningStage(max_workers=5) as stage:
+        assert stage.sign(signers, digest) == expected(signers, digest)
+        digests = [hashlib.sha256(bytes([i])).digest() for i in range(4)]
+        assert stage.sign_many(signers, digests) == [
+            expected(signers, d) for d in digests
+        ]
+
+
+def test_process_pool():
+    signers = [HmacSigner(bytes([i])) for i in range(3)]
+    digest = hashlib.sha256(b"trx").digest()
+    with SigningStage(max_workers=2, processes=True) as stage:
+        assert stage.sign(signers, digest) == expected(signers, digest)
+
+
+def test_cache_signing_stage():
+    CountingSigner.threads.clear()
+    signers = [CountingSigner(bytes([i]), delay=0.01) for i in range(4)]
+    cache = AbiCache(chain_id="00" * 32, signing_stage=SigningStage(max_workers=4))
+    digest = cache.signing_digest(b"trx")
+    try:
+        assert cache.sign_digest(signers, digest) == expected(signers, digest)
+        assert threading.get_ident() not in CountingSigner.threads
+        assert len(CountingSigner.threads) > 1
+    finally:
+        cache.signing_stage.shutdown()
+
+
+@pytest.mark.anyio
+async def test_sign_async():
+    signers = [HmacSigner(bytes([i]), delay=0.03 - i * 0.01) for i in range(3)]
+    digest = hashlib.sha256(b"trx").digest()
+    cache = AbiCache(chain_id="00" * 32)
+    assert await cache.sign_digest_async(signers, digest) == expected(signers, digest)
+    cache.signing_stage = SigningStage()
+    try:
+        assert await cache.sign_digest_async(signers, digest) == expected(
+            signers, digest
+        )
+    finally:
+        cache.signing_stage.shutdown()
@@ -0,0 +1,130 @@
+import json
+import time
+
+import anyio
+import pytest
+
+from antelopy import AbiCache
+from antelopy.cache.chain_interface import ChainInterface
+from antelopy.cache.tapos import TaposProvider
+from antelopy.types.transaction import ReferenceBlock, Transaction
+
+
+class FakeCleos:
+    def __init__(self, endpoint):
+        self.pushed = []
+        self.chain = ChainInterface(endpoint)
+
+    def get_info(self):
+        return self.chain.get_info()
+
+    def post(self, func, params, data):
+        self.pushed.append(json.loads(data))
+        return {"transaction_id": len(self.pushed)}
+
+
+def test_reference_block_from_id():
+    ref = ReferenceBlock.from_block_id("0000fffe" + "aabbccdd" + "01020304" + "00" * 20)
+    assert ref.block_num == 0xFFFE
+    assert ref.ref_block_num == 0xFFFE
+    assert ref.ref_block_prefix == 0x04030201
+
+
+def test_sign_and_push_reuses_reference(local_node, transfer_action, fake_key):
+    cache = AbiCache(
+        local_node.endpoint, chain_package="eospy", chain_id=local_node.chain_id
+    )
+    cache.read_abi_from_json("atomicassets", "tests/data/atomicassets.abi")
+    rpc = FakeCleos(local_node.endpoint)
+    for _ in range(20):
+        cache.sign_and_push(rpc, [fake_key], {"actions": [transfer_action]})
+    assert [path for path, _ in local_node.requests] == ["/v1/chain/get_info"]
+    # the reference block was read through the RPC
+    assert cache._chain is None
+    ref = ReferenceBlock.from_block_id(local_node.block_id(local_node.lib_block_num))
+    trx = cache.deserialize_transaction(rpc.pushed[-1]["packed_trx"])
+    assert (trx.ref_block_num, trx.ref_block_prefix) == (
+        ref.ref_block_num,
+        ref.ref_block_prefix,
+    )
+
+
+@pytest.mark.anyio
+async def test_async_sign_and_push_uses_rpc(local_node, transfer_action, fake_key):
+    class FakeAccount:
+        key = fake_key
+
+    class FakeJsonRpc:
+        def __init__(self):
+            self.info_calls = 0
+
+        async def get_info(self):
+            self.info_calls += 1
+            return {"last_irreversible_block_id": local_node.block_id(42)}
+
+        async def push_transaction(self, signatures, serialized_transaction):
+            return {"packed_trx": serialized_transaction}
+
+    cache = AbiCache(
+        local_node.endpoint, chain_package="aioeos", chain_id=local_node.chain_id
+    )
+    cache.read_abi_from_json("atomicassets", "tests/data/atomicassets.abi")
+    rpc = FakeJsonRpc()
+    for _ in range(3):
+        result = await cache.async_sign_and_push(
+            rpc, [FakeAccount()], Transaction(actions=[transfer_action])
+        )
+    assert rpc.info_calls == 1
+    assert cache.deserialize_transaction(result["packed_trx"]).ref_block_num == 42
+    # no connections of the cache's own were opened
+    assert cache._async_chain is None and local_node.requests == []
+
+
+def test_reference_max_age(local_node):
+    cache = AbiCache(local_node.endpoint, chain_id=local_node.chain_id)
+    cache.tapos = TaposProvider(cache.chain.get_info, max_age=0, irreversible=False)
+    assert cache.tapos.reference().block_num == local_node.head_block_num
+    local_node.head_block_num += 1
+    assert cache.tapos.reference().block_num == local_node.head_block_num
+    assert cache.tapos.fetches == 2
+
+
+def test_background_refresh(local_node):
+    cache = AbiCache(local_node.endpoint, chain_id=local_node.chain_id)
+    tapos = cache.tapos
+    tapos.start_background_refresh(0.02)
+    try:
+        deadline = time.monotonic() + 5
+        while tapos.fetches == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        local_node.lib_block_num += 10
+        while (
+            tapos.reference().block_num != local_node.lib_block_num
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        assert tapos.reference().block_num == local_node.lib_block_num
+    finally:
+        tapos.stop_background_refresh()
+
+
+@pytest.mark.anyio
+async def test_reference_async_single_fetch(local_node):
+    calls = []
+
+    async def get_info():
+        calls.append(1)
+        await anyio.sleep(0.01)
+        return {"last_irreversible_block_id": local_node.block_id(42)}
+
+    tapos = TaposProvider(get_info_async=get_info)
+    refs = []
+
+    async def worker():
+        refs.append(await tapos.reference_async())
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(50):
+            tg.start_soon(worker)
+    assert len(calls) == 1
+    assert {ref.block_num for ref in refs} == {42}
@@ -29,3 +29,24 @@ def test_sha256digest(abi_cache: AbiCache):
             "The quick brown fox jumps over the lazy dog".encode("utf-8")
         ).digest()
     ), "unhexlify wrapper failed"
+
+
+def test_signing_digest():
+    chain_id = "1064487b3cd1a897ce03ae5b6a865651747e2e152090f99c1d19d44e01aea5a4"
+    cache = AbiCache(chain_id=chain_id)
+    transactions = [b"", b"\x01\x02\x03", bytes(range(256)) * 16]
+    expected = [
+        hashlib.sha256(bytes.fromhex(chain_id) + trx + bytes(32)).digest()
+        for trx in transactions
+    ]
+    assert [cache.signing_digest(trx) for trx in transactions] == expected
+    assert cache.signing_digests(memoryview(trx) for trx in transactions) == expected
+    assert (
+        cache.signing_digest(b"\x01", b"\x02")
+        == hashlib.sha256(
+            bytes.fromhex(chain_id) + b"\x01" + hashlib.sha256(b"\x02").digest()
+        ).digest()
+    )
+    # the prefix follows the chain id
+    cache.chain_id = "00" * 32
+    assert cache.signing_digest(b"") == hashlib.sha256(bytes(64)).digest()